@@ -23,14 +23,14 @@ class DepartamentoAdmin(SimpleHistoryAdmin):
     )
 
     def soft_delete_selected(self, request, queryset):
-        for obj in queryset:
-            obj.delete()
+        rows = queryset.soft_delete(user=request.user)
+        self.message_user(request, f"{rows} registros borrados lógicamente.")
 
     soft_delete_selected.short_description = "Borrar lógicamente seleccionados"
 
     def restore_selected(self, request, queryset):
-        for obj in queryset:
-            obj.restore()
+        rows = queryset.restore(user=request.user)
+        self.message_user(request, f"{rows} registros restaurados.")
 
     restore_selected.short_description = "Restaurar seleccionados"
 
@@ -58,14 +58,14 @@ class PuestoAdmin(SimpleHistoryAdmin):
     )
 
     def soft_delete_selected(self, request, queryset):
-        for obj in queryset:
-            obj.delete()
+        rows = queryset.soft_delete(user=request.user)
+        self.message_user(request, f"{rows} registros borrados lógicamente.")
 
     soft_delete_selected.short_description = "Borrar lógicamente seleccionados"
 
     def restore_selected(self, request, queryset):
-        for obj in queryset:
-            obj.restore()
+        rows = queryset.restore(user=request.user)
+        self.message_user(request, f"{rows} registros restaurados.")
 
     restore_selected.short_description = "Restaurar seleccionados"
 
@@ -0,0 +1,116 @@
+# catalogos/cache.py
+"""
+Catálogos completos (Departamento, Puesto) en memoria del proceso.
+
+Son tablas chicas y de casi sólo lectura: cada proceso guarda un snapshot
+con todas sus filas (vivas y borradas lógicamente, para resolver nombres de
+FKs viejas) y lo recarga cuando cambia la versión compartida de los modelos
+(`core.cache`), que se incrementa al confirmar cualquier save, soft delete,
+restore u operación masiva. Validar el snapshot cuesta una lectura al cache
+compartido, no una consulta a la BD. Con un cache por proceso (LocMem) la
+versión vence a los `CACHE_LOCAL_VERSION_TTL` s, así que un cambio hecho en
+otro worker llega a más tardar entonces.
+
+La versión se lee *antes* de cargar las filas: si otra escritura confirma en
+medio, el snapshot queda con la versión vieja y se recarga en el siguiente uso.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from functools import cached_property
+
+from core.cache import models_version_token
+
+from .models import Departamento, Puesto
+
+CATALOG_MODELS = (Departamento, Puesto)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    version: str
+    # pk → instancia, en orden de id (incluye borrados lógicos)
+    departamentos: dict[int, Departamento]
+    puestos: dict[int, Puesto]
+
+    def rows(self, model) -> dict[int, Departamento | Puesto]:
+        return self.departamentos if model is Departamento else self.puestos
+
+    def alive(self, model) -> list[Departamento | Puesto]:
+        """Filas vivas en orden de id (lo que lista la API por defecto)."""
+        return [obj for obj in self.rows(model).values() if obj.deleted_at is None]
+
+    def name(self, model, pk) -> str | None:
+        obj = self.rows(model).get(pk)
+        return obj.nombre if obj is not None else None
+
+    @cached_property
+    def compact(self) -> tuple[bytes, str]:
+        """
+        JSON compacto de los catálogos vivos (para combos del front) y su ETag
+        fuerte: hash del propio contenido, así que dos procesos con los mismos
+        datos emiten el mismo ETag aunque su versión de cache difiera.
+        Se calcula una vez por snapshot.
+        """
+        payload = {
+            "departamentos": [
+                {"id": d.pk, "nombre": d.nombre, "clave": d.clave}
+                for d in self.alive(Departamento)
+            ],
+            "puestos": [
+                {
+                    "id": p.pk,
+                    "nombre": p.nombre,
+                    "clave": p.clave,
+                    "departamento_id": p.departamento_id,
+                }
+                for p in self.alive(Puesto)
+            ],
+        }
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+        return body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+_lock = threading.Lock()
+_snapshot: CatalogSnapshot | None = None
+
+
+def _load(version: str) -> CatalogSnapshot:
+    departamentos = Departamento.all_objects.order_by("id").in_bulk()
+    puestos = Puesto.all_objects.order_by("id").in_bulk()
+    for puesto in puestos.values():
+        # Relación resuelta desde el propio snapshot (sin JOIN ni consulta diferida)
+        if puesto.departamento_id in departamentos:
+            puesto.departamento = departamentos[puesto.departamento_id]
+    return CatalogSnapshot(version, departamentos, puestos)
+
+
+def get_catalogs() -> CatalogSnapshot:
+    """Snapshot vigente; lo recarga (una vez por proceso) si cambió la versión."""
+    global _snapshot
+    version = models_version_token(CATALOG_MODELS)
+    snapshot = _snapshot
+    if snapshot is not None and snapshot.version == version:
+        return snapshot
+    with _lock:
+        if _snapshot is None or _snapshot.version != version:
+            _snapshot = _load(version)
+        return _snapshot
+
+
+def catalog_name(model, pk) -> str | None:
+    """Nombre de un departamento/puesto por pk (None si no existe)."""
+    if pk is None:
+        return None
+    return get_catalogs().name(model, pk)
+
+
+def clear() -> None:
+    """Descarta el snapshot local (p. ej. entre tests)."""
+    global _snapshot
+    with _lock:
+        _snapshot = None
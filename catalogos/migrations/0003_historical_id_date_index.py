@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-18 01:10
+
+from django.db import migrations
+
+# Índices compuestos (id, history_date, history_id) de las tablas de
+# historial: sólo en la BD, los modelos históricos no declaran Meta.indexes.
+INDEXES = (
+    ("catalogos_hist_depto_id_date_idx", "catalogos_historicaldepartamento"),
+    ("catalogos_hist_puesto_id_date_idx", "catalogos_historicalpuesto"),
+)
+
+
+class Migration(migrations.Migration):
+    dependencies = (
+        ("catalogos", "0002_departamento_deleted_at_puesto_deleted_at_and_more"),
+    )
+
+    operations = (
+        migrations.RunSQL(
+            sql=f"CREATE INDEX IF NOT EXISTS {name} ON {table} (id, history_date, history_id)",
+            reverse_sql=f"DROP INDEX IF EXISTS {name}",
+        )
+        for name, table in INDEXES
+    )
@@ -1,9 +1,45 @@
 # catalogos/serializers.py
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
+from rest_framework.fields import SkipField
 
+from .cache import catalog_name
 from .models import Departamento, Puesto
 
 
+@extend_schema_field(OpenApiTypes.STR)
+class CatalogNameField(serializers.ReadOnlyField):
+    """
+    Nombre de un catálogo a partir de la FK (`source="<relación>_id"`),
+    resuelto con el cache en memoria de `catalogos.cache` en vez de un JOIN.
+    Como `ReadOnlyField(source="<relación>.nombre")`, omite la llave si la FK
+    es NULL.
+    """
+
+    def __init__(self, model, **kwargs):
+        self.catalog_model = model
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        pk = super().get_attribute(instance)
+        if pk is None:
+            raise SkipField()
+        return pk
+
+    def to_representation(self, value):
+        return catalog_name(self.catalog_model, value)
+
+    def values_accessor(self, name: str):
+        """Accessor para `core.fast_serializers.ValuesPlan` (lee sólo la FK)."""
+        return (
+            name,
+            self.source,
+            lambda value, ctx: self.to_representation(value),
+            self.source,
+        )
+
+
 class DepartamentoSerializer(serializers.ModelSerializer):
     class Meta:
         model = Departamento
@@ -20,7 +56,7 @@ class DepartamentoSerializer(serializers.ModelSerializer):
 
 
 class PuestoSerializer(serializers.ModelSerializer):
-    departamento_nombre = serializers.ReadOnlyField(source="departamento.nombre")
+    departamento_nombre = CatalogNameField(Departamento, source="departamento_id")
 
     class Meta:
         model = Puesto
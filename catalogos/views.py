@@ -2,11 +2,24 @@
 from __future__ import annotations
 
 from django.db.models import QuerySet
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema
-from rest_framework import filters, permissions, viewsets
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiExample, OpenApiResponse, extend_schema
+from rest_framework import filters, viewsets
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
 
+from core.conditional import ConditionalGetMixin
+from core.history import HistoryDiffMixin
+from core.pagination import HybridPagination
 from core.permissions import IsCatalogAdminOrReadOnly
+
+from .cache import get_catalogs
 from .models import Departamento, Puesto
 from .serializers import DepartamentoSerializer, PuestoSerializer
 
@@ -18,8 +31,9 @@ def _truthy(val: str | None) -> bool:
     return str(val).strip().lower() in {"1", "true", "t", "yes", "y"}
 
 
-class BaseCatalogoViewSet(viewsets.ModelViewSet):
-    """Base con permisos, filtros y orden por defecto."""
+class BaseCatalogoViewSet(ConditionalGetMixin, HistoryDiffMixin, viewsets.ModelViewSet):
+    """Base con permisos, filtros, orden por defecto, GET condicional e historial."""
+
     # IsCatalogAdminOrReadOnly ya exige autenticación en lecturas
     permission_classes = [IsCatalogAdminOrReadOnly]
 
@@ -29,6 +43,37 @@ class BaseCatalogoViewSet(viewsets.ModelViewSet):
         filters.OrderingFilter,
     ]
     ordering = ["id"]
+    # ?paginate=cursor activa el keyset (campo de ?ordering=, desempate por id)
+    pagination_class = HybridPagination
+    keyset_default_ordering = "id"
+
+    def serves_from_memory(self) -> bool:
+        """
+        Lista por defecto (vivos, orden por id, sólo paginación por página):
+        se arma con el snapshot en memoria de `catalogos.cache`, sin BD.
+        """
+        paginator = self.paginator
+        if self.action != "list" or paginator is None:
+            return False
+        plain = {paginator.page_query_param, paginator.page_size_query_param, "format"}
+        return not (set(self.request.query_params) - plain)
+
+    def _list_state(self, queryset, lookups):
+        if self.serves_from_memory():
+            # La versión de los catálogos cambia con cualquier escritura confirmada
+            return (get_catalogs().version,)
+        return super()._list_state(queryset, lookups)
+
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        if not self.serves_from_memory():
+            return super().list(request, *args, **kwargs)
+        rows = get_catalogs().alive(self.queryset.model)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(
+                self.get_serializer(page, many=True).data
+            )
+        return Response(self.get_serializer(rows, many=True).data)
 
 
 @extend_schema(tags=["Catálogos"])
@@ -38,13 +83,22 @@ class DepartamentoViewSet(BaseCatalogoViewSet):
     Por defecto muestra solo registros vivos (no borrados lógicamente).
     Usa `?include_deleted=1` para incluir también los borrados.
     """
+
     # Para documentación; el queryset real se construye en get_queryset
     queryset = Departamento.objects.all()
     serializer_class = DepartamentoSerializer
 
     search_fields = ["nombre", "clave"]
     filterset_fields = ["activo"]
-    ordering_fields = ["id", "nombre", "clave", "created", "updated", "created_at", "updated_at"]
+    ordering_fields = [
+        "id",
+        "nombre",
+        "clave",
+        "created",
+        "updated",
+        "created_at",
+        "updated_at",
+    ]
 
     def get_queryset(self) -> QuerySet[Departamento]:
         include_deleted = _truthy(self.request.query_params.get("include_deleted"))
@@ -59,15 +113,76 @@ class PuestoViewSet(BaseCatalogoViewSet):
     Por defecto muestra solo registros vivos (no borrados lógicamente).
     Usa `?include_deleted=1` para incluir también los borrados.
     """
+
     # Para documentación; el queryset real se construye en get_queryset
     queryset = Puesto.objects.select_related("departamento").all()
     serializer_class = PuestoSerializer
 
     search_fields = ["nombre", "clave", "departamento__nombre"]
     filterset_fields = ["activo", "departamento"]
-    ordering_fields = ["id", "nombre", "clave", "departamento", "created", "updated", "created_at", "updated_at"]
+    ordering_fields = [
+        "id",
+        "nombre",
+        "clave",
+        "departamento",
+        "created",
+        "updated",
+        "created_at",
+        "updated_at",
+    ]
+    count_cache_models = (Puesto, Departamento)
+    etag_related = ("departamento__updated_at",)
 
     def get_queryset(self) -> QuerySet[Puesto]:
         include_deleted = _truthy(self.request.query_params.get("include_deleted"))
         base = Puesto.all_objects if include_deleted else Puesto.objects
         return base.select_related("departamento").all()
+
+
+@extend_schema(
+    summary="Snapshot de catálogos",
+    description=(
+        "Departamentos y puestos vivos, sin paginar y en forma compacta (para combos "
+        "del front). Trae un ETag fuerte: con `If-None-Match` la respuesta es 304 "
+        "mientras los catálogos no cambien."
+    ),
+    responses={
+        200: OpenApiResponse(
+            response=OpenApiTypes.OBJECT,
+            examples=[
+                OpenApiExample(
+                    "Ejemplo",
+                    value={
+                        "departamentos": [
+                            {"id": 1, "nombre": "Sistemas", "clave": "SIS"}
+                        ],
+                        "puestos": [
+                            {
+                                "id": 1,
+                                "nombre": "Desarrollador",
+                                "clave": "DEV",
+                                "departamento_id": 1,
+                            }
+                        ],
+                    },
+                )
+            ],
+        ),
+        304: OpenApiResponse(description="Sin cambios"),
+    },
+    tags=["Catálogos"],
+    operation_id="catalogos_snapshot",
+)
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def catalog_snapshot(request: Request) -> HttpResponse:
+    """Ambos catálogos en una respuesta, servidos desde `catalogos.cache`."""
+    body, etag = get_catalogs().compact
+    if etag in parse_etags(request.headers.get("If-None-Match", "")):
+        response = HttpResponseNotModified()
+    else:
+        response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    response["Cache-Control"] = "private, no-cache"
+    patch_vary_headers(response, ("Authorization",))
+    return response
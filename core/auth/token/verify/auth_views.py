@@ -1,14 +1,37 @@
+# core/auth/token/verify/auth_views.py
+"""
+Endpoints de token con throttling (ruteados en rh_api/urls.py).
+
+Login: por IP (`auth`) + por username (`auth_user`) + semáforo de
+verificación de contraseña. Refresh/verify/blacklist no hashean
+contraseñas: sólo por IP (`auth_token`). Ver core.throttling.
+"""
+
 from rest_framework_simplejwt.views import (
-    TokenObtainPairView,
+    TokenBlacklistView,
     TokenRefreshView,
     TokenVerifyView,
 )
 
-class TokenObtainPairThrottledView(TokenObtainPairView):
+from core.jwt import MyTokenObtainPairView
+from core.throttling import AuthIPThrottle, LoginUsernameThrottle, PasswordGateMixin
+
+
+class TokenObtainPairThrottledView(PasswordGateMixin, MyTokenObtainPairView):
     throttle_scope = "auth"
+    throttle_classes = (AuthIPThrottle, LoginUsernameThrottle)
+
 
 class TokenRefreshThrottledView(TokenRefreshView):
-    throttle_scope = "auth"
+    throttle_scope = "auth_token"
+    throttle_classes = (AuthIPThrottle,)
+
 
 class TokenVerifyThrottledView(TokenVerifyView):
-    throttle_scope = "auth"
+    throttle_scope = "auth_token"
+    throttle_classes = (AuthIPThrottle,)
+
+
+class TokenBlacklistThrottledView(TokenBlacklistView):
+    throttle_scope = "auth_token"
+    throttle_classes = (AuthIPThrottle,)
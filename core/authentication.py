@@ -0,0 +1,79 @@
+# core/authentication.py
+"""
+Autenticación JWT sin consultas en lecturas.
+
+`ClaimsJWTAuthentication` valida el token como SimpleJWT y compara el claim
+`rv` con la versión de roles vigente (`core.roles`, cache compartido):
+
+- GET/HEAD/OPTIONS: el usuario es un `ClaimsUser` construido sólo con los
+  claims (id, username, email, staff/superuser y grupos); `in_groups()` y
+  `/api/me` responden sin tocar la BD.
+- Escrituras: se carga el `User` real (el historial y las FKs lo necesitan),
+  con los grupos ya resueltos desde el token.
+
+Tokens emitidos antes de los claims de rol siguen el camino normal de
+SimpleJWT.
+"""
+
+from __future__ import annotations
+
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from .roles import ROLE_VERSION_CLAIM, ROLES_CLAIM, get_role_version
+
+# Mismo atributo que usa core.permissions._group_names
+GROUP_NAMES_ATTR = "_group_names_cache"
+
+
+class ClaimsUser(TokenUser):
+    """Usuario de sólo lectura respaldado por los claims del token."""
+
+    def __init__(self, token) -> None:
+        super().__init__(token)
+        setattr(self, GROUP_NAMES_ATTR, set(token.get(ROLES_CLAIM, ())))
+
+    @property
+    def email(self) -> str:
+        return self.token.get("email", "")
+
+    def get_username(self) -> str:
+        return self.username
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    stale_roles_message = "Los roles del usuario cambiaron; vuelve a iniciar sesión."
+
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        token = self.get_validated_token(raw_token)
+
+        if ROLES_CLAIM not in token or ROLE_VERSION_CLAIM not in token:
+            return self.get_user(token), token  # token anterior a los claims de rol
+        try:
+            user_id = token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("El token no identifica a un usuario.")
+        if token[ROLE_VERSION_CLAIM] != get_role_version(user_id):
+            raise AuthenticationFailed(self.stale_roles_message, code="roles_changed")
+
+        if request.method in SAFE_METHODS:
+            return ClaimsUser(token), token
+        user = self.get_user(token)
+        setattr(user, GROUP_NAMES_ATTR, set(token[ROLES_CLAIM]))
+        return user, token
+
+
+class ClaimsJWTScheme(SimpleJWTScheme):
+    """Mismo esquema Bearer en OpenAPI que JWTAuthentication."""
+
+    target_class = "core.authentication.ClaimsJWTAuthentication"
@@ -0,0 +1,137 @@
+# core/blacklist.py
+"""
+Lista negra de refresh tokens (SimpleJWT) consultada desde memoria.
+
+Cada proceso guarda el conjunto de `jti` en lista negra y lo mantiene al día
+con dos versiones del cache compartido (`core.cache`):
+
+- `BlacklistedToken`: sube al confirmar cada alta en la lista negra
+  (`core.signals`). Si cambió, se leen sólo las filas nuevas (por id, con
+  un margen para transacciones que confirman fuera de orden).
+- `OutstandingToken`: la sube `prune_tokens` al borrar tokens vencidos. Si
+  cambió, el conjunto se recarga completo (y suelta lo purgado).
+
+Con un cache por proceso (LocMem) el alta hecha en otro worker no sube la
+versión local; las versiones vencen a los `CACHE_LOCAL_VERSION_TTL` s y al
+resembrarse cambian, lo que fuerza la recarga completa (check `core.W001`).
+
+Un `jti` que ya está en el conjunto es siempre positivo (sólo sale al
+vencer). Una respuesta negativa sale de memoria si las versiones no
+cambiaron o si la última sincronización tiene menos de
+`JWT_BLACKLIST_SYNC_SECONDS`; con rotación en cada refresh la lista cambia
+tan seguido como se usa, así que esa ventana es lo que ahorra consultas.
+
+La ventana no abre la puerta a reusar un refresh token: la rotación inserta
+el token en la lista negra y esa inserción (única en la BD) falla si ya
+estaba (`core.jwt.RotatingRefreshToken.blacklist`).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+
+from .cache import bump_on_commit, get_model_version
+
+# Ids por debajo del último leído que se vuelven a leer en cada sincronización
+SYNC_ID_OVERLAP = 200
+PRUNE_BATCH_SIZE = 1000
+
+_lock = threading.Lock()
+_jtis: set[str] = set()
+_seen: tuple[int, int] | None = None  # (generación, versión) sincronizadas
+_last_id = 0
+_synced_at = 0.0
+
+
+def _sync_interval() -> float:
+    return float(getattr(settings, "JWT_BLACKLIST_SYNC_SECONDS", 1.0))
+
+
+def _versions() -> tuple[int, int]:
+    return get_model_version(OutstandingToken), get_model_version(BlacklistedToken)
+
+
+def _sync(full: bool) -> None:
+    global _jtis, _last_id, _synced_at
+    rows = BlacklistedToken.objects.order_by("id")
+    if not full:
+        rows = rows.filter(id__gt=_last_id - SYNC_ID_OVERLAP)
+    fetched = list(rows.values_list("id", "token__jti"))
+    jtis = {jti for _, jti in fetched}
+    if full:
+        _jtis, _last_id = jtis, 0
+    else:
+        _jtis |= jtis
+    if fetched:
+        _last_id = max(_last_id, fetched[-1][0])
+    _synced_at = time.monotonic()
+
+
+def is_blacklisted(jti: str) -> bool:
+    global _seen
+    if jti in _jtis:
+        return True
+    versions = _versions()
+    if versions == _seen:
+        return False
+    full = _seen is None or _seen[0] != versions[0]
+    if not full and time.monotonic() - _synced_at < _sync_interval():
+        return False
+    with _lock:
+        if versions != _seen:
+            # Versiones leídas antes de la consulta: un alta posterior vuelve a sincronizar
+            _sync(full=_seen is None or _seen[0] != versions[0])
+            _seen = versions
+    return jti in _jtis
+
+
+def clear() -> None:
+    """Descarta el conjunto local (p. ej. entre tests)."""
+    global _jtis, _seen, _last_id, _synced_at
+    with _lock:
+        _jtis, _seen, _last_id, _synced_at = set(), None, 0, 0.0
+
+
+def prune_expired_tokens(
+    *, batch_size: int = PRUNE_BATCH_SIZE, dry_run: bool = False, pause: float = 0.0
+) -> tuple[int, int]:
+    """
+    Borra por lotes (transacciones cortas, en orden de id) los tokens ya
+    vencidos y su entrada en la lista negra. Devuelve `(outstanding,
+    blacklisted)` borrados (o por borrar con `dry_run`).
+    """
+    expired = OutstandingToken.objects.filter(expires_at__lt=timezone.now())
+    if dry_run:
+        return (
+            expired.count(),
+            BlacklistedToken.objects.filter(token__in=expired).count(),
+        )
+
+    outstanding = blacklisted = 0
+    last_id = 0
+    while True:
+        ids = list(
+            expired.filter(id__gt=last_id)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ids:
+            break
+        with transaction.atomic():
+            blacklisted += BlacklistedToken.objects.filter(token_id__in=ids).delete()[0]
+            outstanding += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+            # Nueva generación: los procesos recargan el conjunto completo
+            bump_on_commit(OutstandingToken)
+        last_id = ids[-1]
+        if pause:
+            time.sleep(pause)
+    return outstanding, blacklisted
@@ -0,0 +1,105 @@
+# core/cache.py
+"""
+Versiones de datos por modelo, guardadas en el cache compartido.
+
+Cualquier escritura (save/delete/soft delete/restore/operaciones masivas)
+incrementa la versión del modelo; las llaves de cache que la incluyen quedan
+invalidadas sin tener que borrarlas una por una.
+
+Con un cache por proceso (LocMem) el incremento sólo lo ve el worker que
+escribió: ahí las versiones viven `CACHE_LOCAL_VERSION_TTL` segundos y, al
+vencer, se siembran de nuevo con el reloj, lo que acota cuánto tiempo otro
+worker sirve datos viejos (ver también el check `core.W001`).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models import Max
+
+VERSION_KEY = "rh:dataver:{label}"
+
+
+def _version_key(model) -> str:
+    return VERSION_KEY.format(label=model._meta.label_lower)
+
+
+def cache_is_local() -> bool:
+    """True si el cache default no se comparte entre procesos."""
+    return isinstance(caches[DEFAULT_CACHE_ALIAS], LocMemCache)
+
+
+def version_timeout() -> int | None:
+    """TTL de versiones y llaves invalidadas por evento: sin vencimiento si el cache es compartido."""
+    if not cache_is_local():
+        return None
+    return getattr(settings, "CACHE_LOCAL_VERSION_TTL", 30)
+
+
+def _fresh_version() -> int:
+    # Cache frío/desalojado: sembrar con el reloj evita "revivir" versiones viejas
+    return time.time_ns() // 1000
+
+
+def get_model_version(model) -> int:
+    key = _version_key(model)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _fresh_version(), timeout=version_timeout())
+        version = cache.get(key) or _fresh_version()
+    return int(version)
+
+
+def bump_model_version(model) -> None:
+    key = _version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _fresh_version(), timeout=version_timeout())
+
+
+def bump_on_commit(model, using=None) -> None:
+    """Invalida las llaves versionadas del modelo cuando la transacción confirme."""
+    transaction.on_commit(lambda: bump_model_version(model), using=using)
+
+
+def models_version_token(models: Iterable) -> str:
+    """Token compacto con las versiones de varios modelos (p. ej. Empleado + catálogos)."""
+    return ".".join(str(get_model_version(m)) for m in models)
+
+
+def digest(*parts: object) -> str:
+    h = hashlib.sha1()
+    for part in parts:
+        h.update(repr(part).encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def db_version_token(models: Iterable) -> str:
+    """
+    Versión de datos leída de la BD (válida entre procesos, a diferencia de la
+    versión en cache): por modelo, MAX(updated_at) y MAX(deleted_at) de todas
+    las filas más el último `history_id` de su tabla de historial.
+    """
+    parts = []
+    for model in models:
+        fields = {f.name for f in model._meta.concrete_fields}
+        aggregates = {
+            name: Max(name) for name in ("updated_at", "deleted_at") if name in fields
+        }
+        if aggregates:
+            row = model._base_manager.aggregate(**aggregates)
+            parts.extend(row[name] for name in sorted(aggregates))
+        history_attr = getattr(model._meta, "simple_history_manager_attribute", None)
+        if history_attr:
+            history_model = getattr(model, history_attr).model
+            parts.append(history_model.objects.aggregate(hw=Max("history_id"))["hw"])
+    return digest(*parts)
@@ -0,0 +1,27 @@
+# core/checks.py
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+
+from .cache import cache_is_local, version_timeout
+
+
+@register(Tags.caches)
+def local_cache_check(app_configs, **kwargs):
+    """
+    Las invalidaciones por versión (conteos, ETags, catálogos, lista negra
+    de JWT, versión de roles) sólo llegan a todos los workers con un cache
+    compartido. Con LocMem fuera de DEBUG se avisa del retraso máximo.
+    """
+    if settings.DEBUG or not cache_is_local():
+        return []
+    return [
+        Warning(
+            "El cache 'default' es LocMem (por proceso): con varios workers, un cambio "
+            f"de datos, roles o lista negra tarda hasta {version_timeout()} s en verse "
+            "en los demás.",
+            hint="Configura un cache compartido (CACHE_BACKEND=django.core.cache.backends.redis.RedisCache).",
+            id="core.W001",
+        )
+    ]
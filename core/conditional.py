@@ -0,0 +1,136 @@
+# core/conditional.py
+"""
+GET condicional (ETag / Last-Modified / 304) para ViewSets del router.
+
+Los validadores salen de una consulta barata sobre el queryset ya filtrado,
+antes de serializar:
+
+- detalle: `updated_at`/`deleted_at` de la fila (y de `etag_related`);
+- lista: `COUNT` + `MAX(updated_at)`/`MAX(deleted_at)` (y de `etag_related`),
+  cacheado por SQL filtrado + versión de datos (`count_cache_models`). Con un
+  cache por proceso, un cambio hecho en otro worker se ve cuando vence la
+  versión (`CACHE_LOCAL_VERSION_TTL`), no a los `API_COUNT_CACHE_TIMEOUT` s.
+
+El ETag también incluye la URL completa, el Accept y el usuario, porque la
+página, `?fields=`, el formato o el rol cambian el cuerpo aunque los datos no.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+from .cache import digest, models_version_token
+
+TIMESTAMP_FIELDS = ("updated_at", "deleted_at")
+
+
+class _NotModified(Exception):
+    def __init__(self, response):
+        self.response = response
+
+
+class ConditionalGetMixin:
+    conditional_actions = ("list", "retrieve")
+    # Timestamps de relaciones que aparecen en el cuerpo (p. ej. "departamento__updated_at")
+    etag_related: tuple[str, ...] = ()
+
+    validators: tuple[str, int | None] | None = None
+
+    def _timestamp_lookups(self, queryset) -> list[str]:
+        names = {f.name for f in queryset.model._meta.concrete_fields}
+        return [name for name in TIMESTAMP_FIELDS if name in names] + list(
+            self.etag_related
+        )
+
+    def _detail_state(self, queryset, lookups):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            row = (
+                queryset.filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+                .order_by()
+                .values_list(*lookups)
+                .first()
+            )
+        except (ValueError, TypeError, ValidationError):
+            return None
+        return row
+
+    def _list_state(self, queryset, lookups):
+        # Cacheado como el COUNT de la paginación: misma SQL + misma versión de datos
+        unordered = queryset.order_by()
+        sql, params = unordered.query.sql_with_params()
+        models = getattr(self, "count_cache_models", None) or (queryset.model,)
+        key = f"rh:liststate:{queryset.model._meta.label_lower}:{models_version_token(models)}:{digest(queryset.db, sql, params, lookups)}"
+        state = cache.get(key)
+        if state is None:
+            aggregates = {f"m{i}": Max(lookup) for i, lookup in enumerate(lookups)}
+            row = unordered.aggregate(n=Count("pk"), **aggregates)
+            state = (row["n"], *(row[f"m{i}"] for i in range(len(lookups))))
+            cache.set(key, state, getattr(settings, "API_COUNT_CACHE_TIMEOUT", 300))
+        return state
+
+    def get_validators(self, request) -> tuple[str, int | None] | None:
+        """`(etag, last_modified)` del recurso, o None si no aplica (p. ej. 404)."""
+        queryset = self.filter_queryset(self.get_queryset())
+        lookups = self._timestamp_lookups(queryset)
+        if self.action == "retrieve":
+            state = self._detail_state(queryset, lookups)
+            if state is None:
+                return None
+            stamps = state
+        else:
+            state = self._list_state(queryset, lookups)
+            stamps = state[1:]
+        etag = quote_etag(
+            digest(
+                state,
+                request.get_full_path(),
+                request.get_host(),
+                request.META.get("HTTP_ACCEPT"),
+                getattr(request.user, "pk", None),
+            )
+        )
+        # Las listas pueden perder filas (borrado físico) sin mover el máximo: sólo ETag
+        last_modified = None
+        if self.action == "retrieve":
+            present = [s for s in stamps if s is not None]
+            last_modified = int(max(present).timestamp()) if present else None
+        return etag, last_modified
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.validators = None
+        if (
+            request.method in ("GET", "HEAD")
+            and self.action in self.conditional_actions
+        ):
+            self.validators = self.get_validators(request)
+            if self.validators is not None:
+                etag, last_modified = self.validators
+                response = get_conditional_response(
+                    request, etag=etag, last_modified=last_modified
+                )
+                if response is not None:
+                    raise _NotModified(response)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, _NotModified):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.validators is not None and response.status_code in (200, 304, 412):
+            etag, last_modified = self.validators
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+            # Revalidar siempre; cuerpo distinto por usuario
+            response["Cache-Control"] = "private, no-cache"
+            patch_vary_headers(response, ("Authorization",))
+        return response
@@ -0,0 +1,201 @@
+# core/fast_serializers.py
+"""
+Lectura rápida para listas: produce el mismo JSON que un ModelSerializer a
+partir de filas `.values()`, sin instanciar modelos ni recorrer
+`Field.get_attribute()` campo por campo.
+
+El plan (columnas + convertidores) se compila una vez por serializer y
+selección de campos, a partir de los propios campos DRF. Si algún campo no
+tiene equivalente directo, `ValuesPlan.for_serializer()` devuelve None y la
+vista usa el camino normal de DRF.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import fields as drf_fields
+from rest_framework import relations
+from rest_framework.settings import api_settings
+
+ISO_8601 = "iso-8601"
+
+# (nombre de salida, columna en .values(), convertidor | None, columna de "skip")
+Accessor = tuple[str, str, Callable[[Any, Any], Any] | None, str | None]
+
+# LRU acotado: la selección de campos (`?fields=` / `?exclude=`) la elige el cliente
+PLAN_CACHE_SIZE = 256
+_PLANS: OrderedDict[tuple, ValuesPlan | None] = OrderedDict()
+_plans_lock = threading.Lock()
+
+
+def _iso_date(value, ctx):
+    return value.isoformat()
+
+
+def _iso_datetime(value, ctx):
+    value = value.astimezone(ctx["tz"]).isoformat()
+    if value.endswith("+00:00"):
+        value = value[:-6] + "Z"
+    return value
+
+
+def _bound(field):
+    return lambda value, ctx: field.to_representation(value)
+
+
+def _choices_display(model_field):
+    labels = {k: str(v) for k, v in model_field.flatchoices}
+    # Como get_FOO_display(): un valor fuera de las opciones sale tal cual
+    return lambda value, ctx: labels.get(value, value)
+
+
+def _file_url(storage):
+    def convert(value, ctx):
+        if not value:
+            return None
+        url = storage.url(value)
+        request = ctx["request"]
+        return request.build_absolute_uri(url) if request is not None else url
+
+    return convert
+
+
+class ValuesPlan:
+    def __init__(self, accessors: list[Accessor]):
+        self.accessors = accessors
+        columns: list[str] = []
+        for _, column, _, skip in accessors:
+            for col in (column, skip):
+                if col and col not in columns:
+                    columns.append(col)
+        self.columns = columns
+
+    # ---- compilación ----
+    @classmethod
+    def for_serializer(cls, serializer) -> ValuesPlan | None:
+        key = (type(serializer), tuple(serializer.fields))
+        with _plans_lock:
+            if key in _PLANS:
+                _PLANS.move_to_end(key)
+                return _PLANS[key]
+        plan = cls.compile(serializer)
+        with _plans_lock:
+            _PLANS[key] = plan
+            while len(_PLANS) > PLAN_CACHE_SIZE:
+                _PLANS.popitem(last=False)
+        return plan
+
+    @classmethod
+    def compile(cls, serializer) -> ValuesPlan | None:
+        model = serializer.Meta.model
+        extra = getattr(serializer.Meta, "projection_extra", {})
+        accessors: list[Accessor] = []
+        for name, field in serializer.fields.items():
+            accessor = cls._compile_field(serializer, model, extra, name, field)
+            if accessor is None:
+                return None
+            accessors.append(accessor)
+        return cls(accessors)
+
+    @staticmethod
+    def _compile_field(serializer, model, extra, name, field) -> Accessor | None:
+        source = field.source
+        opts = model._meta
+
+        # Campos que saben leerse de una fila `.values()` (p. ej. CatalogNameField)
+        values_accessor = getattr(field, "values_accessor", None)
+        if values_accessor is not None:
+            return values_accessor(name)
+
+        if isinstance(field, drf_fields.SerializerMethodField):
+            # staticmethod `fast_<campo>(valor, request)` del serializer
+            fast = getattr(type(serializer), f"fast_{name}", None)
+            if fast is None or name not in extra:
+                return None
+            return (
+                name,
+                extra[name][0],
+                lambda value, ctx: fast(value, ctx["request"]),
+                None,
+            )
+
+        if "." in source:
+            rel, attr = source.split(".", 1)
+            if "." in attr or not isinstance(field, drf_fields.ReadOnlyField):
+                return None
+            # DRF omite la llave (SkipField) cuando la relación es NULL
+            return (name, f"{rel}__{attr}", None, rel)
+
+        if source.startswith("get_") and source.endswith("_display"):
+            model_field = opts.get_field(source[4:-8])
+            return (name, model_field.name, _choices_display(model_field), None)
+
+        if isinstance(field, relations.PrimaryKeyRelatedField):
+            return (
+                name,
+                source,
+                None if field.pk_field is None else _bound(field.pk_field),
+                None,
+            )
+
+        if isinstance(field, drf_fields.FileField):
+            if not getattr(field, "use_url", api_settings.UPLOADED_FILES_USE_URL):
+                return (name, source, lambda value, ctx: value or None, None)
+            return (name, source, _file_url(opts.get_field(source).storage), None)
+
+        if isinstance(field, drf_fields.DateTimeField):
+            fmt = getattr(field, "format", api_settings.DATETIME_FORMAT)
+            direct = (
+                fmt is not None
+                and fmt.lower() == ISO_8601
+                and settings.USE_TZ
+                and getattr(field, "timezone", None) is None
+            )
+            return (name, source, _iso_datetime if direct else _bound(field), None)
+
+        if isinstance(field, drf_fields.DateField):
+            fmt = getattr(field, "format", api_settings.DATE_FORMAT)
+            direct = fmt is not None and fmt.lower() == ISO_8601
+            return (name, source, _iso_date if direct else _bound(field), None)
+
+        if isinstance(
+            field,
+            (
+                drf_fields.CharField,
+                drf_fields.BooleanField,
+                drf_fields.IntegerField,
+                drf_fields.ChoiceField,
+                drf_fields.ReadOnlyField,
+            ),
+        ):
+            # Valores de BD ya tienen el tipo que emite DRF
+            return (name, source, None, None)
+
+        return None
+
+    # ---- ejecución ----
+    def represent(self, rows: Iterable[dict], request=None) -> list[dict]:
+        ctx = {"request": request, "tz": timezone.get_current_timezone()}
+        accessors = self.accessors
+        out = []
+        append = out.append
+        for row in rows:
+            item = {}
+            for name, column, convert, skip in accessors:
+                if skip is not None and row[skip] is None:
+                    continue
+                value = row[column]
+                if value is None:
+                    item[name] = None
+                elif convert is None:
+                    item[name] = value
+                else:
+                    item[name] = convert(value, ctx)
+            append(item)
+        return out
@@ -0,0 +1,226 @@
+# core/history.py
+"""
+Historial paginado con diffs calculados en el servidor.
+
+`HistoryDiffMixin` agrega `GET /<recurso>/{id}/history/` a un ViewSet cuyo
+modelo usa django-simple-history:
+
+- orden `history_date DESC, history_id DESC` con keyset (`?cursor=`), apoyado
+  en el índice `(id, history_date, history_id)` de la tabla de historial;
+- `?since=` / `?until=` (fecha o fecha-hora ISO) sobre `history_date`;
+- cada registro trae sólo los campos que cambiaron respecto al anterior.
+  Se lee `page_size + 1` filas en una pasada: la fila extra (más vieja) es la
+  base del diff del último registro de la página.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime
+import json
+
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
+from rest_framework import serializers
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+HISTORY_PAGE_SIZE = 50
+HISTORY_MAX_PAGE_SIZE = 200
+
+
+def parse_instant(value: str, *, end_of_day: bool = False) -> datetime.datetime:
+    """Fecha-hora ISO (o sólo fecha) → datetime aware; ValueError si no es válida."""
+    value = value.strip()
+    # Primero fecha sola: parse_datetime("2025-01-31") ya devuelve la medianoche
+    try:
+        day = parse_date(value)
+    except ValueError:
+        day = None
+    if day is not None:
+        dt = datetime.datetime.combine(
+            day, datetime.time.max if end_of_day else datetime.time.min
+        )
+    else:
+        dt = parse_datetime(value)
+        if dt is None:
+            raise ValueError(value)
+    if timezone.is_naive(dt):
+        dt = timezone.make_aware(dt)
+    return dt
+
+
+class _HistoryChangeSerializer(serializers.Serializer):
+    old = serializers.JSONField(allow_null=True)
+    new = serializers.JSONField(allow_null=True)
+
+
+class HistoryRecordSerializer(serializers.Serializer):
+    history_id = serializers.IntegerField()
+    history_date = serializers.DateTimeField()
+    history_user = serializers.CharField(allow_null=True)
+    history_type = serializers.CharField()  # '+', '~', '-'
+    changes = serializers.DictField(child=_HistoryChangeSerializer())
+
+
+class HistoryPageSerializer(serializers.Serializer):
+    next = serializers.URLField(allow_null=True)
+    results = HistoryRecordSerializer(many=True)
+
+
+class HistoryDiffMixin:
+    # Campos que cambian en cada guardado y sólo meten ruido al diff
+    history_diff_exclude: tuple[str, ...] = ("updated_at",)
+
+    invalid_history_cursor = "Cursor inválido."
+
+    # ---- cursor ----
+    @staticmethod
+    def _encode_history_cursor(row: dict) -> str:
+        payload = json.dumps(
+            {"d": row["history_date"].isoformat(), "h": row["history_id"]},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def _decode_history_cursor(self, token: str) -> tuple[datetime.datetime, int]:
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            date = parse_datetime(data["d"])
+            if date is None:
+                raise ValueError(token)
+            return date, int(data["h"])
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_history_cursor)
+
+    # ---- consulta ----
+    def _history_page_size(self, request: Request) -> int:
+        try:
+            size = int(request.query_params.get("page_size", HISTORY_PAGE_SIZE))
+        except ValueError:
+            size = HISTORY_PAGE_SIZE
+        return max(1, min(size, HISTORY_MAX_PAGE_SIZE))
+
+    def _history_range(self, request: Request):
+        bounds = {}
+        for name, end_of_day in (("since", False), ("until", True)):
+            raw = request.query_params.get(name)
+            if raw:
+                try:
+                    bounds[name] = parse_instant(raw, end_of_day=end_of_day)
+                except ValueError:
+                    raise ValidationError({name: ["Fecha inválida (ISO 8601)."]})
+        return bounds.get("since"), bounds.get("until")
+
+    def history_diff_fields(self, history_model) -> list[tuple[str, str]]:
+        """(nombre de salida, columna) de los campos rastreados que entran al diff."""
+        pk_name = history_model.instance_type._meta.pk.attname
+        return [
+            (f.name, f.attname)
+            for f in history_model.tracked_fields
+            if f.attname != pk_name and f.name not in self.history_diff_exclude
+        ]
+
+    @staticmethod
+    def diff_rows(rows: list[dict], fields: list[tuple[str, str]]) -> list[dict]:
+        """
+        `rows` en orden descendente (la última puede ser sólo la base del diff).
+        Devuelve un registro por fila salvo la última si hay base.
+        """
+        out = []
+        for current, previous in zip(rows, [*rows[1:], None]):
+            changes = {}
+            for name, column in fields:
+                new = current[column]
+                old = previous[column] if previous is not None else None
+                if previous is None and current["history_type"] != "+":
+                    # Sin base conocida: se muestra el estado completo
+                    changes[name] = {"old": None, "new": new}
+                elif previous is None or old != new:
+                    if previous is None and new in (None, ""):
+                        continue
+                    changes[name] = {"old": old, "new": new}
+            out.append(
+                {
+                    "history_id": current["history_id"],
+                    "history_date": current["history_date"],
+                    "history_user": current["history_user__username"],
+                    "history_type": current["history_type"],
+                    "changes": changes,
+                }
+            )
+        return out
+
+    @extend_schema(
+        summary="Historial de cambios",
+        description=(
+            "Registros del historial (más reciente primero) con sólo los campos que "
+            "cambiaron respecto al registro anterior. Keyset: seguir `next`."
+        ),
+        parameters=[
+            OpenApiParameter(
+                "since", OpenApiTypes.DATETIME, description="Desde (incluye)."
+            ),
+            OpenApiParameter(
+                "until", OpenApiTypes.DATETIME, description="Hasta (incluye)."
+            ),
+            OpenApiParameter(
+                "cursor", OpenApiTypes.STR, description="Token de `next`."
+            ),
+            OpenApiParameter(
+                "page_size",
+                OpenApiTypes.INT,
+                description=f"Máx. {HISTORY_MAX_PAGE_SIZE}.",
+            ),
+        ],
+        responses={200: OpenApiResponse(response=HistoryPageSerializer)},
+    )
+    @action(detail=True, methods=["get"], url_path="history")
+    def history(self, request: Request, pk: str | None = None) -> Response:
+        obj = self.get_object()
+        manager = getattr(obj, obj._meta.simple_history_manager_attribute)
+        history_model = manager.model
+        fields = self.history_diff_fields(history_model)
+        since, until = self._history_range(request)
+        page_size = self._history_page_size(request)
+
+        # `since` no filtra la consulta: la fila previa al rango es la base del diff
+        qs = manager.all()
+        if until is not None:
+            qs = qs.filter(history_date__lte=until)
+        token = request.query_params.get("cursor")
+        if token:
+            date, history_id = self._decode_history_cursor(token)
+            qs = qs.filter(
+                Q(history_date__lt=date)
+                | Q(history_date=date, history_id__lt=history_id)
+            )
+        rows = list(
+            qs.order_by("-history_date", "-history_id").values(
+                "history_id",
+                "history_date",
+                "history_type",
+                "history_user__username",
+                *(column for _, column in fields),
+            )[: page_size + 1]
+        )
+
+        in_range = [r for r in rows if since is None or r["history_date"] >= since]
+        page = in_range[:page_size]
+        records = self.diff_rows(rows[: len(page) + 1], fields)[: len(page)]
+
+        next_url = None
+        if len(in_range) > page_size:
+            url = request.build_absolute_uri()
+            next_url = replace_query_param(
+                url, "cursor", self._encode_history_cursor(page[-1])
+            )
+        return Response({"next": next_url, "results": records})
@@ -1,10 +1,49 @@
 # core/jwt.py
-from typing import Any, Dict
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from typing import Any
+
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import ValidationError
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import (
+    TokenBlacklistSerializer,
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+    TokenVerifySerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken, UntypedToken
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+from .blacklist import is_blacklisted
+from .roles import role_claims
+
+
+class CachedBlacklistRefreshToken(RefreshToken):
+    """Refresh token que consulta la lista negra en memoria (`core.blacklist`)."""
+
+    def check_blacklist(self) -> None:
+        if is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
+
+
+class RotatingRefreshToken(CachedBlacklistRefreshToken):
+    """
+    Para el refresh con rotación: si el token ya estaba en la lista negra, es
+    un reuso. La inserción en la BD es la verificación definitiva (la
+    memoria puede ir hasta `JWT_BLACKLIST_SYNC_SECONDS` atrás). El logout
+    (`CachedTokenBlacklistSerializer`) sigue siendo idempotente.
+    """
+
+    def blacklist(self):
+        blacklisted, created = super().blacklist()
+        if not created:
+            raise TokenError(_("Token is blacklisted"))
+        return blacklisted, created
+
 
 class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = CachedBlacklistRefreshToken
+
     @classmethod
     def get_token(cls, user):
         """
@@ -16,9 +55,12 @@ class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
         token["email"] = getattr(user, "email", "") or ""
         token["is_staff"] = bool(getattr(user, "is_staff", False))
         token["is_superuser"] = bool(getattr(user, "is_superuser", False))
+        # Grupos + versión de roles: lecturas sin consultar User/Group (core.authentication)
+        for claim, value in role_claims(user).items():
+            token[claim] = value
         return token
 
-    def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
         """
         OPCIONAL: agrega info del usuario en el body de la respuesta del login,
         junto con access/refresh.
@@ -35,5 +77,22 @@ class MyTokenObtainPairSerializer(TokenObtainPairSerializer):
         return data
 
 
+class CachedTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = RotatingRefreshToken
+
+
+class CachedTokenBlacklistSerializer(TokenBlacklistSerializer):
+    token_class = CachedBlacklistRefreshToken
+
+
+class CachedTokenVerifySerializer(TokenVerifySerializer):
+    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
+        token = UntypedToken(attrs["token"])
+        jti = token.get(api_settings.JTI_CLAIM)
+        if api_settings.BLACKLIST_AFTER_ROTATION and jti and is_blacklisted(jti):
+            raise ValidationError(_("Token is blacklisted"))
+        return {}
+
+
 class MyTokenObtainPairView(TokenObtainPairView):
     serializer_class = MyTokenObtainPairSerializer
@@ -0,0 +1,66 @@
+# core/management/commands/bench_middleware.py
+from __future__ import annotations
+
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import Client
+from django.test.utils import override_settings
+
+from core.middleware import LEAN_REPLACEMENTS
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide la latencia por request (en proceso, sin red) de una ruta con la "
+        "cadena de middleware completa vs. la recortada de core.middleware."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--path", default="/api/ping/", help="Ruta a medir (GET).")
+        parser.add_argument("-n", "--requests", type=int, default=2000)
+        parser.add_argument("--token", help="JWT de acceso para rutas autenticadas.")
+
+    def handle(self, *args, **opts):
+        if opts["requests"] < 1:
+            raise CommandError("--requests debe ser >= 1")
+        lean = list(settings.MIDDLEWARE)
+        inverse = {v: k for k, v in LEAN_REPLACEMENTS.items()}
+        full = [inverse.get(path, path) for path in lean]
+        if full == lean:
+            lean = [LEAN_REPLACEMENTS.get(path, path) for path in full]
+
+        headers = (
+            {"HTTP_AUTHORIZATION": f"Bearer {opts['token']}"} if opts["token"] else {}
+        )
+        results = {}
+        for label, middleware in (("completa", full), ("recortada", lean)):
+            results[label] = self._measure(
+                opts["path"], middleware, opts["requests"], headers
+            )
+
+        for label, (status, per_request) in results.items():
+            self.stdout.write(
+                f"{label:>10}: {per_request * 1e6:8.1f} µs/request (HTTP {status})"
+            )
+        saved = results["completa"][1] - results["recortada"][1]
+        pct = 100 * saved / results["completa"][1] if results["completa"][1] else 0.0
+        self.stdout.write(
+            self.style.SUCCESS(f"Ahorro: {saved * 1e6:.1f} µs/request ({pct:.1f}%)")
+        )
+
+    @staticmethod
+    def _measure(
+        path: str, middleware: list[str], n: int, headers: dict
+    ) -> tuple[int, float]:
+        # Client usa el host "testserver"
+        with override_settings(
+            MIDDLEWARE=middleware, ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]
+        ):
+            client = Client()
+            status = client.get(path, **headers).status_code  # carga la cadena
+            start = time.perf_counter()
+            for _ in range(n):
+                client.get(path, **headers)
+            return status, (time.perf_counter() - start) / n
@@ -0,0 +1,96 @@
+# core/management/commands/prune_history.py
+from __future__ import annotations
+
+from datetime import timedelta
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.retention import RETENTION_BATCH_SIZE, archive_and_prune, history_models
+
+
+class Command(BaseCommand):
+    help = (
+        "Archiva en NDJSON comprimido y borra el historial más viejo que la "
+        "ventana de retención, por lotes (reanudable, seguro con la API en línea). "
+        "Por defecto conserva el último registro de cada objeto anterior al corte."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=getattr(settings, "HISTORY_RETENTION_DAYS", 730),
+            help="Ventana de retención en días.",
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help="Modelo histórico (p. ej. empleados.HistoricalEmpleado). Repetible; default: todos.",
+        )
+        parser.add_argument(
+            "--archive-dir",
+            help="Destino de los .ndjson.gz (default HISTORY_ARCHIVE_DIR).",
+        )
+        parser.add_argument(
+            "--no-archive", action="store_true", help="Borra sin archivar."
+        )
+        parser.add_argument(
+            "--drop-baseline",
+            action="store_true",
+            help="Borra también el último registro previo al corte (sin compactar).",
+        )
+        parser.add_argument("--batch-size", type=int, default=RETENTION_BATCH_SIZE)
+        parser.add_argument(
+            "--max-batches", type=int, help="Lotes por modelo en esta corrida."
+        )
+        parser.add_argument(
+            "--pause", type=float, default=0.0, help="Pausa (s) entre lotes."
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Sólo cuenta lo que se borraría."
+        )
+
+    def handle(self, *args, **opts):
+        if opts["days"] < 1:
+            raise CommandError("--days debe ser >= 1")
+        cutoff = timezone.now() - timedelta(days=opts["days"])
+
+        if opts["models"]:
+            try:
+                targets = [apps.get_model(label) for label in opts["models"]]
+            except (LookupError, ValueError) as exc:
+                raise CommandError(str(exc))
+        else:
+            targets = history_models()
+
+        archive_dir = None
+        if not opts["no_archive"]:
+            archive_dir = Path(opts["archive_dir"] or settings.HISTORY_ARCHIVE_DIR)
+
+        for model in targets:
+            result = archive_and_prune(
+                model,
+                cutoff,
+                archive_dir,
+                keep_baseline=not opts["drop_baseline"],
+                batch_size=opts["batch_size"],
+                dry_run=opts["dry_run"],
+                max_batches=opts["max_batches"],
+                pause=opts["pause"],
+            )
+            if opts["dry_run"]:
+                self.stdout.write(
+                    f"{result.model}: {result.deleted} registros por borrar (dry-run)"
+                )
+            else:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"{result.model}: {result.deleted} borrados, "
+                        f"{result.archived} archivados en {result.files} archivos"
+                    )
+                )
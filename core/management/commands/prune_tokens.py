@@ -0,0 +1,36 @@
+# core/management/commands/prune_tokens.py
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.blacklist import PRUNE_BATCH_SIZE, prune_expired_tokens
+
+
+class Command(BaseCommand):
+    help = (
+        "Borra por lotes los refresh tokens vencidos (OutstandingToken) y su "
+        "entrada en la lista negra. Un token vencido ya no pasa la validación, "
+        "así que quitarlo de la lista negra es seguro. Pensado para cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=PRUNE_BATCH_SIZE)
+        parser.add_argument(
+            "--pause", type=float, default=0.0, help="Pausa (s) entre lotes."
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Sólo cuenta lo que se borraría."
+        )
+
+    def handle(self, *args, **opts):
+        if opts["batch_size"] < 1:
+            raise CommandError("--batch-size debe ser >= 1")
+        outstanding, blacklisted = prune_expired_tokens(
+            batch_size=opts["batch_size"], dry_run=opts["dry_run"], pause=opts["pause"]
+        )
+        verb = "Se borrarían" if opts["dry_run"] else "Borrados"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb}: {outstanding} token(s) vencido(s), {blacklisted} en lista negra."
+            )
+        )
@@ -0,0 +1,82 @@
+# core/middleware.py
+"""
+Cadena de middleware recortada para rutas de API con JWT.
+
+Las rutas en `LEAN_MIDDLEWARE_PREFIXES` (API v1, token, ping, me) no usan
+sesión, cookies CSRF, mensajes ni X-Frame-Options: la autenticación la hace
+DRF con el header `Authorization`. Estas subclases de los middleware de
+Django pasan directo al siguiente eslabón en esas rutas y se comportan igual
+que el original en todo lo demás (`/admin/`, docs, etc.).
+
+`HistoryRequestMiddleware` se queda para todas las rutas: DRF copia el
+usuario autenticado a la `HttpRequest` y simple_history lo toma de ahí para
+`history_user`.
+
+`manage.py bench_middleware` mide la diferencia por request.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.middleware.clickjacking import XFrameOptionsMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+
+DEFAULT_LEAN_PREFIXES = (
+    "/api/v1/",
+    "/api/token",
+    "/api/auth/jwt/",
+    "/api/ping",
+    "/api/me",
+)
+
+
+def is_lean_path(path: str) -> bool:
+    return path.startswith(
+        tuple(getattr(settings, "LEAN_MIDDLEWARE_PREFIXES", DEFAULT_LEAN_PREFIXES))
+    )
+
+
+class LeanAPIMixin:
+    """Salta `process_request`/`process_response` del middleware en rutas de API."""
+
+    def __call__(self, request):
+        if is_lean_path(request.path_info):
+            return self.get_response(request)
+        return super().__call__(request)
+
+
+class LeanSessionMiddleware(LeanAPIMixin, SessionMiddleware):
+    pass
+
+
+class LeanCsrfViewMiddleware(LeanAPIMixin, CsrfViewMiddleware):
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if is_lean_path(request.path_info):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class LeanAuthenticationMiddleware(LeanAPIMixin, AuthenticationMiddleware):
+    # Depende de la sesión; en API el usuario lo resuelve DRF (JWT)
+    pass
+
+
+class LeanMessageMiddleware(LeanAPIMixin, MessageMiddleware):
+    pass
+
+
+class LeanXFrameOptionsMiddleware(LeanAPIMixin, XFrameOptionsMiddleware):
+    pass
+
+
+# Middleware original → versión recortada (lo usa bench_middleware para comparar)
+LEAN_REPLACEMENTS = {
+    "django.contrib.sessions.middleware.SessionMiddleware": "core.middleware.LeanSessionMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware": "core.middleware.LeanCsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware": "core.middleware.LeanAuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware": "core.middleware.LeanMessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware": "core.middleware.LeanXFrameOptionsMiddleware",
+}
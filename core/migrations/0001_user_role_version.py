@@ -0,0 +1,33 @@
+# Generated by Django 5.2.5 on 2026-10-18 00:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = (migrations.swappable_dependency(settings.AUTH_USER_MODEL),)
+
+    operations = (
+        migrations.CreateModel(
+            name="UserRoleVersion",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("version", models.PositiveIntegerField(default=1)),
+            ],
+            options={
+                "db_table": "core_user_role_version",
+            },
+        ),
+    )
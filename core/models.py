@@ -1,10 +1,88 @@
-from django.db import models
+from django.conf import settings
+from django.db import models, transaction
+from django.dispatch import Signal
 from django.utils import timezone
 
+from .cache import bump_on_commit
+
+# Filas por UPDATE / INSERT de historial en borrado/restauración masivos
+SOFT_DELETE_BATCH_SIZE = 500
+
+# Borrado/restauración masivos (no pasan por save): por lote, ya aplicado.
+# Argumentos: sender=modelo, pks, deleted (bool), using
+soft_delete_batch = Signal()
+
+
+def _touch_fields(model) -> list[str]:
+    # Borrar/restaurar cuenta como modificación (ETag/Last-Modified, versiones)
+    names = {f.name for f in model._meta.concrete_fields}
+    return ["updated_at"] if "updated_at" in names else []
+
+
+def _history_manager(model):
+    attr = getattr(model._meta, "simple_history_manager_attribute", None)
+    return getattr(model, attr) if attr else None
+
 
 class SoftDeleteQuerySet(models.QuerySet):
     def delete(self):
-        return super().update(deleted_at=timezone.now())
+        return self.soft_delete()
+
+    def soft_delete(self, user=None, batch_size: int = SOFT_DELETE_BATCH_SIZE) -> int:
+        """
+        Borrado lógico por lotes de las filas vivas del queryset: un UPDATE y
+        un INSERT masivo de historial ("~", como `obj.delete()`) por lote.
+        """
+        return self._set_deleted_at(self.alive(), timezone.now(), user, batch_size)
+
+    def restore(self, user=None, batch_size: int = SOFT_DELETE_BATCH_SIZE) -> int:
+        """Restauración por lotes (usar desde `all_objects`: `objects` sólo ve vivos)."""
+        return self._set_deleted_at(self.dead(), None, user, batch_size)
+
+    def _set_deleted_at(self, queryset, value, user, batch_size: int) -> int:
+        """
+        Las filas se eligen y bloquean (SELECT ... FOR UPDATE, en orden de pk)
+        dentro de la transacción, y cada UPDATE vuelve a exigir el estado de
+        origen: si dos llamadas se traslapan, cada fila cambia una sola vez y
+        la señal y el historial salen sólo para las filas que cambió ésta.
+        """
+        model = self.model
+        now = timezone.now()
+        values = {"deleted_at": value, **{name: now for name in _touch_fields(model)}}
+        state = {"deleted_at__isnull": value is not None}
+        history = _history_manager(model)
+        base = model._base_manager.using(self.db)
+        rows = 0
+        with transaction.atomic(using=self.db):
+            pks = list(
+                queryset.select_for_update(of=("self",))
+                .order_by("pk")
+                .values_list("pk", flat=True)
+            )
+            for start in range(0, len(pks), batch_size):
+                # Sin bloqueo de filas (SQLite) otra llamada pudo adelantarse
+                batch = list(
+                    base.filter(pk__in=pks[start : start + batch_size], **state)
+                    .order_by("pk")
+                    .values_list("pk", flat=True)
+                )
+                if not batch:
+                    continue
+                rows += base.filter(pk__in=batch, **state).update(**values)
+                soft_delete_batch.send(
+                    model, pks=batch, deleted=value is not None, using=self.db
+                )
+                if history is not None:
+                    history.bulk_history_create(
+                        base.filter(pk__in=batch),
+                        update=True,
+                        default_user=user,
+                        default_change_reason=None,
+                        default_date=now,
+                    )
+            if rows:
+                bump_on_commit(model, using=self.db)
+        return rows
 
     def hard_delete(self):
         return super().delete()
@@ -41,11 +119,32 @@ class SoftDeleteModel(models.Model):
     # Métodos de conveniencia
     def delete(self, using=None, keep_parents=False):
         self.deleted_at = timezone.now()
-        self.save(update_fields=["deleted_at"])
+        self.save(update_fields=["deleted_at", *_touch_fields(self)])
 
     def restore(self):
         self.deleted_at = None
-        self.save(update_fields=["deleted_at"])
+        self.save(update_fields=["deleted_at", *_touch_fields(self)])
 
     def hard_delete(self):
         super().delete()
+
+
+class UserRoleVersion(models.Model):
+    """
+    Versión de los roles de un usuario (grupos, staff/superuser, activo).
+    Va como claim en el JWT; si cambia, los tokens emitidos antes se rechazan.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="+",
+    )
+    version = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        db_table = "core_user_role_version"
+
+    def __str__(self):
+        return f"{self.user_id}: v{self.version}"
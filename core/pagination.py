@@ -0,0 +1,304 @@
+# core/pagination.py
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime
+import functools
+import json
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db import connections
+from django.db.models import F, Q, QuerySet
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .cache import digest, models_version_token
+from .models import SoftDeleteModel
+from .permissions import SCOPE_ALL, read_scope
+
+COUNT_EXACT = "exact"
+COUNT_ESTIMATED = "estimated"
+
+
+def _encode_value(value: Any) -> Any:
+    # isoformat completo: DjangoJSONEncoder recorta microsegundos y rompe el keyset
+    if isinstance(value, (datetime.date, datetime.datetime, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+def estimated_table_count(model, using: str = "default") -> int | None:
+    """`reltuples` del planner de PostgreSQL (None si no aplica o no hay ANALYZE)."""
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+            [model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    if not row or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class CountingPaginator(DjangoPaginator):
+    """Paginator de Django cuyo `count` lo resuelve una estrategia externa."""
+
+    def __init__(self, object_list, per_page, *, count_func, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self._count_func = count_func
+
+    @cached_property
+    def count(self):
+        return self._count_func(self.object_list)
+
+
+class HybridPagination(PageNumberPagination):
+    """
+    Paginación por página (default) o por keyset (opt-in).
+
+    - `?page=N`: PageNumberPagination de siempre (COUNT + OFFSET).
+    - `?paginate=cursor` (primera página) y luego `?cursor=<token>`: keyset
+      sobre la llave compuesta `(campo, id)`, sin COUNT ni OFFSET. El campo sale
+      de `?ordering=` (uno de `view.ordering_fields`, con `-` para desc) o de
+      `view.keyset_default_ordering`. Sólo avanza: la respuesta trae `next`.
+
+    Los NULL van al final en orden ascendente y al inicio en descendente, en
+    cualquier motor, para que el cursor sea determinista.
+
+    En modo página el `COUNT(*)` exacto se cachea por SQL filtrado + versión
+    de datos (`view.count_cache_models`), así que cualquier escritura en esos
+    modelos lo invalida. `?count=estimated` en listas sin filtros y con
+    alcance completo lee `pg_class.reltuples` (menos los borrados lógicos).
+    La respuesta indica `count_type`.
+    """
+
+    cursor_query_param = "cursor"
+    mode_query_param = "paginate"
+    mode_cursor_value = "cursor"
+    invalid_cursor_message = "Cursor inválido."
+    count_query_param = "count"
+    # Parámetros que no alteran el conjunto de filas (no cuentan como filtro)
+    non_filter_params = frozenset({"page", "page_size", "ordering", "count", "format"})
+
+    keyset = False
+    count_type = COUNT_EXACT
+
+    # ---- selección de modo ----
+    def is_keyset_request(self, request) -> bool:
+        params = request.query_params
+        return (
+            self.cursor_query_param in params
+            or params.get(self.mode_query_param) == self.mode_cursor_value
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.is_keyset_request(request)
+        if not self.keyset:
+            self.view = view
+            self.count_type = COUNT_EXACT
+            return super().paginate_queryset(queryset, request, view=view)
+        return self.paginate_keyset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            response = super().get_paginated_response(data)
+            response.data["count_type"] = self.count_type
+            return response
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        schema = super().get_paginated_response_schema(schema)
+        schema["properties"]["count_type"] = {
+            "type": "string",
+            "enum": [COUNT_EXACT, COUNT_ESTIMATED],
+        }
+        return schema
+
+    # ---- conteo ----
+    @property
+    def django_paginator_class(self):
+        return functools.partial(CountingPaginator, count_func=self.get_count)
+
+    def is_unfiltered(self, request) -> bool:
+        return not (set(request.query_params) - self.non_filter_params)
+
+    def get_count(self, queryset) -> int:
+        if self.request.query_params.get(
+            self.count_query_param
+        ) == COUNT_ESTIMATED and self.is_unfiltered(self.request):
+            estimate = self.estimated_count(queryset)
+            if estimate is not None:
+                self.count_type = COUNT_ESTIMATED
+                return estimate
+        return self.cached_exact_count(queryset)
+
+    def estimated_count(self, queryset) -> int | None:
+        """
+        `reltuples` de la tabla sólo si el usuario la ve completa (alcance
+        `SCOPE_ALL`); los borrados lógicos que oculta `objects` se restan con
+        su conteo exacto cacheado por versión.
+        """
+        if not isinstance(queryset, QuerySet):
+            return None
+        if read_scope(self.request.user) != SCOPE_ALL:
+            return None  # Gerente/Supervisor: filas acotadas por scope_queryset
+        model, using = queryset.model, queryset.db
+        estimate = estimated_table_count(model, using)
+        if estimate is None:
+            return None
+        if issubclass(model, SoftDeleteModel):
+            deleted = model._base_manager.using(using).filter(deleted_at__isnull=False)
+            estimate -= self.cached_exact_count(deleted)
+        return max(estimate, 0)
+
+    def cached_exact_count(self, queryset) -> int:
+        if not isinstance(queryset, QuerySet):
+            return len(queryset)
+        timeout = getattr(settings, "API_COUNT_CACHE_TIMEOUT", 300)
+        if not timeout:
+            return queryset.count()
+        unordered = queryset.order_by()
+        sql, params = unordered.query.sql_with_params()
+        models = getattr(self.view, "count_cache_models", None) or (queryset.model,)
+        key = f"rh:count:{queryset.model._meta.label_lower}:{models_version_token(models)}:{digest(queryset.db, sql, params)}"
+        count = cache.get(key)
+        if count is None:
+            count = unordered.count()
+            cache.set(key, count, timeout)
+        return count
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    # ---- keyset ----
+    def get_keyset_ordering(self, request, view, model) -> str:
+        """Devuelve `campo` o `-campo` validado contra `view.ordering_fields`."""
+        default = getattr(view, "keyset_default_ordering", "id")
+        param = getattr(view, "ordering_param", api_settings.ORDERING_PARAM)
+        raw = (request.query_params.get(param) or "").split(",")[0].strip()
+        return raw if self.is_valid_ordering(raw, view, model) else default
+
+    @staticmethod
+    def is_valid_ordering(ordering: str, view, model) -> bool:
+        name = ordering.lstrip("-")
+        allowed = set(getattr(view, "ordering_fields", None) or ()) | {"id"}
+        if not name or name not in allowed:
+            return False
+        try:
+            model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return False
+        return True
+
+    def paginate_keyset(self, queryset: QuerySet, request, view):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        model = queryset.model
+
+        token = request.query_params.get(self.cursor_query_param)
+        if token:
+            ordering, value, last_id = self.decode_cursor(token)
+            if not self.is_valid_ordering(ordering, view, model):
+                raise NotFound(self.invalid_cursor_message)
+        else:
+            ordering, value, last_id = (
+                self.get_keyset_ordering(request, view, model),
+                None,
+                None,
+            )
+
+        desc = ordering.startswith("-")
+        field = model._meta.get_field(ordering.lstrip("-"))
+        attname = field.attname
+
+        queryset = queryset.order_by(*self.keyset_order(attname, desc))
+        if token:
+            try:
+                value = None if value is None else field.to_python(value)
+            except ValidationError:
+                raise NotFound(self.invalid_cursor_message)
+            queryset = queryset.filter(
+                self.keyset_filter(attname, desc, value, last_id)
+            )
+
+        rows = list(queryset[: self.page_size + 1])
+        page, extra = rows[: self.page_size], rows[self.page_size :]
+        self.next_cursor = None
+        if extra and page:
+            last = page[-1]
+            self.next_cursor = self.encode_cursor(
+                ordering, self._row_value(last, field), self._row_value(last, "id")
+            )
+        return page
+
+    @staticmethod
+    def keyset_order(attname: str, desc: bool) -> list:
+        if attname == "id":
+            return ["-id" if desc else "id"]
+        if desc:
+            return [F(attname).desc(nulls_first=True), "-id"]
+        return [F(attname).asc(nulls_last=True), "id"]
+
+    @staticmethod
+    def keyset_filter(attname: str, desc: bool, value, last_id) -> Q:
+        """Condición "estrictamente después de (value, last_id)"."""
+        if attname == "id":
+            return Q(id__lt=last_id) if desc else Q(id__gt=last_id)
+        op = "lt" if desc else "gt"
+        if value is None:
+            # NULLs: al final (asc) o al inicio (desc)
+            cond = Q(**{f"{attname}__isnull": True, f"id__{op}": last_id})
+            if desc:
+                cond |= Q(**{f"{attname}__isnull": False})
+            return cond
+        cond = Q(**{f"{attname}__{op}": value}) | Q(
+            **{attname: value, f"id__{op}": last_id}
+        )
+        if not desc:
+            cond |= Q(**{f"{attname}__isnull": True})
+        return cond
+
+    @staticmethod
+    def _row_value(row, field):
+        # Soporta instancias y filas de .values()
+        if isinstance(field, str):
+            return row[field] if isinstance(row, dict) else getattr(row, field)
+        if isinstance(row, dict):
+            return row[field.attname] if field.attname in row else row[field.name]
+        return getattr(row, field.attname)
+
+    # ---- token ----
+    def encode_cursor(self, ordering: str, value, last_id) -> str:
+        payload = json.dumps(
+            {"o": ordering, "v": _encode_value(value), "id": last_id},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, token: str):
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return str(data["o"]), data["v"], int(data["id"])
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
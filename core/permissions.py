@@ -1,7 +1,8 @@
 # core/permissions.py
 from __future__ import annotations
 
-from typing import Iterable, Set
+from collections.abc import Iterable
+from functools import cache
 
 from django.contrib.auth.models import AbstractBaseUser, AnonymousUser
 from rest_framework.permissions import SAFE_METHODS, BasePermission
@@ -24,13 +25,14 @@ ALIAS_PAIRS = {
     "RH_EDITOR": GROUP_RRHH,
 }
 
+
 # ──────────────────────────────────────────────────────────────────────────────
-def _with_aliases(names: Iterable[str]) -> Set[str]:
+def _with_aliases(names: Iterable[str]) -> set[str]:
     """
     Devuelve el conjunto de nombres + sus alias (en ambos sentidos).
     Si pasas 'RH_ADMIN', incluye también 'Admin', y viceversa.
     """
-    expanded: Set[str] = set(names)
+    expanded: set[str] = set(names)
     for n in list(expanded):
         # Directo: clave -> valor
         if n in ALIAS_PAIRS:
@@ -42,7 +44,13 @@ def _with_aliases(names: Iterable[str]) -> Set[str]:
     return expanded
 
 
-def _group_names(user: AbstractBaseUser) -> Set[str]:
+@cache
+def _expanded(names: tuple[str, ...]) -> frozenset[str]:
+    """`_with_aliases` memoizado: las combinaciones de `in_groups` son fijas en el código."""
+    return frozenset(_with_aliases(names))
+
+
+def _group_names(user: AbstractBaseUser) -> set[str]:
     """
     Devuelve los nombres de grupos del usuario con caché simple en el objeto.
     Evita hits repetidos a la BD dentro del mismo request.
@@ -64,15 +72,64 @@ def in_groups(user: AbstractBaseUser | AnonymousUser, *names: str) -> bool:
         return False
     if getattr(user, "is_superuser", False):
         return True
-    target = _with_aliases(names)
-    return bool(_group_names(user).intersection(target))
+    return not _expanded(names).isdisjoint(_group_names(user))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Alcance de lectura por rol (filas de Empleado que puede ver)
+SCOPE_ALL = "all"
+SCOPE_DEPARTAMENTO = "departamento"  # empleados de su propio departamento
+SCOPE_PUESTO = "puesto"  # empleados con su mismo puesto
+
+# De más amplio a más estrecho; con varios roles gana el más amplio
+SCOPE_ORDER = (SCOPE_ALL, SCOPE_DEPARTAMENTO, SCOPE_PUESTO)
+
+ROLE_SCOPES = {
+    GROUP_SUPERADMIN: SCOPE_ALL,
+    GROUP_ADMIN: SCOPE_ALL,
+    GROUP_RRHH: SCOPE_ALL,
+    GROUP_GERENTE: SCOPE_DEPARTAMENTO,
+    GROUP_SUPERVISOR: SCOPE_PUESTO,
+}
+
+# Tabla compilada al importar: nombre de grupo (o alias) → rango en SCOPE_ORDER
+_SCOPE_RANK_BY_GROUP = {
+    name: SCOPE_ORDER.index(scope)
+    for role, scope in ROLE_SCOPES.items()
+    for name in _with_aliases([role])
+}
+
+
+def read_scope(user: AbstractBaseUser | AnonymousUser) -> str:
+    """
+    Alcance de lectura del usuario según `ROLE_SCOPES`. Un usuario sin
+    ningún rol de la tabla conserva el acceso de lectura completo.
+    """
+    cache_attr = "_read_scope_cache"
+    scope = getattr(user, cache_attr, None)
+    if scope is not None:
+        return scope
+    if (
+        not user
+        or isinstance(user, AnonymousUser)
+        or getattr(user, "is_superuser", False)
+    ):
+        return SCOPE_ALL
+    ranks = [
+        _SCOPE_RANK_BY_GROUP[n] for n in _group_names(user) if n in _SCOPE_RANK_BY_GROUP
+    ]
+    scope = SCOPE_ORDER[min(ranks)] if ranks else SCOPE_ALL
+    setattr(user, cache_attr, scope)
+    return scope
 
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Permisos base y compuestos
 
+
 class IsReadOnly(BasePermission):
     """Permite sólo métodos de lectura (GET/HEAD/OPTIONS)."""
+
     def has_permission(self, request: Request, view) -> bool:
         return request.method in SAFE_METHODS
 
@@ -83,6 +140,7 @@ class _BaseRBAC(BasePermission):
     - Lectura: requiere autenticación (SAFE_METHODS).
     - Escritura: la decide `can_write()` con base en `write_groups`.
     """
+
     write_groups: tuple[str, ...] = ()
 
     def has_permission(self, request: Request, view) -> bool:  # type: ignore[override]
@@ -107,6 +165,7 @@ class IsCatalogAdminOrReadOnly(_BaseRBAC):
       - Escritura: sólo Admin (o superuser).
     *Si quieres que RRHH también edite, añade GROUP_RRHH a write_groups.
     """
+
     write_groups = (GROUP_ADMIN,)
 
 
@@ -118,11 +177,13 @@ class IsEmpleadoEditorOrReadOnly(_BaseRBAC):
       - Escritura: RRHH o Admin (o superuser).
       - Para acciones sensibles (soft-delete/restore), combina con IsRHAdmin.
     """
+
     write_groups = (GROUP_RRHH, GROUP_ADMIN)
 
 
 class IsRHAdmin(BasePermission):
     """Sólo Admin (o superuser)."""
+
     def has_permission(self, request: Request, view) -> bool:  # type: ignore[override]
         return in_groups(request.user, GROUP_ADMIN)
 
@@ -133,28 +194,36 @@ class IsRHAdmin(BasePermission):
 # ── Atajos compuestos usados en tus ViewSets ──────────────────────────────────
 class IsRRHHOrAdmin(BasePermission):
     """SuperAdmin/Admin/RRHH."""
+
     def has_permission(self, request, view):
         return in_groups(request.user, GROUP_SUPERADMIN, GROUP_ADMIN, GROUP_RRHH)
 
 
 class IsManagerOrAbove(BasePermission):
     """SuperAdmin/Admin/RRHH/Gerente."""
+
     def has_permission(self, request, view):
-        return in_groups(request.user, GROUP_SUPERADMIN, GROUP_ADMIN, GROUP_RRHH, GROUP_GERENTE)
+        return in_groups(
+            request.user, GROUP_SUPERADMIN, GROUP_ADMIN, GROUP_RRHH, GROUP_GERENTE
+        )
 
 
 __all__ = [
-    "IsReadOnly",
+    "GROUP_ADMIN",
+    "GROUP_GERENTE",
+    "GROUP_RRHH",
+    "GROUP_SUPERADMIN",
+    "GROUP_SUPERVISOR",
+    "GROUP_USUARIO",
+    "SCOPE_ALL",
+    "SCOPE_DEPARTAMENTO",
+    "SCOPE_PUESTO",
     "IsCatalogAdminOrReadOnly",
     "IsEmpleadoEditorOrReadOnly",
+    "IsManagerOrAbove",
     "IsRHAdmin",
     "IsRRHHOrAdmin",
-    "IsManagerOrAbove",
+    "IsReadOnly",
     "in_groups",
-    "GROUP_SUPERADMIN",
-    "GROUP_ADMIN",
-    "GROUP_RRHH",
-    "GROUP_GERENTE",
-    "GROUP_SUPERVISOR",
-    "GROUP_USUARIO",
+    "read_scope",
 ]
@@ -0,0 +1,76 @@
+# core/roles.py
+"""
+Roles en el JWT: claims de grupos + versión de roles por usuario.
+
+El token lleva `roles` (nombres de grupo) y `rv` (versión de roles al
+emitirse). Cualquier cambio de grupos, staff/superuser o activo incrementa
+la versión (`core.signals`), así que un token emitido antes deja de valer.
+Comparar la versión cuesta una lectura al cache compartido; la BD sólo se
+consulta si la llave no está. Con un cache por proceso (LocMem) la llave
+vence a los `CACHE_LOCAL_VERSION_TTL` s: un cambio de roles hecho en otro
+worker se ve a más tardar entonces (check `core.W001`).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+
+from .cache import version_timeout
+from .models import UserRoleVersion
+
+ROLES_CLAIM = "roles"
+ROLE_VERSION_CLAIM = "rv"
+ROLE_VERSION_KEY = "rh:rolever:{user_id}"
+# Campos de User que cuentan como cambio de rol
+ROLE_USER_FIELDS = ("is_active", "is_staff", "is_superuser")
+
+
+def _key(user_id) -> str:
+    return ROLE_VERSION_KEY.format(user_id=user_id)
+
+
+def get_role_version(user_id) -> int:
+    """Versión vigente (0 si el usuario no tiene fila: ningún token la trae)."""
+    version = cache.get(_key(user_id))
+    if version is None:
+        version = (
+            UserRoleVersion.objects.filter(user_id=user_id)
+            .values_list("version", flat=True)
+            .first()
+            or 0
+        )
+        cache.set(_key(user_id), version, timeout=version_timeout())
+    return int(version)
+
+
+def ensure_role_version(user) -> int:
+    """Versión para un token nuevo (crea la fila la primera vez)."""
+    row, _ = UserRoleVersion.objects.get_or_create(user_id=user.pk)
+    return row.version
+
+
+def bump_role_versions(user_ids: Iterable) -> None:
+    """Invalida los tokens de esos usuarios; el cache se limpia al confirmar."""
+    user_ids = list(user_ids)
+    if user_ids and UserRoleVersion.objects.filter(user_id__in=user_ids).update(
+        version=F("version") + 1
+    ):
+        transaction.on_commit(
+            lambda: cache.delete_many([_key(uid) for uid in user_ids])
+        )
+
+
+def forget_role_version(user_id, using=None) -> None:
+    """Descarta la versión cacheada (p. ej. al borrar el usuario) al confirmar."""
+    transaction.on_commit(lambda: cache.delete(_key(user_id)), using=using)
+
+
+def role_claims(user) -> dict:
+    return {
+        ROLES_CLAIM: sorted(user.groups.values_list("name", flat=True)),
+        ROLE_VERSION_CLAIM: ensure_role_version(user),
+    }
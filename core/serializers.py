@@ -1,5 +1,83 @@
+from __future__ import annotations
+
 from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
 
 
 class PingSerializer(serializers.Serializer):
     status = serializers.CharField()
+
+
+def _split_param(value: str | None) -> set[str]:
+    return {f.strip() for f in (value or "").split(",") if f.strip()}
+
+
+class SparseFieldsetMixin:
+    """
+    `?fields=a,b` / `?exclude=c` en lecturas (GET/HEAD) para reducir el payload.
+
+    Sólo afecta al serializer raíz (o al hijo de un `many=True` raíz) y nunca
+    a escrituras, para no perder campos en la validación.
+    `Meta.projection_extra` mapea campos calculados a las columnas que leen
+    (p. ej. `{"foto_url": ("foto",)}`) para empujar la proyección al SQL.
+    """
+
+    fields_query_param = "fields"
+    exclude_query_param = "exclude"
+
+    def _is_root(self) -> bool:
+        root = self.root
+        return root is self or root is getattr(self, "parent", None)
+
+    def get_sparse_selection(self) -> tuple[set[str], set[str]]:
+        request = self.context.get("request")
+        if request is None or request.method not in SAFE_METHODS or not self._is_root():
+            return set(), set()
+        params = request.query_params
+        return (
+            _split_param(params.get(self.fields_query_param)),
+            _split_param(params.get(self.exclude_query_param)),
+        )
+
+    def get_fields(self):
+        fields = super().get_fields()
+        include, exclude = self.get_sparse_selection()
+        if not include and not exclude:
+            return fields
+        unknown = (include | exclude) - set(fields)
+        if unknown:
+            raise serializers.ValidationError(
+                {"fields": [f"Campo desconocido: {name}" for name in sorted(unknown)]}
+            )
+        keep = include or set(fields)
+        return {
+            name: f
+            for name, f in fields.items()
+            if name in keep and name not in exclude
+        }
+
+    def get_projection(self) -> tuple[set[str], set[str]]:
+        """
+        Columnas del modelo (`only()`) y relaciones (`select_related()`) que
+        necesitan los campos seleccionados.
+        """
+        model = self.Meta.model
+        extra = getattr(self.Meta, "projection_extra", {})
+        only: set[str] = {model._meta.pk.name}
+        related: set[str] = set()
+        for name, field in self.fields.items():
+            if name in extra:
+                only.update(extra[name])
+                continue
+            source = field.source
+            if source == "*":
+                continue
+            if "." in source:
+                rel, attr = source.split(".", 1)
+                related.add(rel)
+                only.add(f"{rel}__{attr.replace('.', '__')}")
+            elif source.startswith("get_") and source.endswith("_display"):
+                only.add(source[4:-8])
+            else:
+                only.add(source)
+        return only, related
@@ -0,0 +1,89 @@
+# core/signals.py
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .cache import bump_on_commit
+from .models import SoftDeleteModel
+from .roles import ROLE_USER_FIELDS, bump_role_versions, forget_role_version
+
+User = get_user_model()
+
+
+@receiver(post_save, dispatch_uid="core_softdelete_saved")
+@receiver(post_delete, dispatch_uid="core_softdelete_deleted")
+def _softdelete_model_changed(sender, using=None, **kwargs):
+    if issubclass(sender, SoftDeleteModel):
+        bump_on_commit(sender, using=using)
+
+
+# ---- Versión de roles (claims del JWT, ver core.roles) ----
+@receiver(
+    m2m_changed, sender=User.groups.through, dispatch_uid="core_roles_groups_changed"
+)
+def _user_groups_changed(sender, instance, action, reverse, pk_set=None, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        bump_role_versions([instance.pk])
+    elif action == "pre_clear":
+        bump_role_versions(instance.user_set.values_list("pk", flat=True))
+    else:
+        bump_role_versions(pk_set or ())
+
+
+@receiver(pre_save, sender=User, dispatch_uid="core_roles_user_pre_save")
+def _user_pre_save(sender, instance, update_fields=None, **kwargs):
+    instance._roles_changed = False
+    if instance._state.adding:
+        return
+    if update_fields is not None and not set(update_fields) & set(ROLE_USER_FIELDS):
+        return
+    old = User._default_manager.filter(pk=instance.pk).values(*ROLE_USER_FIELDS).first()
+    instance._roles_changed = old is not None and any(
+        old[f] != getattr(instance, f) for f in ROLE_USER_FIELDS
+    )
+
+
+@receiver(post_save, sender=User, dispatch_uid="core_roles_user_saved")
+def _user_saved(sender, instance, **kwargs):
+    if getattr(instance, "_roles_changed", False):
+        bump_role_versions([instance.pk])
+
+
+@receiver(post_delete, sender=User, dispatch_uid="core_roles_user_deleted")
+def _user_deleted(sender, instance, using=None, **kwargs):
+    # Su UserRoleVersion se borra en cascada: sin la llave, la versión leída es 0
+    forget_role_version(instance.pk, using=using)
+
+
+@receiver(pre_save, sender=Group, dispatch_uid="core_roles_group_renamed")
+@receiver(pre_delete, sender=Group, dispatch_uid="core_roles_group_deleted")
+def _group_changed(sender, instance, **kwargs):
+    # Renombrar/borrar un grupo cambia el claim `roles` de sus miembros
+    if instance.pk is None or instance._state.adding:
+        return
+    if kwargs.get("signal") is pre_save:
+        old = (
+            Group.objects.filter(pk=instance.pk).values_list("name", flat=True).first()
+        )
+        if old == instance.name:
+            return
+    bump_role_versions(instance.user_set.values_list("pk", flat=True))
+
+
+# ---- Lista negra de JWT en memoria (ver core.blacklist) ----
+@receiver(post_save, sender=BlacklistedToken, dispatch_uid="core_jwt_blacklisted")
+def _token_blacklisted(sender, created, using=None, **kwargs):
+    if created:
+        bump_on_commit(BlacklistedToken, using=using)
@@ -0,0 +1,169 @@
+# core/throttling.py
+"""
+Protección de los endpoints de token (login, refresh, verify, blacklist).
+
+- `SlidingWindowThrottle`: ventana deslizante aproximada con dos contadores
+  de ventana fija (la actual y la anterior, ponderada por lo que falta de
+  ella). Cuesta un `get_many` + un `incr` al cache compartido por request,
+  sin guardar la lista de timestamps como `SimpleRateThrottle`.
+- `AuthIPThrottle` (por IP, tasa del `throttle_scope` de la vista) y
+  `LoginUsernameThrottle` (por username del body, scope `auth_user`).
+- `PasswordGateMixin`: semáforo acotado alrededor de la verificación de
+  contraseña (PBKDF2). Si no hay lugar responde de inmediato 503 +
+  Retry-After, sin dejar el worker esperando. El límite es POR PROCESO: sólo
+  actúa con workers de varios hilos (gthread, ASGI); con workers síncronos de
+  un hilo cada proceso verifica una contraseña a la vez de todos modos y el
+  freno real son los throttles de arriba.
+
+Las tasas viven en `REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]`.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache as default_cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+from .cache import digest
+
+THROTTLE_KEY = "rh:throttle:{scope}:{ident}:{slot}"
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate: str) -> tuple[int, int]:
+    """'10/min' → (10, 60)."""
+    num, period = rate.split("/")
+    return int(num), PERIODS[period[0]]
+
+
+class SlidingWindowThrottle(BaseThrottle):
+    scope: str | None = None
+    cache = default_cache
+    timer = time.time
+
+    def get_scope(self, view) -> str | None:
+        return self.scope
+
+    def get_ident_key(self, request, view) -> str | None:
+        """Identidad a limitar (None = no aplica a este request)."""
+        raise NotImplementedError
+
+    def allow_request(self, request, view) -> bool:
+        self.wait_seconds = None
+        scope = self.get_scope(view)
+        # Se lee en cada request: `override_settings` recarga api_settings
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(scope) if scope else None
+        ident = self.get_ident_key(request, view) if rate else None
+        if ident is None:
+            return True
+
+        limit, window = parse_rate(rate)
+        now = self.timer()
+        slot = int(now // window)
+        current = THROTTLE_KEY.format(scope=scope, ident=ident, slot=slot)
+        previous = THROTTLE_KEY.format(scope=scope, ident=ident, slot=slot - 1)
+        counts = self.cache.get_many([current, previous])
+        cur, prev = counts.get(current, 0), counts.get(previous, 0)
+        elapsed = now - slot * window
+        if prev * (1 - elapsed / window) + cur >= limit:
+            self.wait_seconds = self._wait(limit, window, elapsed, cur, prev)
+            return False
+
+        if not self.cache.add(current, 1, window * 2):
+            try:
+                self.cache.incr(current)
+            except ValueError:  # expiró entre add e incr
+                self.cache.set(current, 1, window * 2)
+        return True
+
+    @staticmethod
+    def _wait(limit: int, window: int, elapsed: float, cur: int, prev: int) -> float:
+        if cur < limit and prev:
+            # La ventana anterior pesa menos con el tiempo: hasta que baje lo suficiente
+            wait = window * (1 - (limit - cur) / prev) - elapsed
+        else:
+            # Hasta la siguiente ventana, y que la actual (ya anterior) pese menos que el límite
+            wait = (window - elapsed) + window * max(0.0, 1 - limit / max(cur, 1))
+        return max(1.0, wait)  # Retry-After va en segundos enteros
+
+    def wait(self) -> float | None:
+        return self.wait_seconds
+
+
+class AuthIPThrottle(SlidingWindowThrottle):
+    """Por IP del cliente, con la tasa del `throttle_scope` de la vista."""
+
+    def get_scope(self, view) -> str | None:
+        return getattr(view, "throttle_scope", None)
+
+    def get_ident_key(self, request, view) -> str | None:
+        return self.get_ident(request)
+
+
+class LoginUsernameThrottle(SlidingWindowThrottle):
+    """Por username intentado (frena credential stuffing repartido en IPs)."""
+
+    scope = "auth_user"
+
+    def get_ident_key(self, request, view) -> str | None:
+        if request.method != "POST":
+            return None
+        try:
+            username = request.data.get(get_user_model().USERNAME_FIELD)
+        except AttributeError:  # body que no es un objeto
+            return None
+        if not isinstance(username, str) or not username.strip():
+            return None
+        return digest(username.strip().lower())
+
+
+# ---- Concurrencia de verificación de contraseñas ----
+class LoginBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = _(
+        "Demasiados inicios de sesión simultáneos; intenta de nuevo en unos segundos."
+    )
+    default_code = "login_busy"
+
+    def __init__(self, wait: float = 1) -> None:
+        super().__init__()
+        self.wait = wait  # exception_handler de DRF lo pone en Retry-After
+
+
+_gate_lock = threading.Lock()
+_gate: threading.BoundedSemaphore | None = None
+
+
+def password_gate() -> threading.BoundedSemaphore:
+    global _gate
+    if _gate is None:
+        with _gate_lock:
+            if _gate is None:
+                _gate = threading.BoundedSemaphore(
+                    getattr(settings, "LOGIN_MAX_CONCURRENT", 2)
+                )
+    return _gate
+
+
+class PasswordGateMixin:
+    """
+    Para vistas que verifican contraseña: limita cuántas lo hacen a la vez en
+    este proceso (`LOGIN_MAX_CONCURRENT`) y rechaza sin esperar el excedente.
+    """
+
+    def post(self, request, *args, **kwargs):
+        gate = password_gate()
+        if not gate.acquire(blocking=False):
+            raise LoginBusy()
+        try:
+            return super().post(request, *args, **kwargs)
+        finally:
+            gate.release()
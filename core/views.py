@@ -8,13 +8,16 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from .permissions import _group_names
 from .serializers import PingSerializer
 
 
 @extend_schema(
     summary="Health check",
     description='Devuelve `{ "status": "ok" }` para confirmar que el servicio está arriba.',
-    responses={200: OpenApiResponse(response=PingSerializer, description="Service is healthy")},
+    responses={
+        200: OpenApiResponse(response=PingSerializer, description="Service is healthy")
+    },
     examples=[OpenApiExample("OK", value={"status": "ok"})],
     tags=["Core"],
     operation_id="ping",
@@ -54,14 +57,14 @@ def ping(request: Request) -> Response:
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def me(request: Request) -> Response:
-    """Información del usuario autenticado."""
+    """Información del usuario autenticado (con token de roles, sin consultas)."""
     user = request.user
-    groups = list(user.groups.values_list("name", flat=True))
+    groups = sorted(_group_names(user))
     return Response(
         {
             "id": user.id,
             "username": user.username,
-            "email": user.email,
+            "email": getattr(user, "email", ""),
             "is_staff": user.is_staff,
             "is_superuser": user.is_superuser,
             "groups": groups,
@@ -1,7 +1,7 @@
 from django.contrib import admin
 from simple_history.admin import SimpleHistoryAdmin
 
-from .models import Empleado
+from .models import Empleado, ExportJob
 
 
 @admin.register(Empleado)
@@ -29,6 +29,8 @@ class EmpleadoAdmin(SimpleHistoryAdmin):
         "nss",
     )
     ordering = ("num_empleado",)
+    # Cuenta de acceso vinculada (alcance de Gerente/Supervisor)
+    raw_id_fields = ("usuario",)
 
     # Mostrar también registros con borrado lógico
     def get_queryset(self, request):
@@ -42,14 +44,14 @@ class EmpleadoAdmin(SimpleHistoryAdmin):
     )
 
     def soft_delete_selected(self, request, queryset):
-        for obj in queryset:
-            obj.delete()
+        rows = queryset.soft_delete(user=request.user)
+        self.message_user(request, f"{rows} empleados borrados lógicamente.")
 
     soft_delete_selected.short_description = "Borrar lógicamente seleccionados"
 
     def restore_selected(self, request, queryset):
-        for obj in queryset:
-            obj.restore()
+        rows = queryset.restore(user=request.user)
+        self.message_user(request, f"{rows} empleados restaurados.")
 
     restore_selected.short_description = "Restaurar seleccionados"
 
@@ -58,3 +60,18 @@ class EmpleadoAdmin(SimpleHistoryAdmin):
             obj.hard_delete()
 
     hard_delete_selected.short_description = "Eliminar definitivamente seleccionados"
+
+
+@admin.register(ExportJob)
+class ExportJobAdmin(admin.ModelAdmin):
+    list_display = (
+        "id",
+        "formato",
+        "status",
+        "filas",
+        "requested_by",
+        "created_at",
+        "expires_at",
+    )
+    list_filter = ("status", "formato")
+    readonly_fields = tuple(f.name for f in ExportJob._meta.fields)
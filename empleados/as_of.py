@@ -0,0 +1,53 @@
+# empleados/as_of.py
+"""
+Plantilla "tal como estaba" en un instante (`?as_of=`), reconstruida desde
+`HistoricalEmpleado`: por empleado, el último registro con
+`history_date <= as_of` (empate por `history_id`), salvo que sea un borrado
+físico ("-").
+
+- PostgreSQL: `DISTINCT ON (id)` ordenado por `(id, history_date DESC,
+  history_id DESC)`, servido por el índice `(id, history_date, history_id)`.
+- Otros motores: subconsulta correlacionada con el mismo orden.
+
+El resultado es un queryset normal del modelo histórico (mismos nombres de
+campo que Empleado), así que filtros, orden y paginación aplican encima.
+Los nombres de departamento/puesto son los actuales del catálogo.
+"""
+
+from __future__ import annotations
+
+import datetime
+
+from django.db import connections
+from django.db.models import OuterRef, QuerySet, Subquery
+
+from core.history import parse_instant
+
+from .models import Empleado
+
+AS_OF_PARAM = "as_of"
+
+
+def parse_as_of(value: str) -> datetime.datetime:
+    """Fecha-hora ISO; una fecha sola cuenta hasta el final de ese día."""
+    return parse_instant(value, end_of_day=True)
+
+
+def roster_as_of(instant: datetime.datetime, using: str = "default") -> QuerySet:
+    history = Empleado.history.model.objects.using(using)
+    candidates = history.filter(history_date__lte=instant)
+    if connections[using].vendor == "postgresql":
+        latest = (
+            candidates.order_by("id", "-history_date", "-history_id")
+            .distinct("id")
+            .values("history_id")
+        )
+        qs = history.filter(history_id__in=latest)
+    else:
+        latest = (
+            history.filter(id=OuterRef("id"), history_date__lte=instant)
+            .order_by("-history_date", "-history_id")
+            .values("history_id")[:1]
+        )
+        qs = candidates.filter(history_id=Subquery(latest))
+    return qs.exclude(history_type="-")
@@ -0,0 +1,259 @@
+# empleados/bulk.py
+"""
+Altas/cambios masivos de empleados con validación por conjuntos.
+
+Cada fila pasa por `EmpleadoBulkRowSerializer` (formato/reglas de campo, sin
+consultas). Lo que depende de la BD se resuelve por lote con pocas
+consultas: una para los cinco campos únicos y una por catálogo (FKs). Las
+escrituras usan `bulk_create`/`bulk_update` con historial masivo de
+simple_history.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from collections.abc import Sequence
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from simple_history.utils import bulk_create_with_history, bulk_update_with_history
+
+from catalogos.cache import get_catalogs
+from catalogos.models import Departamento, Puesto
+from core.cache import bump_on_commit
+
+from . import stats
+from .models import SEARCH_SOURCE_FIELDS, Empleado
+
+UNIQUE_FIELDS = ("num_empleado", "curp", "rfc", "nss", "email")
+BATCH_SIZE = 500
+# (campo del serializer, columna, modelo) de las FKs validadas por lote
+FK_FIELDS = (
+    ("departamento", "departamento_id", Departamento),
+    ("puesto", "puesto_id", Puesto),
+)
+FREED_IN_BATCH_MESSAGE = "Este valor lo deja otro empleado del mismo lote; aplícalo en una petición posterior."
+
+
+def unique_message(field: str) -> str:
+    label = Empleado._meta.get_field(field).verbose_name
+    return f"Ya existe un empleado con este {label}."
+
+
+def integrity_error_fields(exc: Exception) -> list[str]:
+    """
+    Campos únicos mencionados en un IntegrityError (PostgreSQL: `Key (curp)=…`
+    / `empleados_curp_key`; SQLite: `empleados.curp`), sin consultar la BD:
+    tras el error la transacción de PostgreSQL ya no admite consultas.
+    """
+    message = str(exc)
+    return [
+        f
+        for f in UNIQUE_FIELDS
+        if re.search(rf"\({f}\)|\.{f}\b|_{f}_(key|\w*uniq)", message)
+    ]
+
+
+def unique_conflicts(
+    rows: Sequence[tuple[Any, dict]], fields: Sequence[str] = UNIQUE_FIELDS
+) -> list[dict[str, str]]:
+    """
+    Para cada `(pk | None, valores)` devuelve `{campo: mensaje}` con los
+    únicos que ya ocupa otro empleado (incluye borrados lógicos: la
+    restricción es de la BD) o que se repiten dentro de `rows`.
+
+    Un valor que su dueño suelta en el mismo lote (intercambios, cadenas)
+    también se rechaza: las restricciones únicas de PostgreSQL no son
+    diferibles y se revisan fila por fila dentro del UPDATE, así que el
+    resultado dependería del orden físico. Se aplica en una petición
+    posterior. Una consulta por cada BATCH_SIZE valores por campo.
+    """
+    wanted: dict[str, set] = {f: set() for f in fields}
+    for _, values in rows:
+        for f in fields:
+            if values.get(f) not in (None, ""):
+                wanted[f].add(values[f])
+
+    holders: dict[str, dict] = {f: {} for f in fields}
+    pending = {f: list(vals) for f, vals in wanted.items() if vals}
+    while pending:
+        q = Q()
+        for f in list(pending):
+            chunk, pending[f] = pending[f][:BATCH_SIZE], pending[f][BATCH_SIZE:]
+            q |= Q(**{f"{f}__in": chunk})
+            if not pending[f]:
+                del pending[f]
+        for row in Empleado.all_objects.filter(q).values("pk", *fields):
+            for f in fields:
+                holders[f][row[f]] = row["pk"]
+
+    batch = {pk: values for pk, values in rows if pk is not None}
+    seen: dict[str, set] = {f: set() for f in fields}
+    errors: list[dict[str, str]] = []
+    for pk, values in rows:
+        row_errors: dict[str, str] = {}
+        for f in fields:
+            value = values.get(f)
+            if value in (None, ""):
+                continue
+            holder = holders[f].get(value)
+            if holder is not None and holder != pk:
+                freed = f in batch.get(holder, {}) and batch[holder][f] != value
+                row_errors[f] = FREED_IN_BATCH_MESSAGE if freed else unique_message(f)
+            elif value in seen[f]:
+                row_errors[f] = "Valor repetido dentro del lote."
+            else:
+                seen[f].add(value)
+        errors.append(row_errors)
+    return errors
+
+
+def fetch_catalogs(rows: Sequence[dict]) -> dict[str, dict]:
+    """
+    `{columna: {pk: objeto}}` de los catálogos vivos referidos por las filas,
+    desde el cache en memoria (sin consultas).
+    """
+    catalogs = get_catalogs()
+    found = {}
+    for _, column, model in FK_FIELDS:
+        rows_by_pk = catalogs.rows(model)
+        ids = {row[column] for row in rows if row.get(column) is not None}
+        found[column] = {
+            pk: rows_by_pk[pk]
+            for pk in ids
+            if pk in rows_by_pk and rows_by_pk[pk].deleted_at is None
+        }
+    return found
+
+
+def fk_errors(values: dict, catalogs: dict[str, dict]) -> dict[str, str]:
+    errors = {}
+    for name, column, _ in FK_FIELDS:
+        pk = values.get(column)
+        if pk is not None and pk not in catalogs[column]:
+            errors[name] = f'Clave primaria "{pk}" inválida - objeto no existe.'
+    return errors
+
+
+def _attach_catalogs(obj: Empleado, catalogs: dict[str, dict]) -> None:
+    # Evita un SELECT por fila al construir `search_text`
+    for name, column, _ in FK_FIELDS:
+        pk = getattr(obj, column)
+        if pk is not None and pk in catalogs[column]:
+            setattr(obj, name, catalogs[column][pk])
+
+
+def create_empleados(
+    rows: Sequence[dict], catalogs: dict[str, dict], user=None
+) -> list[Empleado]:
+    """INSERT masivo + historial masivo de filas ya validadas."""
+    objs = []
+    for values in rows:
+        obj = Empleado(**values)
+        _attach_catalogs(obj, catalogs)
+        obj.search_text = obj.build_search_text()
+        objs.append(obj)
+    with transaction.atomic():
+        created = bulk_create_with_history(
+            objs, Empleado, batch_size=BATCH_SIZE, default_user=_user(user)
+        )
+        stats.add_rows(created)  # bulk_create no emite señales
+        bump_on_commit(Empleado)
+    return created
+
+
+def update_empleados(
+    objs: Sequence[Empleado],
+    changes: Sequence[dict],
+    catalogs: dict[str, dict],
+    user=None,
+) -> list[Empleado]:
+    """UPDATE masivo (sólo las columnas tocadas) + historial masivo."""
+    fields: set[str] = set()
+    now = timezone.now()
+    deltas: Counter = Counter()
+    for obj, values in zip(objs, changes):
+        old_key = stats.stat_key(obj)
+        for attr, value in values.items():
+            setattr(obj, attr, value)
+        fields.update(values)
+        _attach_catalogs(obj, catalogs)
+        obj.updated_at = now  # bulk_update no aplica auto_now
+        stats.record_change(deltas, old_key, stats.stat_key(obj))
+    if {f.removesuffix("_id") for f in fields} & SEARCH_SOURCE_FIELDS:
+        for obj in objs:
+            obj.search_text = obj.build_search_text()
+        fields.add("search_text")
+    fields.add("updated_at")
+    with transaction.atomic():
+        bulk_update_with_history(
+            objs,
+            Empleado,
+            sorted(fields),
+            batch_size=BATCH_SIZE,
+            default_user=_user(user),
+        )
+        stats.apply_deltas(deltas)
+        bump_on_commit(Empleado)
+    return list(objs)
+
+
+def validate_batch(
+    raw_rows: Sequence[Any], instances: dict[int, Empleado] | None = None
+) -> tuple[list[tuple[int, Empleado | None, dict]], dict[int, dict], dict[str, dict]]:
+    """
+    Valida un lote completo. Con `instances` (pk → Empleado) es una
+    actualización parcial y cada fila debe traer `id`.
+
+    Devuelve `(válidas, errores, catálogos)`: válidas = `[(índice, instancia,
+    valores)]`, errores = `{índice: {campo: [mensajes]}}`.
+    """
+    # Import diferido: serializers → bulk sería circular
+    from .serializers import EmpleadoBulkRowSerializer
+
+    errors: dict[int, dict] = {}
+    parsed: list[tuple[int, Empleado | None, dict]] = []
+    for index, raw in enumerate(raw_rows):
+        if not isinstance(raw, dict):
+            errors[index] = {"non_field_errors": ["Se espera un objeto."]}
+            continue
+        instance = None
+        if instances is not None:
+            instance = instances.get(_as_pk(raw.get("id")))
+            if instance is None:
+                errors[index] = {"id": ["Empleado inexistente o sin `id`."]}
+                continue
+        serializer = EmpleadoBulkRowSerializer(
+            instance, data=raw, partial=instance is not None
+        )
+        if not serializer.is_valid():
+            errors[index] = serializer.errors
+            continue
+        parsed.append((index, instance, serializer.validated_data))
+
+    conflicts = unique_conflicts(
+        [(instance.pk if instance else None, values) for _, instance, values in parsed]
+    )
+    catalogs = fetch_catalogs([values for _, _, values in parsed])
+    valid = []
+    for (index, instance, values), row_conflicts in zip(parsed, conflicts):
+        row_errors = {**row_conflicts, **fk_errors(values, catalogs)}
+        if row_errors:
+            errors[index] = {field: [msg] for field, msg in row_errors.items()}
+        else:
+            valid.append((index, instance, values))
+    return valid, errors, catalogs
+
+
+def _as_pk(value) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _user(user):
+    return user if getattr(user, "is_authenticated", False) else None
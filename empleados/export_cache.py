@@ -0,0 +1,118 @@
+# empleados/export_cache.py
+"""
+Cache en disco direccionado por contenido para exportaciones.
+
+La llave es un hash de (formato, filtros/orden normalizados, versión de datos
+de Empleado/Departamento/Puesto): si nada cambió, la misma llave apunta al
+mismo archivo y se sirve tal cual (y sirve de ETag). Los archivos viven en
+MEDIA_ROOT/EXPORT_CACHE_DIR y se desalojan por LRU (mtime = último uso)
+cuando el directorio excede EXPORT_CACHE_MAX_BYTES.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO
+
+from django.conf import settings
+
+from catalogos.models import Departamento, Puesto
+from core.cache import db_version_token
+
+from .models import Empleado
+
+logger = logging.getLogger(__name__)
+
+DATA_MODELS = (Empleado, Departamento, Puesto)
+
+
+def cache_enabled() -> bool:
+    return getattr(settings, "EXPORT_CACHE_MAX_BYTES", 0) > 0
+
+
+def cache_dir() -> Path:
+    return Path(settings.MEDIA_ROOT) / getattr(
+        settings, "EXPORT_CACHE_DIR", "exports/cache"
+    )
+
+
+def export_key(formato: str, params: dict[str, list[str]], scope=None) -> str:
+    """`scope`: alcance del usuario (`empleados.scoping.scope_token`), None si ve todo."""
+    h = hashlib.sha256()
+    h.update(
+        repr(
+            (formato, sorted(params.items()), scope, db_version_token(DATA_MODELS))
+        ).encode()
+    )
+    return h.hexdigest()
+
+
+def open_cached(key: str, formato: str) -> IO[bytes] | None:
+    """
+    Abre el archivo cacheado (None si no está). Se devuelve abierto: un
+    `evict()` concurrente puede borrarlo, pero POSIX conserva el contenido
+    mientras haya un descriptor abierto.
+    """
+    path = cache_dir() / f"{key}.{formato}"
+    try:
+        fh = path.open("rb")
+    except FileNotFoundError:
+        return None
+    try:
+        os.utime(fh.fileno())  # marca de uso para el LRU
+    except OSError:
+        pass  # sin soporte de utime por descriptor: el LRU sólo pierde precisión
+    return fh
+
+
+def store(key: str, formato: str, build: Callable[[IO[bytes]], object]) -> IO[bytes]:
+    """
+    Genera el archivo en un temporal del mismo directorio, lo publica
+    atómicamente y lo devuelve abierto (antes de desalojar otros).
+    """
+    directory = cache_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{key}.{formato}"
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            build(fh)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    fh = path.open("rb")
+    evict(keep=path)
+    return fh
+
+
+def evict(keep: Path | None = None) -> int:
+    """Borra los archivos menos usados hasta quedar dentro del presupuesto."""
+    budget = getattr(settings, "EXPORT_CACHE_MAX_BYTES", 0)
+    entries = []
+    total = 0
+    for entry in os.scandir(cache_dir()):
+        if not entry.is_file() or entry.name.endswith(".part"):
+            continue
+        st = entry.stat()
+        entries.append((st.st_mtime, st.st_size, Path(entry.path)))
+        total += st.st_size
+    removed = 0
+    for _, size, path in sorted(entries):
+        if total <= budget:
+            break
+        if keep is not None and path == keep:
+            continue
+        path.unlink(
+            missing_ok=True
+        )  # si alguien lo está enviando, POSIX lo conserva abierto
+        total -= size
+        removed += 1
+    if removed:
+        logger.info("Export cache: %s archivos desalojados", removed)
+    return removed
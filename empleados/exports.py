@@ -0,0 +1,164 @@
+# empleados/exports.py
+"""
+Exportación de empleados en memoria constante.
+
+Las filas salen de `qs.values_list(...).iterator(chunk_size=...)` (cursor del
+lado del servidor en PostgreSQL) y se escriben con openpyxl en modo
+`write_only`, que vuelca cada fila a disco en cuanto se agrega.
+"""
+
+from __future__ import annotations
+
+import csv
+import datetime
+import json
+from collections.abc import Iterator
+from typing import IO
+
+from django.db.models import Max
+from django.db.models.functions import Length
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+EXPORT_CHUNK_SIZE = 2000
+# Filas por bloque de bytes en CSV/NDJSON (menos iteraciones del servidor WSGI)
+STREAM_ROWS_PER_CHUNK = 500
+XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+CSV_CONTENT_TYPE = "text/csv; charset=utf-8"
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+# (encabezado, lookup en values_list)
+EXPORT_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("ID", "id"),
+    ("Num. empleado", "num_empleado"),
+    ("Nombres", "nombres"),
+    ("Apellido paterno", "apellido_paterno"),
+    ("Apellido materno", "apellido_materno"),
+    ("Departamento", "departamento__nombre"),
+    ("Puesto", "puesto__nombre"),
+    ("Fecha ingreso", "fecha_ingreso"),
+    ("Email", "email"),
+    ("Teléfono", "telefono"),
+    ("Activo", "activo"),
+)
+EXPORT_HEADERS = [header for header, _ in EXPORT_COLUMNS]
+EXPORT_LOOKUPS = [lookup for _, lookup in EXPORT_COLUMNS]
+# Llaves "de máquina" para CSV/NDJSON (departamento__nombre → departamento_nombre)
+EXPORT_KEYS = [lookup.replace("__", "_") for lookup in EXPORT_LOOKUPS]
+
+# Columnas de ancho conocido (fecha ISO, "Sí"/"No")
+_FIXED_WIDTHS = {"fecha_ingreso": 10, "activo": 2}
+MIN_WIDTH, MAX_WIDTH = 10, 40
+
+
+def export_values(qs, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[tuple]:
+    """Tuplas crudas en el orden de EXPORT_COLUMNS (cursor del servidor en PostgreSQL)."""
+    return qs.values_list(*EXPORT_LOOKUPS).iterator(chunk_size=chunk_size)
+
+
+def export_rows(qs, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[list]:
+    """Filas listas para escribir (None → "", activo → Sí/No), sin instanciar modelos."""
+    activo_idx = EXPORT_LOOKUPS.index("activo")
+    for values in export_values(qs, chunk_size=chunk_size):
+        row = ["" if v is None else v for v in values]
+        row[activo_idx] = "Sí" if values[activo_idx] else "No"
+        yield row
+
+
+def column_widths(qs) -> list[float]:
+    """
+    Anchos "auto" (máx. largo + 2, entre 10 y 40) resueltos con un solo
+    agregado en la BD: write_only escribe `<cols>` antes que las filas, así que
+    los anchos deben conocerse antes de empezar. Es una pasada extra
+    (`MAX(LENGTH(...))` sobre el mismo filtro) que se paga por exportación.
+    """
+    aggregates = {"w_id": Max("id")}
+    for i, lookup in enumerate(EXPORT_LOOKUPS):
+        if lookup not in _FIXED_WIDTHS and lookup != "id":
+            aggregates[f"w{i}"] = Max(Length(lookup))
+    result = qs.order_by().aggregate(**aggregates)
+
+    widths = []
+    for i, (header, lookup) in enumerate(EXPORT_COLUMNS):
+        if lookup == "id":
+            longest = len(str(result["w_id"] or ""))
+        else:
+            longest = _FIXED_WIDTHS.get(lookup) or result[f"w{i}"] or 0
+        longest = max(MIN_WIDTH, len(header), longest)
+        widths.append(min(longest + 2, MAX_WIDTH))
+    return widths
+
+
+def write_empleados_xlsx(
+    qs, fileobj: IO[bytes], chunk_size: int = EXPORT_CHUNK_SIZE
+) -> int:
+    """Escribe el XLSX en `fileobj` y devuelve el número de filas de datos."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Empleados")
+
+    for idx, width in enumerate(column_widths(qs), start=1):
+        ws.column_dimensions[get_column_letter(idx)].width = width
+    ws.freeze_panes = "A2"
+
+    bold = Font(bold=True)
+    header = []
+    for title in EXPORT_HEADERS:
+        cell = WriteOnlyCell(ws, value=title)
+        cell.font = bold
+        header.append(cell)
+    ws.append(header)
+
+    written = 0
+    for row in export_rows(qs, chunk_size=chunk_size):
+        ws.append(row)
+        written += 1
+
+    wb.save(fileobj)
+    return written
+
+
+class _Echo:
+    """Pseudo-buffer para csv.writer: devuelve la línea en vez de guardarla."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def _raw(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+def stream_csv(qs, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    buf = [writer.writerow(EXPORT_KEYS)]
+    for values in export_values(qs, chunk_size=chunk_size):
+        buf.append(writer.writerow([_raw(v) for v in values]))
+        if len(buf) >= STREAM_ROWS_PER_CHUNK:
+            yield "".join(buf)
+            buf.clear()
+    if buf:
+        yield "".join(buf)
+
+
+def stream_ndjson(qs, chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[str]:
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    buf = []
+    for values in export_values(qs, chunk_size=chunk_size):
+        row = {
+            key: v.isoformat() if isinstance(v, datetime.date) else v
+            for key, v in zip(EXPORT_KEYS, values)
+        }
+        buf.append(dumps(row) + "\n")
+        if len(buf) >= STREAM_ROWS_PER_CHUNK:
+            yield "".join(buf)
+            buf.clear()
+    if buf:
+        yield "".join(buf)
@@ -0,0 +1,262 @@
+# empleados/imports.py
+"""
+Importación masiva de empleados desde XLSX/CSV en memoria acotada.
+
+El archivo se lee como stream (openpyxl `read_only` para XLSX, `csv` para
+CSV) y se procesa en bloques de `chunk_size` filas: cada bloque se valida
+con `empleados.bulk.validate_batch` (reglas de campo + únicos/FKs por
+conjuntos) y, fuera de `dry_run`, se escribe en su propia transacción con
+historial masivo. El resultado es un reporte con los errores por fila.
+"""
+
+from __future__ import annotations
+
+import csv
+import datetime
+import io
+import unicodedata
+from collections.abc import Iterator
+from typing import IO
+
+from django.db import IntegrityError
+from openpyxl import load_workbook
+
+from . import bulk
+
+FORMAT_XLSX = "xlsx"
+FORMAT_CSV = "csv"
+FORMATS = (FORMAT_XLSX, FORMAT_CSV)
+# Errores detallados que guarda el reporte (el total siempre se cuenta)
+MAX_REPORTED_ERRORS = 1000
+CONFLICT_MESSAGE = (
+    "Conflicto de unicidad al escribir el bloque; reintente la operación."
+)
+
+IMPORT_FIELDS = (
+    "num_empleado",
+    "nombres",
+    "apellido_paterno",
+    "apellido_materno",
+    "fecha_nacimiento",
+    "genero",
+    "estado_civil",
+    "curp",
+    "rfc",
+    "nss",
+    "telefono",
+    "email",
+    "departamento",
+    "puesto",
+    "fecha_ingreso",
+    "activo",
+)
+# Encabezados alternos (ya normalizados) → campo
+HEADER_ALIASES = {
+    "num. empleado": "num_empleado",
+    "num empleado": "num_empleado",
+    "numero de empleado": "num_empleado",
+    "apellido paterno": "apellido_paterno",
+    "apellido materno": "apellido_materno",
+    "fecha nacimiento": "fecha_nacimiento",
+    "fecha de nacimiento": "fecha_nacimiento",
+    "estado civil": "estado_civil",
+    "telefono": "telefono",
+    "fecha ingreso": "fecha_ingreso",
+    "fecha de ingreso": "fecha_ingreso",
+    "departamento_id": "departamento",
+    "puesto_id": "puesto",
+}
+_BOOLEANS = {"si": True, "sí": True, "no": False}
+
+
+class UnreadableFile(ValueError):
+    """El lector no puede seguir (p.ej. CSV mal formado); `line` es la línea del archivo."""
+
+    def __init__(self, line: int, message: str) -> None:
+        super().__init__(message)
+        self.line = line
+
+
+def _normalize_header(value) -> str:
+    text = unicodedata.normalize("NFKD", str(value or "").strip().lower())
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def map_headers(headers: list) -> tuple[list[str | None], list[str]]:
+    """Campo destino por columna (None = ignorada) y encabezados ignorados."""
+    mapping: list[str | None] = []
+    ignored: list[str] = []
+    for header in headers:
+        key = _normalize_header(header)
+        field = key if key in IMPORT_FIELDS else HEADER_ALIASES.get(key)
+        if field in mapping:
+            field = None
+        mapping.append(field)
+        if field is None and key:
+            ignored.append(str(header))
+    return mapping, ignored
+
+
+def _clean(field: str, value):
+    if value is None:
+        return None
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if field == "nss" and isinstance(value, int):
+        return f"{value:011d}"  # Excel pierde los ceros a la izquierda
+    value = str(value).strip()
+    if value == "":
+        return None
+    if field == "activo":
+        return _BOOLEANS.get(value.lower(), value)
+    return value
+
+
+def _records(rows: Iterator[tuple | list], start_line: int = 2):
+    """(línea, dict de campos) a partir de la fila de encabezados + datos."""
+    try:
+        headers = list(next(rows))
+    except StopIteration:
+        return [], iter(())
+    mapping, ignored = map_headers(headers)
+
+    def generate():
+        for line, values in enumerate(rows, start=start_line):
+            record = {}
+            for field, value in zip(mapping, values):
+                if field is not None:
+                    cleaned = _clean(field, value)
+                    if cleaned is not None:
+                        record[field] = cleaned
+            if record:  # renglones vacíos no cuentan
+                yield line, record
+
+    return ignored, generate()
+
+
+def read_xlsx(fileobj: IO[bytes]):
+    wb = load_workbook(fileobj, read_only=True, data_only=True)
+
+    def rows():
+        try:
+            yield from wb.worksheets[0].iter_rows(values_only=True)
+        finally:
+            wb.close()  # read_only mantiene abierto el archivo
+
+    return _records(rows())
+
+
+def read_csv(fileobj: IO[bytes]):
+    text = io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline="")
+    reader = csv.reader(text)
+
+    def rows():
+        try:
+            yield from reader
+        except csv.Error as exc:
+            raise UnreadableFile(reader.line_num, str(exc)) from exc
+
+    return _records(rows())
+
+
+def _chunks(records, size: int):
+    chunk = []
+    for item in records:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_empleados(
+    fileobj: IO[bytes],
+    formato: str,
+    *,
+    dry_run: bool = False,
+    user=None,
+    chunk_size: int = bulk.BATCH_SIZE,
+) -> dict:
+    """
+    Procesa el archivo y devuelve el reporte:
+    `{"dry_run", "rows", "valid", "created", "error_count", "errors", "ignored_columns",
+    "unreadable", "conflict_fields"}`. Las filas con error se omiten; las válidas
+    se escriben por bloque. Si el archivo deja de poder leerse se reporta el error
+    en esa línea, `unreadable` queda en True y se detiene sin procesar el bloque en
+    curso (los anteriores ya se escribieron). Si un bloque choca con un único
+    escrito por otra petición tras validarlo, ese bloque no se escribe, sus filas
+    quedan con error y los campos van en `conflict_fields`.
+    """
+    reader = read_xlsx if formato == FORMAT_XLSX else read_csv
+    report = {
+        "dry_run": dry_run,
+        "rows": 0,
+        "valid": 0,
+        "created": 0,
+        "error_count": 0,
+        "errors": [],
+        "ignored_columns": [],
+        "unreadable": False,
+        "conflict_fields": [],
+    }
+    # Únicos aceptados en bloques previos (en dry-run no llegan a la BD)
+    seen: dict[str, set] = {f: set() for f in bulk.UNIQUE_FIELDS}
+
+    def add_error(line: int, errors: dict) -> None:
+        report["error_count"] += 1
+        if len(report["errors"]) < MAX_REPORTED_ERRORS:
+            report["errors"].append({"row": line, "errors": errors})
+
+    try:
+        ignored, records = reader(fileobj)
+        report["ignored_columns"] = ignored
+        for chunk in _chunks(records, chunk_size):
+            report["rows"] += len(chunk)
+            valid, errors, catalogs = bulk.validate_batch(
+                [record for _, record in chunk]
+            )
+            accepted = []  # (línea, valores)
+            for index, _, values in valid:
+                repeated = {
+                    f: ["Valor repetido en el archivo."]
+                    for f in seen
+                    if values.get(f) in seen[f]
+                }
+                if repeated:
+                    errors[index] = repeated
+                    continue
+                for f, values_seen in seen.items():
+                    if values.get(f):
+                        values_seen.add(values[f])
+                accepted.append((chunk[index][0], values))
+            for index in sorted(errors):
+                add_error(chunk[index][0], errors[index])
+
+            report["valid"] += len(accepted)
+            if accepted and not dry_run:
+                try:
+                    created = bulk.create_empleados(
+                        [values for _, values in accepted], catalogs, user
+                    )
+                except IntegrityError as exc:
+                    # Carrera con otra escritura entre la validación y el INSERT
+                    fields = bulk.integrity_error_fields(exc)
+                    if not fields:
+                        raise
+                    report["valid"] -= len(accepted)
+                    for f in fields:
+                        if f not in report["conflict_fields"]:
+                            report["conflict_fields"].append(f)
+                    for line, _ in accepted:
+                        add_error(line, {f: [CONFLICT_MESSAGE] for f in fields})
+                    continue
+                report["created"] += len(created)
+    except UnreadableFile as exc:
+        add_error(exc.line, {"archivo": [f"No se pudo leer la línea: {exc}"]})
+        report["unreadable"] = True
+    return report
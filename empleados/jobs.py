@@ -0,0 +1,160 @@
+# empleados/jobs.py
+"""
+Exportaciones asíncronas sin broker externo.
+
+La API crea un `ExportJob` (pendiente) y responde de inmediato; el worker
+`manage.py run_export_jobs` los reclama con un UPDATE condicional (seguro con
+varios workers), genera el archivo bajo MEDIA_ROOT y lo marca como terminado
+con fecha de expiración. Pedidos idénticos y cercanos reutilizan el mismo job.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.utils import timezone
+
+from core.cache import digest
+
+from .exports import write_empleados_xlsx
+from .models import ExportJob
+
+logger = logging.getLogger(__name__)
+
+# Parámetros que no cambian el contenido exportado
+IGNORED_PARAMS = {
+    "page",
+    "page_size",
+    "cursor",
+    "paginate",
+    "fields",
+    "exclude",
+    "count",
+    "format",
+}
+
+
+def _setting(name: str, default):
+    return getattr(settings, name, default)
+
+
+def normalize_params(query_params) -> dict[str, list[str]]:
+    """QueryDict → dict ordenado {param: [valores]} sin parámetros irrelevantes."""
+    return {
+        key: sorted(values)
+        for key, values in sorted(query_params.lists())
+        if key not in IGNORED_PARAMS and any(v != "" for v in values)
+    }
+
+
+def job_path(job: ExportJob) -> Path:
+    return Path(settings.MEDIA_ROOT) / job.archivo
+
+
+def enqueue_export(
+    params: dict[str, list[str]], user, formato: str = ExportJob.FORMAT_XLSX
+):
+    """Devuelve `(job, creado)`; reutiliza un job vigente con los mismos filtros."""
+    now = timezone.now()
+    params_hash = digest(formato, params, getattr(user, "pk", None))
+    reuse_after = now - timedelta(seconds=_setting("EXPORT_JOB_REUSE_SECONDS", 300))
+    existing = (
+        ExportJob.objects.filter(params_hash=params_hash, created_at__gte=reuse_after)
+        .exclude(status__in=[ExportJob.STATUS_FAILED, ExportJob.STATUS_EXPIRED])
+        .order_by("-created_at")
+        .first()
+    )
+    if existing and (existing.expires_at is None or existing.expires_at > now):
+        return existing, False
+    job = ExportJob.objects.create(
+        formato=formato,
+        params=params,
+        params_hash=params_hash,
+        requested_by=user if getattr(user, "pk", None) else None,
+    )
+    return job, True
+
+
+def claim_next_job() -> ExportJob | None:
+    """Toma el job pendiente más antiguo; el UPDATE condicional evita dobles tomas."""
+    pending = (
+        ExportJob.objects.filter(status=ExportJob.STATUS_PENDING)
+        .order_by("created_at")
+        .values_list("id", flat=True)[:10]
+    )
+    for job_id in pending:
+        claimed = ExportJob.objects.filter(
+            pk=job_id, status=ExportJob.STATUS_PENDING
+        ).update(status=ExportJob.STATUS_RUNNING, started_at=timezone.now())
+        if claimed:
+            return ExportJob.objects.select_related("requested_by").get(pk=job_id)
+    return None
+
+
+def run_job(job: ExportJob) -> ExportJob:
+    from .views import EmpleadoViewSet
+
+    rel = f"{_setting('EXPORT_JOBS_DIR', 'exports/jobs')}/{job.id}.{job.formato}"
+    path = Path(settings.MEDIA_ROOT) / rel
+    tmp = path.with_name(path.name + ".part")
+    try:
+        if job.requested_by is None:
+            # SET_NULL al borrar al usuario: sin él no hay alcance que aplicar
+            raise PermissionDenied("El usuario que pidió la exportación ya no existe.")
+        qs = EmpleadoViewSet.export_queryset_for(job.params, job.requested_by).order_by(
+            "id"
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as fh:
+            job.filas = write_empleados_xlsx(qs, fh)
+        os.replace(tmp, path)
+    except Exception as exc:  # el job registra el error; el worker sigue vivo
+        logger.exception("Export job %s falló", job.id)
+        tmp.unlink(missing_ok=True)
+        job.status = ExportJob.STATUS_FAILED
+        job.error = str(exc)[:2000]
+    else:
+        job.status = ExportJob.STATUS_DONE
+        job.archivo = rel
+        job.expires_at = timezone.now() + timedelta(
+            seconds=_setting("EXPORT_JOB_TTL_SECONDS", 86400)
+        )
+    job.finished_at = timezone.now()
+    job.save(
+        update_fields=[
+            "status",
+            "archivo",
+            "filas",
+            "error",
+            "finished_at",
+            "expires_at",
+        ]
+    )
+    return job
+
+
+def requeue_stale(older_than: timedelta) -> int:
+    """Regresa a pendiente los jobs "en proceso" de un worker que murió."""
+    return ExportJob.objects.filter(
+        status=ExportJob.STATUS_RUNNING, started_at__lt=timezone.now() - older_than
+    ).update(status=ExportJob.STATUS_PENDING, started_at=None)
+
+
+def purge_expired() -> int:
+    """Borra los archivos vencidos y marca sus jobs como expirados."""
+    purged = 0
+    expired = ExportJob.objects.filter(
+        status=ExportJob.STATUS_DONE, expires_at__lte=timezone.now()
+    )
+    for job in expired.iterator():
+        if job.archivo:
+            job_path(job).unlink(missing_ok=True)
+        job.status = ExportJob.STATUS_EXPIRED
+        job.save(update_fields=["status"])
+        purged += 1
+    return purged
@@ -0,0 +1,79 @@
+# empleados/management/commands/bench_list_serializer.py
+from __future__ import annotations
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.fast_serializers import ValuesPlan
+from empleados.models import Empleado
+from empleados.serializers import EmpleadoSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara filas/segundo de EmpleadoSerializer (DRF) contra la lectura "
+        "rápida desde .values() sobre empleados existentes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows", type=int, default=500, help="Filas por iteración."
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Iteraciones por modo."
+        )
+
+    def handle(self, *args, **opts):
+        rows, repeat = opts["rows"], opts["repeat"]
+        request = Request(
+            APIRequestFactory().get("/api/v1/empleados/", HTTP_HOST="localhost")
+        )
+        ctx = {"request": request}
+        qs = Empleado.all_objects.select_related("departamento", "puesto").order_by(
+            "id"
+        )[:rows]
+        total = qs.count()
+        if not total:
+            raise CommandError("No hay empleados para medir; carga datos primero.")
+
+        plan = ValuesPlan.for_serializer(EmpleadoSerializer(context=ctx))
+        if plan is None:
+            raise CommandError("EmpleadoSerializer no tiene plan de lectura rápida.")
+        renderer = JSONRenderer()
+
+        def drf():
+            return renderer.render(
+                EmpleadoSerializer(list(qs.all()), many=True, context=ctx).data
+            )
+
+        def fast():
+            return renderer.render(
+                plan.represent(list(qs.values(*plan.columns)), request)
+            )
+
+        if drf() != fast():
+            raise CommandError("Las salidas no son idénticas; revisa el plan.")
+
+        results = {}
+        for name, fn in (("drf", drf), ("fast", fast)):
+            best = min(self._time(fn) for _ in range(repeat))
+            results[name] = total / best
+            self.stdout.write(
+                f"{name:>5}: {results[name]:,.0f} filas/s ({best * 1000:.1f} ms por {total} filas)"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Ganancia: x{results['fast'] / results['drf']:.2f} (consulta + serialización + JSON)"
+            )
+        )
+
+    @staticmethod
+    def _time(fn) -> float:
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
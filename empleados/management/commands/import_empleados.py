@@ -0,0 +1,84 @@
+# empleados/management/commands/import_empleados.py
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from empleados.bulk import BATCH_SIZE
+from empleados.imports import FORMATS, import_empleados
+
+
+class Command(BaseCommand):
+    help = (
+        "Importa empleados desde un XLSX/CSV (extracto de nómina) en bloques: "
+        "valida cada bloque contra las reglas y los únicos existentes y lo "
+        "escribe en su propia transacción. Con --dry-run sólo reporta errores."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "archivo", help="Ruta al .xlsx o .csv (primera fila = encabezados)."
+        )
+        parser.add_argument(
+            "--format", choices=FORMATS, help="Por defecto, según la extensión."
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Valida sin escribir."
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=BATCH_SIZE, help="Filas por bloque."
+        )
+        parser.add_argument(
+            "--user", help="Username que queda como autor en el historial."
+        )
+        parser.add_argument("--report", help="Guarda el reporte completo en este JSON.")
+
+    def handle(self, *args, **opts):
+        path = Path(opts["archivo"])
+        if not path.is_file():
+            raise CommandError(f"No existe el archivo {path}")
+        formato = opts["format"] or path.suffix.lower().lstrip(".")
+        if formato not in FORMATS:
+            raise CommandError("Formato no soportado; usa --format xlsx|csv")
+
+        user = None
+        if opts["user"]:
+            try:
+                user = get_user_model().objects.get(username=opts["user"])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f"No existe el usuario {opts['user']}")
+
+        with path.open("rb") as fh:
+            report = import_empleados(
+                fh,
+                formato,
+                dry_run=opts["dry_run"],
+                user=user,
+                chunk_size=opts["chunk_size"],
+            )
+
+        if opts["report"]:
+            Path(opts["report"]).write_text(
+                json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8"
+            )
+        for error in report["errors"][:20]:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Fila {error['row']}: {json.dumps(error['errors'], ensure_ascii=False)}"
+                )
+            )
+        if report["ignored_columns"]:
+            self.stdout.write(
+                f"Columnas ignoradas: {', '.join(report['ignored_columns'])}"
+            )
+        verb = "válidas (dry-run)" if report["dry_run"] else "creadas"
+        count = report["valid"] if report["dry_run"] else report["created"]
+        style = self.style.SUCCESS if not report["error_count"] else self.style.WARNING
+        self.stdout.write(
+            style(
+                f"{report['rows']} filas → {count} {verb}, {report['error_count']} con error"
+            )
+        )
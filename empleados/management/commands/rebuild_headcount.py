@@ -0,0 +1,49 @@
+# empleados/management/commands/rebuild_headcount.py
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from empleados import stats
+from empleados.models import Empleado, HeadcountStat
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula la tabla de headcount (GET /empleados/stats/) desde la "
+        "plantilla con un GROUP BY. Con --check sólo reporta diferencias."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="No escribe; termina con error si la tabla está desfasada.",
+        )
+
+    def handle(self, *args, **opts):
+        if opts["check"]:
+            expected = {
+                k: n for k, n in stats.count_rows(Empleado.objects.all()).items() if n
+            }
+            current = {
+                (r.departamento_id, r.puesto_id, r.genero, r.activo): r.total
+                for r in HeadcountStat.objects.exclude(total=0)
+            }
+            drift = sorted(
+                (key, current.get(key, 0), n)
+                for key in expected.keys() | current.keys()
+                if (n := expected.get(key, 0)) != current.get(key, 0)
+            )
+            for key, have, want in drift:
+                self.stdout.write(f"{key}: tabla={have} real={want}")
+            if drift:
+                raise CommandError(
+                    f"{len(drift)} llave(s) desfasada(s); corre rebuild_headcount."
+                )
+            self.stdout.write(self.style.SUCCESS("Headcount al día."))
+            return
+
+        written = stats.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f"Headcount recalculado: {written} llave(s).")
+        )
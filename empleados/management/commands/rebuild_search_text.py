@@ -0,0 +1,21 @@
+# empleados/management/commands/rebuild_search_text.py
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from empleados.models import Empleado
+from empleados.signals import refresh_search_text
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula `search_text` de todos los empleados (incluye borrados "
+        "lógicos). Úsalo tras renombrar departamentos/puestos con "
+        "QuerySet.update()/bulk_update, que no emiten señales."
+    )
+
+    def handle(self, *args, **opts):
+        updated = refresh_search_text(Empleado.all_objects.all())
+        self.stdout.write(
+            self.style.SUCCESS(f"Documentos de búsqueda actualizados: {updated}.")
+        )
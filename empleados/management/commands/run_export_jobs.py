@@ -0,0 +1,68 @@
+# empleados/management/commands/run_export_jobs.py
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from empleados.jobs import claim_next_job, purge_expired, requeue_stale, run_job
+from empleados.models import ExportJob
+
+
+class Command(BaseCommand):
+    help = (
+        "Worker de exportaciones asíncronas: procesa jobs pendientes, "
+        "re-encola los abandonados y borra archivos vencidos. "
+        "Se pueden correr varios en paralelo."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Procesa lo pendiente y termina (útil en cron).",
+        )
+        parser.add_argument(
+            "--sleep", type=float, default=2.0, help="Espera (s) cuando no hay jobs."
+        )
+        parser.add_argument(
+            "--stale-minutes",
+            type=int,
+            default=60,
+            help="Re-encola jobs 'en proceso' más viejos que esto (worker caído).",
+        )
+
+    def handle(self, *args, **opts):
+        once = opts["once"]
+        stale = timedelta(minutes=opts["stale_minutes"])
+        last_maintenance = 0.0
+
+        while True:
+            close_old_connections()
+            if time.monotonic() - last_maintenance > 60:
+                requeued = requeue_stale(stale)
+                purged = purge_expired()
+                if requeued or purged:
+                    self.stdout.write(
+                        f"Mantenimiento → re-encolados={requeued}, expirados={purged}"
+                    )
+                last_maintenance = time.monotonic()
+
+            job = claim_next_job()
+            if job is None:
+                if once:
+                    break
+                time.sleep(opts["sleep"])
+                continue
+
+            job = run_job(job)
+            if job.status == ExportJob.STATUS_DONE:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"✓ {job.id} → {job.archivo} ({job.filas} filas)"
+                    )
+                )
+            else:
+                self.stdout.write(self.style.ERROR(f"✗ {job.id}: {job.error}"))
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.5 on 2026-10-18 00:15
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+SEARCH_INDEX = "empleados_search_text_trgm"
+
+
+def backfill_search_text(apps, schema_editor):
+    Empleado = apps.get_model("empleados", "Empleado")
+    db = schema_editor.connection.alias
+    pending = []
+    qs = Empleado.objects.using(db).select_related("departamento", "puesto")
+    for e in qs.iterator(chunk_size=500):
+        parts = [
+            e.num_empleado,
+            e.nombres,
+            e.apellido_paterno,
+            e.apellido_materno,
+            e.email,
+            e.curp,
+            e.rfc,
+            e.nss,
+            e.departamento.nombre if e.departamento_id else "",
+            e.puesto.nombre if e.puesto_id else "",
+        ]
+        e.search_text = "\n".join(p or "" for p in parts).lower()
+        pending.append(e)
+        if len(pending) >= 500:
+            Empleado.objects.using(db).bulk_update(pending, ["search_text"])
+            pending.clear()
+    if pending:
+        Empleado.objects.using(db).bulk_update(pending, ["search_text"])
+
+
+def create_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {SEARCH_INDEX} "
+        "ON empleados USING gin (search_text gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {SEARCH_INDEX}")
+
+
+class Migration(migrations.Migration):
+    dependencies = (("empleados", "0003_empleado_deleted_at_historicalempleado"),)
+
+    operations = (
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="empleado",
+            name="search_text",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.RunPython(backfill_search_text, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    )
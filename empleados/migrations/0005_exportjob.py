@@ -0,0 +1,85 @@
+# Generated by Django 5.2.5 on 2026-10-18 00:22
+
+import uuid
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = (
+        ("empleados", "0004_empleado_search_text"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    )
+
+    operations = (
+        migrations.CreateModel(
+            name="ExportJob",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "formato",
+                    models.CharField(
+                        choices=[("xlsx", "Excel (XLSX)")],
+                        default="xlsx",
+                        max_length=10,
+                    ),
+                ),
+                ("params", models.JSONField(blank=True, default=dict)),
+                ("params_hash", models.CharField(max_length=64)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pendiente"),
+                            ("running", "En proceso"),
+                            ("done", "Terminado"),
+                            ("failed", "Fallido"),
+                            ("expired", "Expirado"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("archivo", models.CharField(blank=True, default="", max_length=255)),
+                ("filas", models.PositiveIntegerField(blank=True, null=True)),
+                ("error", models.TextField(blank=True, default="")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("started_at", models.DateTimeField(blank=True, null=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("expires_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "requested_by",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "empleados_export_jobs",
+                "indexes": [
+                    models.Index(
+                        fields=["status", "created_at"],
+                        name="empleados_e_status_82df5a_idx",
+                    ),
+                    models.Index(
+                        fields=["params_hash", "created_at"],
+                        name="empleados_e_params__6b554f_idx",
+                    ),
+                ],
+            },
+        ),
+    )
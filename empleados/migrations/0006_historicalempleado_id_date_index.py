@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-18 01:10
+
+from django.db import migrations
+
+# El modelo histórico lo genera simple_history (sin Meta.indexes propio), así
+# que el índice compuesto vive sólo en la BD: RunSQL sin operaciones de estado.
+INDEX = "empleados_hist_id_date_idx"
+TABLE = "empleados_historicalempleado"
+
+
+class Migration(migrations.Migration):
+    dependencies = (("empleados", "0005_exportjob"),)
+
+    operations = (
+        migrations.RunSQL(
+            sql=f"CREATE INDEX IF NOT EXISTS {INDEX} ON {TABLE} (id, history_date, history_id)",
+            reverse_sql=f"DROP INDEX IF EXISTS {INDEX}",
+        ),
+    )
@@ -0,0 +1,74 @@
+# Generated by Django 5.2.5 on 2026-10-18 00:44
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_headcount(apps, schema_editor):
+    # Carga inicial con la plantilla existente (después la mantiene empleados.stats)
+    Empleado = apps.get_model("empleados", "Empleado")
+    HeadcountStat = apps.get_model("empleados", "HeadcountStat")
+    db = schema_editor.connection.alias
+    rows = (
+        Empleado.objects.using(db)
+        .filter(deleted_at__isnull=True)
+        .values("departamento_id", "puesto_id", "genero", "activo")
+        .annotate(n=Count("pk"))
+        .order_by()
+    )
+    HeadcountStat.objects.using(db).bulk_create(
+        HeadcountStat(
+            departamento_id=r["departamento_id"] or 0,
+            puesto_id=r["puesto_id"] or 0,
+            genero=r["genero"],
+            activo=r["activo"],
+            total=r["n"],
+        )
+        for r in rows
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = (("empleados", "0006_historicalempleado_id_date_index"),)
+
+    operations = (
+        migrations.CreateModel(
+            name="HeadcountStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("departamento_id", models.PositiveIntegerField(default=0)),
+                ("puesto_id", models.PositiveIntegerField(default=0)),
+                (
+                    "genero",
+                    models.CharField(
+                        choices=[
+                            ("M", "Masculino"),
+                            ("F", "Femenino"),
+                            ("O", "Otro/No especifica"),
+                        ],
+                        max_length=1,
+                    ),
+                ),
+                ("activo", models.BooleanField()),
+                ("total", models.IntegerField(default=0)),
+            ],
+            options={
+                "db_table": "empleados_headcount",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("departamento_id", "puesto_id", "genero", "activo"),
+                        name="empleados_headcount_key",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(fill_headcount, migrations.RunPython.noop),
+    )
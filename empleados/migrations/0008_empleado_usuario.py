@@ -0,0 +1,38 @@
+# Generated by Django 5.2.5 on 2026-10-18 01:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = (
+        ("empleados", "0007_headcountstat"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    )
+
+    operations = (
+        migrations.AddField(
+            model_name="empleado",
+            name="usuario",
+            field=models.OneToOneField(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="empleado",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="historicalempleado",
+            name="usuario",
+            field=models.ForeignKey(
+                blank=True,
+                db_constraint=False,
+                null=True,
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="+",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+    )
@@ -1,3 +1,6 @@
+import uuid
+
+from django.conf import settings
 from django.core.validators import EmailValidator, MinLengthValidator, RegexValidator
 from django.db import models
 from simple_history.models import HistoricalRecords
@@ -23,6 +26,22 @@ curp_validator = RegexValidator(r"^[A-Z]{4}\d{6}[HM][A-Z]{5}\d{2}$", "CURP invá
 rfc_validator = RegexValidator(r"^[A-ZÑ&]{3,4}\d{6}[A-Z0-9]{3}$", "RFC inválido.")
 nss_validator = RegexValidator(r"^\d{11}$", "NSS inválido (11 dígitos).")
 
+# Campos que alimentan el documento de búsqueda (`search_text`)
+SEARCH_SOURCE_FIELDS = frozenset(
+    {
+        "num_empleado",
+        "nombres",
+        "apellido_paterno",
+        "apellido_materno",
+        "email",
+        "curp",
+        "rfc",
+        "nss",
+        "departamento",
+        "puesto",
+    }
+)
+
 
 class Empleado(SoftDeleteModel):
     num_empleado = models.CharField(max_length=20, unique=True)
@@ -66,11 +85,23 @@ class Empleado(SoftDeleteModel):
     activo = models.BooleanField(default=True)
     foto = models.ImageField(upload_to="empleados/fotos/", null=True, blank=True)
 
+    # Cuenta de acceso del empleado: define el alcance de Gerente/Supervisor (empleados.scoping)
+    usuario = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name="empleado",
+        null=True,
+        blank=True,
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
-    # Auditoría
-    history = HistoricalRecords()
+    # Documento de búsqueda desnormalizado (minúsculas), indexado con pg_trgm
+    search_text = models.TextField(blank=True, default="", editable=False)
+
+    # Auditoría (el documento de búsqueda es derivado; no se versiona)
+    history = HistoricalRecords(excluded_fields=["search_text"])
 
     class Meta:
         db_table = "empleados"
@@ -84,3 +115,111 @@ class Empleado(SoftDeleteModel):
 
     def __str__(self):
         return f"{self.num_empleado} - {self.apellido_paterno} {self.apellido_materno} {self.nombres}"
+
+    def build_search_text(self) -> str:
+        """Concatena (en minúsculas) los valores que cubre la búsqueda `?q=`."""
+        parts = [
+            self.num_empleado,
+            self.nombres,
+            self.apellido_paterno,
+            self.apellido_materno,
+            self.email,
+            self.curp,
+            self.rfc,
+            self.nss,
+            self.departamento.nombre if self.departamento_id else "",
+            self.puesto.nombre if self.puesto_id else "",
+        ]
+        # Separador que no aparece en una búsqueda para no casar entre campos
+        return "\n".join(p or "" for p in parts).lower()
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or SEARCH_SOURCE_FIELDS.intersection(update_fields):
+            self.search_text = self.build_search_text()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "search_text"}
+        super().save(*args, **kwargs)
+
+
+class HeadcountStat(models.Model):
+    """
+    Plantilla viva (sin borrados lógicos) agregada por departamento, puesto,
+    género y estatus. La mantiene `empleados.stats` en cada escritura; 0 en
+    departamento/puesto = sin asignar (un NULL rompería el único).
+    """
+
+    departamento_id = models.PositiveIntegerField(default=0)
+    puesto_id = models.PositiveIntegerField(default=0)
+    genero = models.CharField(max_length=1, choices=GENERO_CHOICES)
+    activo = models.BooleanField()
+    total = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "empleados_headcount"
+        constraints = (
+            models.UniqueConstraint(
+                fields=["departamento_id", "puesto_id", "genero", "activo"],
+                name="empleados_headcount_key",
+            ),
+        )
+
+    def __str__(self):
+        return f"{self.departamento_id}/{self.puesto_id}/{self.genero}/{self.activo}: {self.total}"
+
+
+class ExportJob(models.Model):
+    """Exportación asíncrona: la encola la API y la ejecuta `run_export_jobs`."""
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+    STATUS_EXPIRED = "expired"
+    STATUS_CHOICES = (
+        (STATUS_PENDING, "Pendiente"),
+        (STATUS_RUNNING, "En proceso"),
+        (STATUS_DONE, "Terminado"),
+        (STATUS_FAILED, "Fallido"),
+        (STATUS_EXPIRED, "Expirado"),
+    )
+
+    FORMAT_XLSX = "xlsx"
+    FORMAT_CHOICES = ((FORMAT_XLSX, "Excel (XLSX)"),)
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    formato = models.CharField(
+        max_length=10, choices=FORMAT_CHOICES, default=FORMAT_XLSX
+    )
+    params = models.JSONField(default=dict, blank=True)  # query params (listas)
+    params_hash = models.CharField(max_length=64)
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=STATUS_PENDING
+    )
+    archivo = models.CharField(
+        max_length=255, blank=True, default=""
+    )  # relativo a MEDIA_ROOT
+    filas = models.PositiveIntegerField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        null=True,
+        blank=True,
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "empleados_export_jobs"
+        indexes = (
+            models.Index(fields=["status", "created_at"]),
+            models.Index(fields=["params_hash", "created_at"]),
+        )
+
+    def __str__(self):
+        return f"{self.formato} {self.id} ({self.status})"
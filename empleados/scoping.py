@@ -0,0 +1,49 @@
+# empleados/scoping.py
+"""
+Alcance por filas de las lecturas de Empleado (Gerente/Supervisor).
+
+`core.permissions.read_scope()` decide el alcance del usuario con la tabla
+de roles compilada al arrancar; aquí se traduce a un `WHERE` con subconsulta
+sobre el propio empleado del usuario (`Empleado.usuario`):
+
+    departamento_id IN (SELECT departamento_id FROM empleados WHERE usuario_id = %s)
+
+La misma condición sirve para `Empleado`, su historial (as_of) y la tabla
+agregada `HeadcountStat`, porque las tres tienen `departamento_id` y
+`puesto_id`. Un Gerente/Supervisor sin empleado vinculado (o sin
+departamento/puesto) no ve ninguna fila.
+"""
+
+from __future__ import annotations
+
+from django.db.models import Q
+
+from core.permissions import SCOPE_ALL, SCOPE_DEPARTAMENTO, SCOPE_PUESTO, read_scope
+
+from .models import Empleado
+
+SCOPE_FIELDS = {
+    SCOPE_DEPARTAMENTO: "departamento_id",
+    SCOPE_PUESTO: "puesto_id",
+}
+
+
+def scope_q(user) -> Q | None:
+    """Condición de alcance del usuario (None = sin restricción)."""
+    scope = read_scope(user)
+    if scope == SCOPE_ALL:
+        return None
+    field = SCOPE_FIELDS[scope]
+    own = Empleado.objects.filter(usuario_id=user.pk).values(field)
+    return Q(**{f"{field}__in": own})
+
+
+def scope_queryset(queryset, user):
+    q = scope_q(user)
+    return queryset if q is None else queryset.filter(q)
+
+
+def scope_token(user) -> tuple[str, int] | None:
+    """Parte de llaves de cache para resultados que dependen del alcance."""
+    scope = read_scope(user)
+    return None if scope == SCOPE_ALL else (scope, user.pk)
@@ -0,0 +1,74 @@
+# empleados/search.py
+"""
+Búsqueda amplia (`?q=`) de empleados.
+
+- PostgreSQL: un solo `LIKE` sobre `search_text` (servido por el índice GIN
+  `gin_trgm_ops`) y orden por relevancia con `word_similarity`.
+- Otros motores (SQLite en dev/tests): el OR de `icontains` de siempre.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q, QuerySet
+
+from .models import Empleado
+
+# Lookups del modo compatible (mismo contrato que el `?q=` original)
+LEGACY_LOOKUPS = (
+    "num_empleado__icontains",
+    "nombres__icontains",
+    "apellido_paterno__icontains",
+    "apellido_materno__icontains",
+    "email__icontains",
+    "curp__icontains",
+    "rfc__icontains",
+    "nss__icontains",
+    "departamento__nombre__icontains",
+    "puesto__nombre__icontains",
+)
+
+
+def legacy_search(queryset: QuerySet, value: str) -> QuerySet:
+    """OR de `icontains` sobre cada campo (secuencial; sin índice)."""
+    cond = Q()
+    for lookup in LEGACY_LOOKUPS:
+        cond |= Q(**{lookup: value})
+    return queryset.filter(cond)
+
+
+def indexed_search_enabled(using: str = "default") -> bool:
+    """
+    `EMPLEADOS_SEARCH_BACKEND`:
+      - "auto" (default): indexado si la BD es PostgreSQL.
+      - "indexed" / "legacy": fuerza el modo.
+    """
+    backend = getattr(settings, "EMPLEADOS_SEARCH_BACKEND", "auto")
+    if backend == "legacy":
+        return False
+    if backend == "indexed":
+        return True
+    return connections[using].vendor == "postgresql"
+
+
+def indexed_search(queryset: QuerySet, value: str) -> QuerySet:
+    """Filtra por `search_text` y ordena por relevancia (desc) y num_empleado."""
+    from django.contrib.postgres.search import TrigramWordSimilarity
+
+    term = value.lower()
+    return (
+        queryset.filter(search_text__contains=term)
+        .annotate(search_rank=TrigramWordSimilarity(term, "search_text"))
+        .order_by("-search_rank", "num_empleado")
+    )
+
+
+def search_empleados(queryset: QuerySet, value: str) -> QuerySet:
+    value = (value or "").strip()
+    if not value:
+        return queryset
+    # El historial (?as_of=) no tiene `search_text` (excluded_fields): siempre el OR
+    if queryset.model is Empleado and indexed_search_enabled(queryset.db):
+        return indexed_search(queryset, value)
+    return legacy_search(queryset, value)
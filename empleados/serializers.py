@@ -1,14 +1,30 @@
 # empleados/serializers.py
+from typing import ClassVar
+
+from django.db import IntegrityError
+from django.urls import reverse
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
+from rest_framework.validators import UniqueValidator
+
+from catalogos.models import Departamento, Puesto
+from catalogos.serializers import CatalogNameField
+from core.serializers import SparseFieldsetMixin
 
-from .models import Empleado
+from .bulk import (
+    UNIQUE_FIELDS,
+    integrity_error_fields,
+    unique_conflicts,
+    unique_message,
+)
+from .models import Empleado, ExportJob
 
 
-class EmpleadoSerializer(serializers.ModelSerializer):
-    departamento_nombre = serializers.ReadOnlyField(source="departamento.nombre")
-    puesto_nombre = serializers.ReadOnlyField(source="puesto.nombre")
+class EmpleadoSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    # Nombres desde el cache de catálogos en memoria (sin JOIN)
+    departamento_nombre = CatalogNameField(Departamento, source="departamento_id")
+    puesto_nombre = CatalogNameField(Puesto, source="puesto_id")
     genero_display = serializers.CharField(source="get_genero_display", read_only=True)
     estado_civil_display = serializers.CharField(
         source="get_estado_civil_display", read_only=True
@@ -55,11 +71,136 @@ class EmpleadoSerializer(serializers.ModelSerializer):
             "updated_at",
             "deleted_at",
         ]
+        # Columnas que leen los campos calculados (para ?fields= → only())
+        projection_extra: ClassVar[dict[str, tuple[str, ...]]] = {"foto_url": ("foto",)}
+
+    # Únicos validados en una sola consulta (ver `validate`), no con un
+    # UniqueValidator (un EXISTS) por campo
+    check_uniques = True
+
+    def get_fields(self):
+        fields = super().get_fields()
+        for name in UNIQUE_FIELDS:
+            if name in fields:
+                fields[name].validators = [
+                    v
+                    for v in fields[name].validators
+                    if not isinstance(v, UniqueValidator)
+                ]
+        return fields
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        if self.check_uniques:
+            instance = self.instance
+            changed = {
+                f: attrs[f]
+                for f in UNIQUE_FIELDS
+                if f in attrs and (instance is None or getattr(instance, f) != attrs[f])
+            }
+            if changed:
+                conflicts = unique_conflicts(
+                    [(getattr(instance, "pk", None), changed)]
+                )[0]
+                if conflicts:
+                    raise serializers.ValidationError(
+                        {f: [msg] for f, msg in conflicts.items()}
+                    )
+        return attrs
+
+    def create(self, validated_data):
+        try:
+            return super().create(validated_data)
+        except IntegrityError as exc:
+            raise self._unique_race_error(exc)
+
+    def update(self, instance, validated_data):
+        try:
+            return super().update(instance, validated_data)
+        except IntegrityError as exc:
+            raise self._unique_race_error(exc)
+
+    @staticmethod
+    def _unique_race_error(exc: IntegrityError) -> Exception:
+        """Otra escritura ganó entre `validate` y el INSERT/UPDATE: mismo 400 estructurado."""
+        fields = integrity_error_fields(exc)
+        if not fields:
+            return exc
+        return serializers.ValidationError({f: [unique_message(f)] for f in fields})
 
     @extend_schema_field(OpenApiTypes.URI)
     def get_foto_url(self, obj) -> str | None:
-        if obj.foto:
-            request = self.context.get("request")
-            url = obj.foto.url
-            return request.build_absolute_uri(url) if request else url
-        return None
+        # En registros históricos (?as_of=) `foto` es la ruta en texto
+        return self.fast_foto_url(
+            getattr(obj.foto, "name", obj.foto), self.context.get("request")
+        )
+
+    @staticmethod
+    def fast_foto_url(foto: str, request) -> str | None:
+        """Equivalente de `get_foto_url` sobre el valor crudo (lectura rápida)."""
+        if not foto:
+            return None
+        url = Empleado._meta.get_field("foto").storage.url(foto)
+        return request.build_absolute_uri(url) if request else url
+
+
+class EmpleadoBulkRowSerializer(EmpleadoSerializer):
+    """
+    Fila de carga masiva: mismas reglas de campo que EmpleadoSerializer pero
+    sin consultas por fila. Únicos y FKs los valida `empleados.bulk` por lote.
+    """
+
+    departamento = serializers.IntegerField(
+        source="departamento_id", required=False, allow_null=True
+    )
+    puesto = serializers.IntegerField(
+        source="puesto_id", required=False, allow_null=True
+    )
+
+    check_uniques = False
+
+    class Meta(EmpleadoSerializer.Meta):
+        fields = tuple(
+            f for f in EmpleadoSerializer.Meta.fields if f not in ("foto", "foto_url")
+        )
+        read_only_fields = tuple(
+            f for f in EmpleadoSerializer.Meta.read_only_fields if f != "foto_url"
+        )
+
+
+class ExportJobSerializer(serializers.ModelSerializer):
+    status_url = serializers.SerializerMethodField()
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ExportJob
+        fields = (
+            "id",
+            "formato",
+            "status",
+            "params",
+            "filas",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+            "expires_at",
+            "status_url",
+            "download_url",
+        )
+        read_only_fields = fields
+
+    def _url(self, name: str, obj) -> str:
+        path = reverse(name, kwargs={"job_id": str(obj.id)})
+        request = self.context.get("request")
+        return request.build_absolute_uri(path) if request else path
+
+    @extend_schema_field(OpenApiTypes.URI)
+    def get_status_url(self, obj) -> str:
+        return self._url("empleado-export-status", obj)
+
+    @extend_schema_field(OpenApiTypes.URI)
+    def get_download_url(self, obj) -> str | None:
+        if obj.status != ExportJob.STATUS_DONE:
+            return None
+        return self._url("empleado-export-download", obj)
@@ -0,0 +1,117 @@
+# empleados/signals.py
+"""
+`search_text` de Empleado sigue a los nombres de Departamento/Puesto sólo por
+`post_save`: un renombre con `QuerySet.update()`, `bulk_update` o SQL directo
+no emite señales y deja el documento viejo hasta el siguiente `save()` del
+empleado. Tras cambios así corre `python manage.py rebuild_search_text`.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from catalogos.models import Departamento, Puesto
+from core.models import soft_delete_batch
+
+from . import stats
+from .models import Empleado
+
+SEARCH_REFRESH_BATCH = 500
+
+
+def refresh_search_text(queryset) -> int:
+    """
+    Recalcula `search_text` de los empleados dados (p. ej. tras renombrar un
+    departamento/puesto). Solo escribe las filas cuyo documento cambió.
+    """
+    pending: list[Empleado] = []
+    updated = 0
+    qs = queryset.select_related("departamento", "puesto").only(
+        "id",
+        "num_empleado",
+        "nombres",
+        "apellido_paterno",
+        "apellido_materno",
+        "email",
+        "curp",
+        "rfc",
+        "nss",
+        "search_text",
+        "departamento__nombre",
+        "puesto__nombre",
+    )
+    for emp in qs.iterator(chunk_size=SEARCH_REFRESH_BATCH):
+        doc = emp.build_search_text()
+        if doc != emp.search_text:
+            emp.search_text = doc
+            pending.append(emp)
+        if len(pending) >= SEARCH_REFRESH_BATCH:
+            updated += Empleado.all_objects.bulk_update(pending, ["search_text"])
+            pending.clear()
+    if pending:
+        updated += Empleado.all_objects.bulk_update(pending, ["search_text"])
+    return updated
+
+
+@receiver(post_save, sender=Departamento, dispatch_uid="empleados_search_departamento")
+def _departamento_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields is not None and "nombre" not in update_fields):
+        return
+    refresh_search_text(Empleado.all_objects.filter(departamento_id=instance.pk))
+
+
+@receiver(post_save, sender=Puesto, dispatch_uid="empleados_search_puesto")
+def _puesto_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields is not None and "nombre" not in update_fields):
+        return
+    refresh_search_text(Empleado.all_objects.filter(puesto_id=instance.pk))
+
+
+# ---- Headcount incremental (ver empleados.stats) ----
+_UNCHANGED = object()
+
+
+@receiver(pre_save, sender=Empleado, dispatch_uid="empleados_headcount_pre_save")
+def _empleado_pre_save(sender, instance, update_fields=None, using=None, **kwargs):
+    if instance._state.adding:
+        instance._headcount_old = None
+        return
+    touched = {f.removesuffix("_id") for f in stats.STAT_FIELDS}
+    if update_fields is not None and not touched.intersection(update_fields):
+        instance._headcount_old = _UNCHANGED
+        return
+    old = (
+        Empleado.all_objects.using(using)
+        .filter(pk=instance.pk)
+        .values(*stats.STAT_FIELDS)
+        .first()
+    )
+    instance._headcount_old = stats.stat_key(old) if old else None
+
+
+@receiver(post_save, sender=Empleado, dispatch_uid="empleados_headcount_saved")
+def _empleado_saved(sender, instance, using=None, **kwargs):
+    old = getattr(instance, "_headcount_old", None)
+    if old is _UNCHANGED:
+        return
+    deltas: Counter = Counter()
+    stats.record_change(deltas, old, stats.stat_key(instance))
+    stats.apply_deltas(deltas, using)
+
+
+@receiver(post_delete, sender=Empleado, dispatch_uid="empleados_headcount_deleted")
+def _empleado_hard_deleted(sender, instance, using=None, **kwargs):
+    deltas: Counter = Counter()
+    stats.record_change(deltas, stats.stat_key(instance), None)
+    stats.apply_deltas(deltas, using)
+
+
+@receiver(
+    soft_delete_batch, sender=Empleado, dispatch_uid="empleados_headcount_soft_delete"
+)
+def _empleados_soft_deleted(sender, pks, deleted, using=None, **kwargs):
+    batch = Empleado.all_objects.using(using).filter(pk__in=pks)
+    stats.apply_deltas(stats.count_rows(batch, sign=-1 if deleted else 1), using)
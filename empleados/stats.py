@@ -0,0 +1,159 @@
+# empleados/stats.py
+"""
+Headcount agregado (tabla `HeadcountStat`) mantenido de forma incremental.
+
+Cada escritura de Empleado se traduce en deltas `{llave: ±n}` sobre la
+llave `(departamento_id, puesto_id, genero, activo)` de las filas vivas:
+
+- save/delete de una instancia: señales en `empleados.signals`;
+- alta/cambio masivo (`empleados.bulk`): `add_rows` / `record_change`;
+- borrado/restauración masivos: señal `core.models.soft_delete_batch`.
+
+Los deltas se aplican dentro de la misma transacción que la escritura, con
+un solo `INSERT ... ON CONFLICT DO UPDATE SET total = total + n` (sin
+leer-modificar-escribir). Si algo
+quedara desfasado, `manage.py rebuild_headcount` recalcula todo con un
+GROUP BY.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+
+from django.db import connections, router, transaction
+from django.db.models import Count, Q
+
+from catalogos.cache import get_catalogs
+from catalogos.models import Departamento, Puesto
+
+from .models import Empleado, HeadcountStat
+
+# Campos de Empleado que mueven el headcount
+STAT_FIELDS = ("departamento_id", "puesto_id", "genero", "activo", "deleted_at")
+DIMENSIONS = ("departamento", "puesto", "genero", "activo")
+KEY_COLUMNS = ("departamento_id", "puesto_id", "genero", "activo")
+
+Key = tuple[int, int, str, bool]
+
+
+def stat_key(values) -> Key | None:
+    """Llave de un empleado (objeto o dict con STAT_FIELDS); None si está borrado."""
+    get = values.get if isinstance(values, dict) else lambda f: getattr(values, f)
+    if get("deleted_at") is not None:
+        return None
+    return (
+        get("departamento_id") or 0,
+        get("puesto_id") or 0,
+        get("genero"),
+        bool(get("activo")),
+    )
+
+
+def record_change(deltas: Counter, old: Key | None, new: Key | None) -> None:
+    if old == new:
+        return
+    if old is not None:
+        deltas[old] -= 1
+    if new is not None:
+        deltas[new] += 1
+
+
+def apply_deltas(deltas: Counter, using: str | None = None) -> None:
+    """
+    Suma los deltas a la tabla en una sola sentencia: INSERT ... ON CONFLICT
+    DO UPDATE (PostgreSQL/SQLite), atómica frente a escrituras concurrentes.
+    """
+    # Orden fijo de llaves: dos transacciones bloquean filas en el mismo orden
+    rows = sorted((*key, delta) for key, delta in deltas.items() if delta)
+    if not rows:
+        return
+    connection = connections[using or router.db_for_write(HeadcountStat)]
+    qn = connection.ops.quote_name
+    table = qn(HeadcountStat._meta.db_table)
+    columns = ", ".join(qn(c) for c in KEY_COLUMNS)
+    placeholders = ", ".join(["(%s, %s, %s, %s, %s)"] * len(rows))
+    sql = (
+        f"INSERT INTO {table} ({columns}, {qn('total')}) VALUES {placeholders} "
+        f"ON CONFLICT ({columns}) DO UPDATE SET {qn('total')} = {table}.{qn('total')} + excluded.{qn('total')}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [value for row in rows for value in row])
+
+
+def count_rows(queryset, sign: int = 1) -> Counter:
+    """Deltas de las filas de `queryset` agrupadas por llave (una consulta)."""
+    deltas: Counter = Counter()
+    rows = queryset.order_by().values(*KEY_COLUMNS).annotate(n=Count("pk"))
+    for row in rows:
+        deltas[stat_key({**row, "deleted_at": None})] += sign * row["n"]
+    return deltas
+
+
+def add_rows(objs: Iterable[Empleado], using: str | None = None) -> None:
+    """Altas ya insertadas (p. ej. `bulk_create`)."""
+    deltas: Counter = Counter()
+    for obj in objs:
+        record_change(deltas, None, stat_key(obj))
+    apply_deltas(deltas, using)
+
+
+def rebuild(using: str | None = None) -> int:
+    """Recalcula la tabla completa desde `empleados`; devuelve las llaves escritas."""
+    alive = Empleado.objects.db_manager(using).all()
+    rows = [
+        HeadcountStat(
+            departamento_id=key[0],
+            puesto_id=key[1],
+            genero=key[2],
+            activo=key[3],
+            total=n,
+        )
+        for key, n in count_rows(alive).items()
+        if n
+    ]
+    manager = HeadcountStat.objects.db_manager(using)
+    with transaction.atomic(using=manager.db):
+        manager.all().delete()
+        manager.bulk_create(rows)
+    return len(rows)
+
+
+def headcount(using: str | None = None, scope: Q | None = None) -> dict:
+    """
+    Totales y desgloses por dimensión, leídos sólo de la tabla agregada.
+    `scope`: condición de alcance del usuario (`empleados.scoping.scope_q`).
+    """
+    stats = HeadcountStat.objects.db_manager(using).filter(total__gt=0)
+    if scope is not None:
+        stats = stats.filter(scope)
+    totals = {dim: Counter() for dim in DIMENSIONS}
+    grand = 0
+    for row in stats.values(
+        "departamento_id", "puesto_id", "genero", "activo", "total"
+    ):
+        grand += row["total"]
+        totals["departamento"][row["departamento_id"]] += row["total"]
+        totals["puesto"][row["puesto_id"]] += row["total"]
+        totals["genero"][row["genero"]] += row["total"]
+        totals["activo"][row["activo"]] += row["total"]
+
+    catalogs = get_catalogs()
+
+    def named(model, counter: Counter) -> list[dict]:
+        return [
+            {"id": pk or None, "nombre": catalogs.name(model, pk), "total": n}
+            for pk, n in sorted(counter.items(), key=lambda kv: (-kv[1], kv[0]))
+        ]
+
+    labels = dict(Empleado._meta.get_field("genero").choices)
+    return {
+        "total": grand,
+        "activo": {"true": totals["activo"][True], "false": totals["activo"][False]},
+        "genero": [
+            {"genero": g, "label": labels.get(g, g), "total": n}
+            for g, n in sorted(totals["genero"].items(), key=lambda kv: (-kv[1], kv[0]))
+        ],
+        "departamento": named(Departamento, totals["departamento"]),
+        "puesto": named(Puesto, totals["puesto"]),
+    }
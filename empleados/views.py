@@ -1,28 +1,73 @@
-﻿# empleados/views.py
+# empleados/views.py
 from __future__ import annotations
-from typing import Optional
-from io import BytesIO
+
+import tempfile
+import zipfile
 from datetime import date
 
+from django.conf import settings
+from django.db import IntegrityError
 from django.db.models import Q
-from django.http import FileResponse
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpRequest,
+    HttpResponse,
+    HttpResponseNotModified,
+    QueryDict,
+    StreamingHttpResponse,
+)
+from django.utils.http import parse_etags
 from django_filters import rest_framework as filters
-
 from drf_spectacular.types import OpenApiTypes
-from drf_spectacular.utils import OpenApiExample, OpenApiResponse, extend_schema
-
-from openpyxl import Workbook
-from openpyxl.styles import Font
-
+from drf_spectacular.utils import (
+    OpenApiExample,
+    OpenApiParameter,
+    OpenApiResponse,
+    extend_schema,
+)
+from openpyxl.utils.exceptions import InvalidFileException
 from rest_framework import serializers, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.parsers import JSONParser, FormParser, MultiPartParser
+from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
+from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from core.permissions import IsEmpleadoEditorOrReadOnly, IsRHAdmin
-from .models import Empleado
-from .serializers import EmpleadoSerializer
+from catalogos.models import Departamento, Puesto
+from core.conditional import ConditionalGetMixin
+from core.fast_serializers import ValuesPlan
+from core.history import HistoryDiffMixin
+from core.pagination import HybridPagination
+from core.permissions import (
+    GROUP_ADMIN,
+    IsEmpleadoEditorOrReadOnly,
+    IsRHAdmin,
+    in_groups,
+)
+
+from . import bulk, export_cache
+from .as_of import AS_OF_PARAM, parse_as_of, roster_as_of
+from .exports import (
+    CSV_CONTENT_TYPE,
+    NDJSON_CONTENT_TYPE,
+    XLSX_CONTENT_TYPE,
+    stream_csv,
+    stream_ndjson,
+    write_empleados_xlsx,
+)
+from .imports import FORMATS as IMPORT_FORMATS
+from .imports import import_empleados
+from .jobs import enqueue_export, job_path, normalize_params
+from .models import Empleado, ExportJob
+from .scoping import scope_q, scope_queryset, scope_token
+from .search import search_empleados
+from .serializers import (
+    EmpleadoBulkRowSerializer,
+    EmpleadoSerializer,
+    ExportJobSerializer,
+)
+from .stats import headcount
 
 
 # -----------------------
@@ -65,20 +110,10 @@ class EmpleadoFilter(filters.FilterSet):
         ]
 
     def filter_q(self, queryset, name, value):
-        return queryset.filter(
-            Q(num_empleado__icontains=value)
-            | Q(nombres__icontains=value)
-            | Q(apellido_paterno__icontains=value)
-            | Q(apellido_materno__icontains=value)
-            | Q(email__icontains=value)
-            | Q(curp__icontains=value)
-            | Q(rfc__icontains=value)
-            | Q(nss__icontains=value)
-            | Q(departamento__nombre__icontains=value)
-            | Q(puesto__nombre__icontains=value)
-        )
+        # PostgreSQL: índice trigram + relevancia; SQLite: OR de icontains
+        return search_empleados(queryset, value)
 
-    def filter_deleted(self, queryset, name, value: Optional[bool]):
+    def filter_deleted(self, queryset, name, value: bool | None):
         if value is True:
             return queryset.filter(deleted_at__isnull=False)
         if value is False:
@@ -86,17 +121,33 @@ class EmpleadoFilter(filters.FilterSet):
         return queryset
 
 
+class EmpleadoAsOfFilter(EmpleadoFilter):
+    """Mismos filtros sobre la plantilla reconstruida del historial (?as_of=)."""
+
+    class Meta(EmpleadoFilter.Meta):
+        model = Empleado.history.model
+
+
+AS_OF_PARAMETER = OpenApiParameter(
+    AS_OF_PARAM,
+    OpenApiTypes.DATETIME,
+    description="Plantilla tal como estaba en ese instante (fecha sola = fin del día).",
+)
+
+
 # -----------------------
 # ViewSet
 # -----------------------
 @extend_schema(tags=["Empleados"])
-class EmpleadoViewSet(viewsets.ModelViewSet):
+class EmpleadoViewSet(ConditionalGetMixin, HistoryDiffMixin, viewsets.ModelViewSet):
     """
     CRUD de Empleados con:
     - soft delete / restore
-    - history (django-simple-history)
+    - history paginado con diffs (django-simple-history)
     - exportación a Excel
     - filtros/ordenación/búsqueda
+    - paginación por página o keyset (`?paginate=cursor`)
+    - GET condicional (ETag / Last-Modified / 304)
     """
 
     serializer_class = EmpleadoSerializer
@@ -120,6 +171,14 @@ class EmpleadoViewSet(viewsets.ModelViewSet):
         "apellido_paterno",
         "created_at",
     ]
+    pagination_class = HybridPagination
+    keyset_default_ordering = "num_empleado"
+    # Versiones que invalidan el COUNT cacheado (filtros cruzan a catálogos)
+    count_cache_models = (Empleado, Departamento, Puesto)
+    # Acciones que aceptan `?as_of=` (plantilla a una fecha pasada)
+    as_of_actions = ("list", "export_excel", "export_csv", "export_ndjson")
+    # Los nombres de catálogo van en el cuerpo: sus cambios también cambian el ETag
+    etag_related = ("departamento__updated_at", "puesto__updated_at")
     parser_classes = (JSONParser, FormParser, MultiPartParser)
 
     def get_queryset(self):
@@ -127,14 +186,82 @@ class EmpleadoViewSet(viewsets.ModelViewSet):
         Por defecto devuelve solo registros vivos (excluye soft delete).
         Si pasas ?include_deleted=1, parte de todos (vivos + borrados).
         Combina con ?deleted=true|false para filtrar explícitamente.
+        Gerente/Supervisor sólo ven las filas de su alcance (empleados.scoping);
+        aplica también a detalle, historial y exportaciones.
         """
-        include_deleted = self.request.query_params.get("include_deleted")
-        base = Empleado.all_objects if include_deleted else Empleado.objects
-        return (
-            base.select_related("departamento", "puesto")
-            .all()
-            .order_by("num_empleado")
-        )
+        params = self.request.query_params
+        include_deleted = params.get("include_deleted")
+        instant = self.get_as_of() if self.action in self.as_of_actions else None
+        if instant is not None:
+            # Estado reconstruido desde el historial (borrados lógicos a esa fecha incluidos)
+            qs = roster_as_of(instant)
+            if not include_deleted:
+                qs = qs.filter(deleted_at__isnull=True)
+        else:
+            base = Empleado.all_objects if include_deleted else Empleado.objects
+            qs = base.all()
+        qs = scope_queryset(qs, self.request.user)
+        return self.apply_read_projection(qs.order_by("num_empleado"))
+
+    def filter_queryset(self, queryset):
+        if queryset.model is not Empleado:
+            # django-filter exige que el FilterSet sea del modelo del queryset
+            self.filterset_class = EmpleadoAsOfFilter
+        return super().filter_queryset(queryset)
+
+    def get_as_of(self):
+        """`?as_of=` validado (None si no viene)."""
+        raw = self.request.query_params.get(AS_OF_PARAM) if self.request else None
+        if not raw:
+            return None
+        try:
+            return parse_as_of(raw)
+        except ValueError:
+            raise serializers.ValidationError(
+                {AS_OF_PARAM: ["Fecha inválida (ISO 8601)."]}
+            )
+
+    def apply_read_projection(self, qs):
+        """
+        Con `?fields=` / `?exclude=` en list/retrieve, lee sólo las columnas
+        que piden los campos seleccionados. En lecturas no hay JOIN a
+        catálogos: `departamento_nombre` / `puesto_nombre` salen del cache en
+        memoria (`catalogos.cache`).
+        """
+        params = self.request.query_params
+        sparse = "fields" in params or "exclude" in params
+        if self.action not in ("list", "retrieve"):
+            return qs.select_related("departamento", "puesto")
+        if not sparse:
+            return qs
+        only, related = self.get_serializer().get_projection()
+        # Columnas de orden/keyset siempre disponibles sin consultas diferidas
+        only.update(self.ordering_fields)
+        if related:
+            qs = qs.select_related(*related)
+        return qs.only(*only)
+
+    @extend_schema(parameters=[AS_OF_PARAMETER])
+    def list(self, request: Request, *args, **kwargs) -> Response:
+        """
+        Lectura rápida: pagina filas `.values()` y las serializa con un plan
+        precompilado (mismo JSON que EmpleadoSerializer). Si algún campo no
+        tiene equivalente, cae al camino normal de DRF.
+        """
+        plan = None
+        if getattr(settings, "EMPLEADOS_FAST_LIST", True):
+            plan = ValuesPlan.for_serializer(self.get_serializer())
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        # Columnas de orden para el keyset aunque no se devuelvan
+        columns = list(dict.fromkeys([*plan.columns, "id", *self.ordering_fields]))
+        rows = queryset.values(*columns)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(plan.represent(page, request))
+        return Response(plan.represent(rows, request))
 
     def get_permissions(self):
         # DELETE/acciones especiales solo Admin (o superuser)
@@ -148,7 +275,12 @@ class EmpleadoViewSet(viewsets.ModelViewSet):
         description="Marca el empleado como eliminado lógicamente (no se borra físicamente).",
         responses={204: OpenApiResponse(description="Eliminado lógicamente")},
     )
-    @action(detail=True, methods=["post"], url_path="soft-delete", permission_classes=[IsRHAdmin])
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="soft-delete",
+        permission_classes=[IsRHAdmin],
+    )
     def soft_delete(self, request: Request, pk: str | None = None) -> Response:
         obj = self.get_object()
         obj.delete()  # soft delete
@@ -160,72 +292,246 @@ class EmpleadoViewSet(viewsets.ModelViewSet):
         responses={200: EmpleadoSerializer},
         examples=[OpenApiExample("Restaurado", value={"detail": "ok"})],
     )
-    @action(detail=True, methods=["post"], url_path="restore", permission_classes=[IsRHAdmin])
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="restore",
+        permission_classes=[IsRHAdmin],
+    )
     def restore(self, request: Request, pk: str | None = None) -> Response:
         obj = self.get_object()
         obj.restore()
         return Response(self.get_serializer(obj).data, status=status.HTTP_200_OK)
 
-    # ---------- Historial ----------
-    class _HistoryRecordSerializer(serializers.Serializer):
-        history_id = serializers.IntegerField()
-        history_date = serializers.DateTimeField()
-        history_user = serializers.CharField(allow_null=True)
-        history_type = serializers.CharField()  # '+', '~', '-'
-        num_empleado = serializers.CharField()
-        nombres = serializers.CharField()
-        apellidos = serializers.CharField()
-        departamento_id = serializers.IntegerField(allow_null=True)
-        puesto_id = serializers.IntegerField(allow_null=True)
-        activo = serializers.BooleanField()
-        deleted_at = serializers.DateTimeField(allow_null=True)
-
+    # ---------- Altas / cambios masivos ----------
     @extend_schema(
-        summary="Historial de cambios",
-        description="Devuelve el historial auditado del empleado (django-simple-history).",
-        responses={200: OpenApiResponse(response=_HistoryRecordSerializer(many=True))},
+        summary="Alta/cambio masivo",
+        description=(
+            "POST: lista de empleados nuevos. PATCH: lista de cambios parciales con `id`.\n"
+            "Únicos y catálogos se validan por lote; los errores se reportan por fila "
+            "(`index` = posición en la lista). Si hay errores no se escribe nada, salvo "
+            "con `?partial=1`, que escribe las filas válidas."
+        ),
+        request=EmpleadoBulkRowSerializer(many=True),
+        responses={
+            200: OpenApiTypes.OBJECT,
+            201: OpenApiTypes.OBJECT,
+            400: OpenApiTypes.OBJECT,
+        },
         examples=[
             OpenApiExample(
-                "Ejemplo",
-                value=[
-                    {
-                        "history_id": 1,
-                        "history_date": "2025-08-24T18:00:00Z",
-                        "history_user": "admin",
-                        "history_type": "+",
-                        "num_empleado": "E001",
-                        "nombres": "Juan",
-                        "apellidos": "Pérez López",
-                        "departamento_id": 1,
-                        "puesto_id": 2,
-                        "activo": True,
-                        "deleted_at": None,
-                    }
-                ],
+                "Con errores",
+                value={
+                    "created": 0,
+                    "ids": [],
+                    "errors": [
+                        {
+                            "index": 3,
+                            "errors": {
+                                "curp": ["Ya existe un empleado con este curp."]
+                            },
+                        }
+                    ],
+                },
+                response_only=True,
+                status_codes=["400"],
             )
         ],
     )
-    @action(detail=True, methods=["get"], url_path="history")
-    def history(self, request: Request, pk: str | None = None) -> Response:
-        obj = self.get_object()
-        records: list[dict] = []
-        for h in obj.history.select_related("history_user").order_by("-history_date"):
-            records.append(
+    @action(detail=False, methods=["post", "patch"], url_path="bulk")
+    def bulk_upsert(self, request: Request) -> Response:
+        rows = request.data
+        if not isinstance(rows, list):
+            return Response(
+                {"detail": "Se espera una lista de objetos."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        max_rows = getattr(settings, "EMPLEADOS_BULK_MAX_ROWS", 5000)
+        if len(rows) > max_rows:
+            return Response(
+                {"detail": f"Máximo {max_rows} filas por petición."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        creating = request.method == "POST"
+        instances = None
+        if not creating:
+            ids = [row.get("id") for row in rows if isinstance(row, dict)]
+            instances = Empleado.objects.select_related(
+                "departamento", "puesto"
+            ).in_bulk([pk for pk in ids if isinstance(pk, int) or str(pk).isdigit()])
+        valid, errors, catalogs = bulk.validate_batch(rows, instances)
+
+        key = "created" if creating else "updated"
+        report = [{"index": i, "errors": errors[i]} for i in sorted(errors)]
+        if errors and request.query_params.get("partial") not in ("1", "true"):
+            return Response(
+                {key: 0, "ids": [], "errors": report},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            if creating:
+                objs = bulk.create_empleados(
+                    [v for _, _, v in valid], catalogs, request.user
+                )
+            else:
+                objs = bulk.update_empleados(
+                    [inst for _, inst, _ in valid],
+                    [v for _, _, v in valid],
+                    catalogs,
+                    request.user,
+                )
+        except IntegrityError as exc:
+            # Carrera con otra escritura entre la validación y el INSERT/UPDATE
+            fields = bulk.integrity_error_fields(exc)
+            if not fields:
+                raise
+            return Response(
                 {
-                    "history_id": h.pk,
-                    "history_date": h.history_date.isoformat(),
-                    "history_user": str(h.history_user) if h.history_user else None,
-                    "history_type": h.history_type,
-                    "num_empleado": h.num_empleado,
-                    "nombres": h.nombres,
-                    "apellidos": f"{getattr(h, 'apellido_paterno', '')} {getattr(h, 'apellido_materno', '')}".strip(),
-                    "departamento_id": getattr(h, "departamento_id", None),
-                    "puesto_id": getattr(h, "puesto_id", None),
-                    "activo": getattr(h, "activo", None),
-                    "deleted_at": h.deleted_at.isoformat() if getattr(h, "deleted_at", None) else None,
-                }
+                    "detail": "Conflicto de unicidad al escribir; reintente la operación.",
+                    "fields": fields,
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(
+            {key: len(objs), "ids": [obj.pk for obj in objs], "errors": report},
+            status=status.HTTP_201_CREATED if creating else status.HTTP_200_OK,
+        )
+
+    @extend_schema(
+        summary="Importación masiva (XLSX/CSV)",
+        description=(
+            "Multipart con `archivo` (.xlsx o .csv, primera fila = encabezados con los "
+            "nombres de campo). Valida por bloques contra las reglas y los únicos existentes "
+            "y escribe las filas válidas. Con `dry_run=1` sólo devuelve el reporte de errores."
+        ),
+        request={
+            "multipart/form-data": {
+                "type": "object",
+                "properties": {
+                    "archivo": {"type": "string", "format": "binary"},
+                    "dry_run": {"type": "boolean"},
+                },
+                "required": ["archivo"],
+            }
+        },
+        responses={200: OpenApiTypes.OBJECT, 400: OpenApiTypes.OBJECT},
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser],
+    )
+    def import_file(self, request: Request) -> Response:
+        archivo = request.FILES.get("archivo")
+        if archivo is None:
+            return Response(
+                {"archivo": ["Este campo es requerido."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        formato = archivo.name.rsplit(".", 1)[-1].lower()
+        if formato not in IMPORT_FORMATS:
+            return Response(
+                {"archivo": ["Formato no soportado (xlsx o csv)."]},
+                status=status.HTTP_400_BAD_REQUEST,
             )
-        return Response(records)
+        dry_run = str(
+            request.data.get("dry_run", request.query_params.get("dry_run", ""))
+        ).lower()
+        try:
+            report = import_empleados(
+                archivo,
+                formato,
+                dry_run=dry_run in ("1", "true", "yes"),
+                user=request.user,
+            )
+        except (InvalidFileException, zipfile.BadZipFile, UnicodeDecodeError):
+            return Response(
+                {"archivo": ["No se pudo leer el archivo."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        # CSV mal formado o choque de únicos al escribir: el error va en sus filas
+        if report["unreadable"] or report["conflict_fields"]:
+            return Response(report, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report)
+
+    class _BulkIdsSerializer(serializers.Serializer):
+        ids = serializers.ListField(
+            child=serializers.IntegerField(), allow_empty=False, max_length=10000
+        )
+
+    def _bulk_soft_delete(self, request: Request, restore: bool) -> Response:
+        ser = self._BulkIdsSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        qs = Empleado.all_objects.filter(pk__in=ser.validated_data["ids"])
+        rows = (
+            qs.restore(user=request.user)
+            if restore
+            else qs.soft_delete(user=request.user)
+        )
+        return Response({"affected": rows})
+
+    @extend_schema(
+        summary="Soft delete masivo",
+        description="Borra lógicamente los `ids` vivos: un UPDATE y un INSERT de historial por lote.",
+        request=_BulkIdsSerializer,
+        responses={200: OpenApiTypes.OBJECT},
+        examples=[
+            OpenApiExample("Resultado", value={"affected": 120}, response_only=True)
+        ],
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk-soft-delete",
+        permission_classes=[IsRHAdmin],
+    )
+    def bulk_soft_delete(self, request: Request) -> Response:
+        return self._bulk_soft_delete(request, restore=False)
+
+    @extend_schema(
+        summary="Restauración masiva",
+        description="Restaura los `ids` borrados lógicamente: un UPDATE y un INSERT de historial por lote.",
+        request=_BulkIdsSerializer,
+        responses={200: OpenApiTypes.OBJECT},
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk-restore",
+        permission_classes=[IsRHAdmin],
+    )
+    def bulk_restore(self, request: Request) -> Response:
+        return self._bulk_soft_delete(request, restore=True)
+
+    # ---------- Headcount ----------
+    @extend_schema(
+        summary="Headcount",
+        description=(
+            "Plantilla viva total y desglosada por activo, género, departamento y puesto. "
+            "Se lee de una tabla agregada que se mantiene en cada escritura "
+            "(`manage.py rebuild_headcount` la recalcula)."
+        ),
+        responses={200: OpenApiTypes.OBJECT},
+        examples=[
+            OpenApiExample(
+                "Resultado",
+                value={
+                    "total": 3,
+                    "activo": {"true": 2, "false": 1},
+                    "genero": [{"genero": "F", "label": "Femenino", "total": 3}],
+                    "departamento": [{"id": 1, "nombre": "Sistemas", "total": 3}],
+                    "puesto": [{"id": None, "nombre": None, "total": 3}],
+                },
+                response_only=True,
+            )
+        ],
+    )
+    @action(detail=False, methods=["get"], url_path="stats")
+    def stats(self, request: Request) -> Response:
+        return Response(headcount(scope=scope_q(request.user)))
 
     # ---------- Helpers export ----------
     def _apply_front_filters(self, qs):
@@ -267,75 +573,197 @@ class EmpleadoViewSet(viewsets.ModelViewSet):
         qs = self._apply_front_filters(qs)
         return qs.select_related("departamento", "puesto")
 
+    @classmethod
+    def export_queryset_for(cls, params: dict[str, list[str]], user):
+        """
+        Reconstruye fuera de un request (worker de exportación) el mismo
+        queryset que `export/excel` con esos query params y ese usuario
+        (obligatorio: su alcance acota las filas).
+        """
+        http_request = HttpRequest()
+        http_request.method = "GET"
+        query = QueryDict(mutable=True)
+        for key, values in params.items():
+            query.setlist(key, list(values))
+        http_request.GET = query
+        request = Request(http_request)
+        request.user = user
+        view = cls(
+            request=request,
+            action="export_excel",
+            format_kwarg=None,
+            args=(),
+            kwargs={},
+        )
+        return view._base_queryset_for_export()
+
+    # ---------- Exportación asíncrona ----------
+    def _get_export_job(self, job_id: str) -> ExportJob:
+        job = ExportJob.objects.filter(pk=job_id).first()
+        user = self.request.user
+        if job is None or (
+            job.requested_by_id != user.pk and not in_groups(user, GROUP_ADMIN)
+        ):
+            raise Http404
+        return job
+
+    @extend_schema(
+        summary="Encolar exportación",
+        description=(
+            "Crea (o reutiliza, si hay uno reciente con los mismos filtros) un job de "
+            "exportación. Los filtros van en el query string o en el body como objeto. "
+            "Lo procesa `manage.py run_export_jobs`."
+        ),
+        request=OpenApiTypes.OBJECT,
+        responses={202: ExportJobSerializer, 200: ExportJobSerializer},
+    )
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="export",
+        permission_classes=[IsAuthenticated],
+    )
+    def export_enqueue(self, request: Request) -> Response:
+        self.get_as_of()  # valida antes de encolar
+        query = request.query_params.copy()
+        if isinstance(request.data, dict):
+            for key, value in request.data.items():
+                query.setlist(
+                    key,
+                    (
+                        [str(v) for v in value]
+                        if isinstance(value, list)
+                        else [str(value)]
+                    ),
+                )
+        job, created = enqueue_export(normalize_params(query), request.user)
+        data = ExportJobSerializer(job, context={"request": request}).data
+        return Response(
+            data, status=status.HTTP_202_ACCEPTED if created else status.HTTP_200_OK
+        )
+
+    @extend_schema(
+        summary="Estado de exportación", responses={200: ExportJobSerializer}
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"export/(?P<job_id>[0-9a-f-]{36})",
+        permission_classes=[IsAuthenticated],
+    )
+    def export_status(self, request: Request, job_id: str) -> Response:
+        job = self._get_export_job(job_id)
+        return Response(ExportJobSerializer(job, context={"request": request}).data)
+
+    @extend_schema(
+        summary="Descargar exportación",
+        responses={(200, XLSX_CONTENT_TYPE): OpenApiTypes.BINARY},
+    )
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"export/(?P<job_id>[0-9a-f-]{36})/download",
+        permission_classes=[IsAuthenticated],
+    )
+    def export_download(self, request: Request, job_id: str) -> FileResponse:
+        job = self._get_export_job(job_id)
+        path = (
+            job_path(job)
+            if job.status == ExportJob.STATUS_DONE and job.archivo
+            else None
+        )
+        if path is None or not path.exists():
+            raise Http404
+        return FileResponse(
+            open(path, "rb"),
+            as_attachment=True,
+            filename=f"empleados_{job.created_at.date().isoformat()}.xlsx",
+            content_type=XLSX_CONTENT_TYPE,
+        )
+
     # ---------- Exportación SOLO Excel ----------
     @extend_schema(
         summary="Exportación a Excel",
         description="Descarga un XLSX con el resultado filtrado/ordenado actual.",
-        responses={(200, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"): OpenApiTypes.BINARY},
+        parameters=[AS_OF_PARAMETER],
+        responses={(200, XLSX_CONTENT_TYPE): OpenApiTypes.BINARY},
     )
     @action(detail=False, methods=["get"], url_path="export/excel")
-    def export_excel(self, request: Request, *args, **kwargs) -> FileResponse:
+    def export_excel(self, request: Request, *args, **kwargs) -> HttpResponse:
         qs = self._base_queryset_for_export().order_by("id")
+        filename = f"empleados_{date.today().isoformat()}.xlsx"
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Empleados"
-
-        headers = [
-            "ID",
-            "Num. empleado",
-            "Nombres",
-            "Apellido paterno",
-            "Apellido materno",
-            "Departamento",
-            "Puesto",
-            "Fecha ingreso",
-            "Email",
-            "Teléfono",
-            "Activo",
-        ]
-        ws.append(headers)
-        for cell in ws[1]:
-            cell.font = Font(bold=True)
-        ws.freeze_panes = "A2"
-
-        for e in qs:
-            ws.append(
-                [
-                    e.id,
-                    e.num_empleado or "",
-                    e.nombres or "",
-                    e.apellido_paterno or "",
-                    e.apellido_materno or "",
-                    getattr(getattr(e, "departamento", None), "nombre", "") or "",
-                    getattr(getattr(e, "puesto", None), "nombre", "") or "",
-                    e.fecha_ingreso if getattr(e, "fecha_ingreso", None) else "",
-                    e.email or "",
-                    getattr(e, "telefono", "") or "",
-                    "Sí" if getattr(e, "activo", False) else "No",
-                ]
+        if not export_cache.cache_enabled():
+            # No es streaming puro: el XLSX es un zip y openpyxl lo arma completo
+            # antes de escribirlo, así que se bufferiza en disco (no en memoria).
+            # FileResponse lo envía por bloques y lo cierra (y borra) al terminar.
+            tmp = tempfile.TemporaryFile()  # noqa: SIM115 - lo cierra FileResponse
+            try:
+                write_empleados_xlsx(qs, tmp)
+            except BaseException:
+                tmp.close()
+                raise
+            tmp.seek(0)
+            resp = FileResponse(
+                tmp,
+                as_attachment=True,
+                filename=filename,
+                content_type=XLSX_CONTENT_TYPE,
             )
-
-        # Auto ancho simple
-        for col in ws.columns:
-            max_len = 10
-            for cell in col:
-                val = str(cell.value) if cell.value is not None else ""
-                if len(val) > max_len:
-                    max_len = len(val)
-            ws.column_dimensions[col[0].column_letter].width = min(max_len + 2, 40)
-
-        # Respuesta binaria robusta
-        bio = BytesIO()
-        wb.save(bio)     # openpyxl crea el ZIP XLSX correcto
-        bio.seek(0)
-
-        filename = f"empleados_{date.today().isoformat()}.xlsx"
-        resp = FileResponse(
-            bio,
-            as_attachment=True,
-            filename=filename,
-            content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            resp["Cache-Control"] = "no-transform"
+            return resp
+
+        # Mismos filtros + mismos datos → misma llave → mismo archivo (y ETag)
+        key = export_cache.export_key(
+            "xlsx",
+            normalize_params(request.query_params),
+            scope=scope_token(request.user),
         )
+        etag = f'"{key}"'
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            resp = HttpResponseNotModified()
+        else:
+            cached = export_cache.open_cached(key, "xlsx") or export_cache.store(
+                key, "xlsx", lambda fh: write_empleados_xlsx(qs, fh)
+            )
+            resp = FileResponse(
+                cached,
+                as_attachment=True,
+                filename=filename,
+                content_type=XLSX_CONTENT_TYPE,
+            )
+        resp["ETag"] = etag
+        resp["Cache-Control"] = "private, no-cache, no-transform"
+        return resp
+
+    # ---------- Exportación en streaming (integraciones) ----------
+    def _streaming_export(
+        self, stream, content_type: str, ext: str
+    ) -> StreamingHttpResponse:
+        qs = self._base_queryset_for_export().order_by("id")
+        resp = StreamingHttpResponse(stream(qs), content_type=content_type)
+        filename = f"empleados_{date.today().isoformat()}.{ext}"
+        resp["Content-Disposition"] = f'attachment; filename="{filename}"'
         resp["Cache-Control"] = "no-transform"
+        resp["X-Accel-Buffering"] = "no"  # nginx: no acumular el stream
         return resp
+
+    @extend_schema(
+        summary="Exportación CSV (streaming)",
+        description="Filas crudas con los mismos filtros que export/excel; memoria constante.",
+        parameters=[AS_OF_PARAMETER],
+        responses={(200, "text/csv"): OpenApiTypes.BINARY},
+    )
+    @action(detail=False, methods=["get"], url_path="export/csv")
+    def export_csv(self, request: Request, *args, **kwargs) -> StreamingHttpResponse:
+        return self._streaming_export(stream_csv, CSV_CONTENT_TYPE, "csv")
+
+    @extend_schema(
+        summary="Exportación NDJSON (streaming)",
+        description="Un objeto JSON por línea, mismos filtros que export/excel; memoria constante.",
+        parameters=[AS_OF_PARAMETER],
+        responses={(200, NDJSON_CONTENT_TYPE): OpenApiTypes.BINARY},
+    )
+    @action(detail=False, methods=["get"], url_path="export/ndjson")
+    def export_ndjson(self, request: Request, *args, **kwargs) -> StreamingHttpResponse:
+        return self._streaming_export(stream_ndjson, NDJSON_CONTENT_TYPE, "ndjson")
@@ -61,17 +61,19 @@ INSTALLED_APPS = [
 # 
 # Middleware
 # 
+# Los "Lean*" se saltan en rutas de API con JWT (LEAN_MIDDLEWARE_PREFIXES); ver core.middleware
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",  # lo más arriba posible y antes de CommonMiddleware
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    "core.middleware.LeanSessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.middleware.LeanCsrfViewMiddleware",
+    "core.middleware.LeanAuthenticationMiddleware",
     "simple_history.middleware.HistoryRequestMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.LeanMessageMiddleware",
+    "core.middleware.LeanXFrameOptionsMiddleware",
 ]
+LEAN_MIDDLEWARE_PREFIXES = ("/api/v1/", "/api/token", "/api/auth/jwt/", "/api/ping", "/api/me")
 
 # 
 # URLs / Templates / WSGI
@@ -147,6 +149,21 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = "/media/"
 MEDIA_ROOT = BASE_DIR / "media"
 
+# 
+# Cache
+# 
+# LocMem por proceso en dev. Con varios workers usa un backend compartido
+# (p. ej. CACHE_BACKEND=django.core.cache.backends.redis.RedisCache) para que
+# las invalidaciones por versión de datos lleguen a todos.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "rh-api"),
+    }
+}
+# Con LocMem las versiones de datos/roles vencen a los N s (retraso máx. entre workers; check core.W001)
+CACHE_LOCAL_VERSION_TTL = int(os.getenv("CACHE_LOCAL_VERSION_TTL", "30"))
+
 # 
 # Auto PK
 # 
@@ -161,7 +178,8 @@ REST_FRAMEWORK = {
         "rest_framework.permissions.AllowAny" if DEBUG else "rest_framework.permissions.IsAuthenticated"
     ],
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # JWT de SimpleJWT + claims de rol (lecturas sin consultas a User/Group)
+        "core.authentication.ClaimsJWTAuthentication",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_FILTER_BACKENDS": [
@@ -184,7 +202,15 @@ REST_FRAMEWORK = {
         if DEBUG else
         ("rest_framework.renderers.JSONRenderer",)
     ),
+    # Endpoints de token (core.throttling); el resto de la API no se limita
+    "DEFAULT_THROTTLE_RATES": {
+        "auth": os.getenv("THROTTLE_AUTH", "30/min"),  # login por IP
+        "auth_user": os.getenv("THROTTLE_AUTH_USER", "10/min"),  # login por username
+        "auth_token": os.getenv("THROTTLE_AUTH_TOKEN", "120/min"),  # refresh/verify/blacklist por IP
+    },
 }
+# Verificaciones de contraseña simultáneas POR PROCESO (el excedente recibe 503 sin esperar)
+LOGIN_MAX_CONCURRENT = int(os.getenv("LOGIN_MAX_CONCURRENT", "2"))
 
 SPECTACULAR_SETTINGS = {
     "TITLE": "GV-RH API",
@@ -206,7 +232,13 @@ SIMPLE_JWT = {
     "ALGORITHM": "HS256",
     "SIGNING_KEY": SECRET_KEY,
     "AUTH_HEADER_TYPES": ("Bearer",),
+    # Lista negra consultada desde memoria (core.blacklist)
+    "TOKEN_REFRESH_SERIALIZER": "core.jwt.CachedTokenRefreshSerializer",
+    "TOKEN_VERIFY_SERIALIZER": "core.jwt.CachedTokenVerifySerializer",
+    "TOKEN_BLACKLIST_SERIALIZER": "core.jwt.CachedTokenBlacklistSerializer",
 }
+# Máx. antigüedad (s) de la lista negra en memoria antes de releer altas nuevas
+JWT_BLACKLIST_SYNC_SECONDS = float(os.getenv("JWT_BLACKLIST_SYNC_SECONDS", "1"))
 
 # 
 # Seguridad (producción)
@@ -247,7 +279,34 @@ LOGGING = {
     },
 }
 
+# 
+# Empleados
+# 
+# Búsqueda ?q=: "auto" (trigram en PostgreSQL), "indexed" o "legacy" (OR icontains)
+EMPLEADOS_SEARCH_BACKEND = os.getenv("EMPLEADOS_SEARCH_BACKEND", "auto")
+# Listado con serialización rápida desde .values() (mismo JSON que el serializer)
+EMPLEADOS_FAST_LIST = env_bool("EMPLEADOS_FAST_LIST", True)
+# Máximo de filas por petición en POST/PATCH /empleados/bulk/
+EMPLEADOS_BULK_MAX_ROWS = int(os.getenv("EMPLEADOS_BULK_MAX_ROWS", "5000"))
+
+# Exportaciones asíncronas (worker: python manage.py run_export_jobs)
+EXPORT_JOBS_DIR = "exports/jobs"  # relativo a MEDIA_ROOT
+EXPORT_JOB_TTL_SECONDS = int(os.getenv("EXPORT_JOB_TTL_SECONDS", str(24 * 3600)))
+EXPORT_JOB_REUSE_SECONDS = int(os.getenv("EXPORT_JOB_REUSE_SECONDS", "300"))
+# Cache de export/excel por filtros + versión de datos (LRU; 0 = desactivado)
+EXPORT_CACHE_DIR = "exports/cache"  # relativo a MEDIA_ROOT
+EXPORT_CACHE_MAX_BYTES = int(os.getenv("EXPORT_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+
+# TTL (s) del COUNT(*) cacheado en listas paginadas; 0 = contar siempre
+API_COUNT_CACHE_TIMEOUT = int(os.getenv("API_COUNT_CACHE_TIMEOUT", "300"))
+
 # 
 # Opcionales cómodos
 # 
 APPEND_SLASH = True  # redirige /ruta a /ruta/
+
+# 
+# Historial (retención: python manage.py prune_history)
+# 
+HISTORY_RETENTION_DAYS = int(os.getenv("HISTORY_RETENTION_DAYS", "730"))
+HISTORY_ARCHIVE_DIR = Path(os.getenv("HISTORY_ARCHIVE_DIR", str(BASE_DIR / "archive" / "history")))
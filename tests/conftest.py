@@ -0,0 +1,93 @@
+import itertools
+
+import pytest
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from catalogos import cache as catalog_cache
+from catalogos.models import Departamento, Puesto
+from core import blacklist as jwt_blacklist
+from empleados.models import Empleado
+
+_seq = itertools.count(1)
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    # Conteos/versiones cacheados no deben filtrarse entre tests
+    cache.clear()
+    catalog_cache.clear()
+    jwt_blacklist.clear()
+    yield
+    cache.clear()
+    catalog_cache.clear()
+    jwt_blacklist.clear()
+
+
+@pytest.fixture
+def advance_cache_clock(monkeypatch):
+    """Adelanta el reloj de LocMem (simula el vencimiento de llaves con TTL)."""
+    import time as real_time
+
+    from django.core.cache.backends import locmem
+
+    offset = [0.0]
+
+    class _Clock:
+        @staticmethod
+        def time():
+            return real_time.time() + offset[0]
+
+    monkeypatch.setattr(locmem, "time", _Clock)
+
+    def advance(seconds: float) -> None:
+        offset[0] += seconds
+
+    return advance
+
+
+@pytest.fixture(autouse=True)
+def _media_root(settings, tmp_path):
+    # Exportaciones cacheadas/jobs escriben bajo MEDIA_ROOT
+    settings.MEDIA_ROOT = str(tmp_path / "media")
+
+
+@pytest.fixture
+def superuser(db):
+    return User.objects.create_superuser(username="root", password="secret123")
+
+
+@pytest.fixture
+def api_admin(superuser):
+    c = APIClient()
+    c.force_authenticate(user=superuser)
+    return c
+
+
+@pytest.fixture
+def catalogo(db):
+    dep = Departamento.objects.create(nombre="Sistemas", clave="SIS")
+    pst = Puesto.objects.create(nombre="Desarrollador", clave="DEV", departamento=dep)
+    return dep, pst
+
+
+@pytest.fixture
+def make_empleado(db):
+    """Crea empleados válidos con identificadores únicos."""
+
+    def _make(**kwargs):
+        n = next(_seq)
+        data = {
+            "num_empleado": f"E{n:04d}",
+            "nombres": "Juan",
+            "apellido_paterno": "Perez",
+            "curp": f"ABCD{n:06d}HDFLRN09",
+            "rfc": f"ABC{n:06d}XYZ",
+            "nss": f"{n:011d}",
+            "email": f"e{n}@example.com",
+        }
+        data.update(kwargs)
+        return Empleado.objects.create(**data)
+
+    return _make
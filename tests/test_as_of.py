@@ -0,0 +1,102 @@
+import datetime
+
+from django.utils import timezone
+
+from empleados.models import Empleado
+
+
+def _backdate(obj, days_ago):
+    # Un registro de historial por día a partir de `days_ago` días atrás
+    history = Empleado.history.model
+    base = timezone.now() - datetime.timedelta(days=days_ago)
+    for i, record in enumerate(
+        history.objects.filter(id=obj.pk).order_by("history_id")
+    ):
+        history.objects.filter(pk=record.pk).update(
+            history_date=base + datetime.timedelta(days=i)
+        )
+
+
+def _day(days_ago):
+    return timezone.localdate(
+        timezone.now() - datetime.timedelta(days=days_ago)
+    ).isoformat()
+
+
+def test_lista_as_of_reconstruye_la_plantilla(api_admin, make_empleado, catalogo):
+    dep, _ = catalogo
+    ana = make_empleado(nombres="Ana", departamento=dep)
+    ana.nombres = "Ana María"
+    ana.save()
+    _backdate(ana, 10)  # alta hace 10 días, cambio hace 9
+    beto = make_empleado(nombres="Beto")
+    beto.delete()  # borrado lógico
+    _backdate(beto, 5)
+    make_empleado(nombres="Nuevo")  # alta de hoy: no existía antes
+
+    url = "/api/v1/empleados/"
+    rows = api_admin.get(url, {"as_of": _day(10)}).json()["results"]
+    assert [r["nombres"] for r in rows] == ["Ana"]
+    assert rows[0]["id"] == ana.pk and rows[0]["departamento_nombre"] == "Sistemas"
+
+    names = {
+        r["nombres"] for r in api_admin.get(url, {"as_of": _day(5)}).json()["results"]
+    }
+    assert names == {"Ana María", "Beto"}
+    names = {
+        r["nombres"] for r in api_admin.get(url, {"as_of": _day(4)}).json()["results"]
+    }
+    assert names == {"Ana María"}
+    deleted = api_admin.get(
+        url, {"as_of": _day(4), "include_deleted": 1, "deleted": "true"}
+    ).json()
+    assert [r["nombres"] for r in deleted["results"]] == ["Beto"]
+
+    # Filtros y orden aplican sobre la plantilla reconstruida
+    filtered = api_admin.get(url, {"as_of": _day(5), "departamento": dep.pk}).json()[
+        "results"
+    ]
+    assert [r["nombres"] for r in filtered] == ["Ana María"]
+
+    assert api_admin.get(url, {"as_of": "ayer"}).status_code == 400
+
+
+def test_as_of_keyset_y_exportaciones(api_admin, make_empleado):
+    emps = [make_empleado(nombres=f"N{i}") for i in range(5)]
+    for emp in emps:
+        emp.nombres += "-actual"
+        emp.save()
+        _backdate(emp, 3)  # alta hace 3 días, cambio hace 2
+
+    as_of = _day(3)
+    page = api_admin.get(
+        "/api/v1/empleados/", {"as_of": as_of, "page_size": 2, "cursor": ""}
+    ).json()
+    seen = [r["nombres"] for r in page["results"]]
+    while page.get("next"):
+        page = api_admin.get(page["next"]).json()
+        seen += [r["nombres"] for r in page["results"]]
+    assert seen == [f"N{i}" for i in range(5)]
+
+    resp = api_admin.get("/api/v1/empleados/export/csv/", {"as_of": as_of})
+    body = b"".join(resp.streaming_content).decode("utf-8-sig")
+    assert "N0" in body and "actual" not in body
+    assert (
+        api_admin.get("/api/v1/empleados/export/excel/", {"as_of": as_of}).status_code
+        == 200
+    )
+
+
+def test_as_of_con_busqueda(api_admin, make_empleado, settings):
+    # Con el backend indexado, el historial (sin search_text) usa el OR de icontains
+    settings.EMPLEADOS_SEARCH_BACKEND = "indexed"
+    ana = make_empleado(nombres="Ana")
+    make_empleado(nombres="Beto")
+    ana.nombres = "Ana María"
+    ana.save()
+    for emp in Empleado.objects.all():
+        _backdate(emp, 3)
+
+    resp = api_admin.get("/api/v1/empleados/", {"as_of": _day(3), "q": "ana"})
+    assert resp.status_code == 200
+    assert [r["nombres"] for r in resp.json()["results"]] == ["Ana"]
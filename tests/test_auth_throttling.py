@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+from django.contrib.auth.models import User
+from rest_framework.test import APIClient
+
+from core import throttling
+from core.throttling import SlidingWindowThrottle
+
+
+@pytest.fixture
+def rates(settings):
+    def _set(**rates):
+        settings.REST_FRAMEWORK = {
+            **settings.REST_FRAMEWORK,
+            "DEFAULT_THROTTLE_RATES": rates,
+        }
+
+    return _set
+
+
+def _login(username, password="secret123"):
+    return APIClient().post(
+        "/api/token/", {"username": username, "password": password}, format="json"
+    )
+
+
+def test_login_limitado_por_username(db, rates):
+    rates(auth="100/min", auth_user="3/min", auth_token="100/min")
+    User.objects.create_user("ana", "ana@example.com", "secret123")
+    assert [_login("ana", "mala").status_code for _ in range(3)] == [401, 401, 401]
+
+    resp = _login("ANA ")  # mismo username normalizado
+    assert resp.status_code == 429 and int(resp["Retry-After"]) > 0
+    assert _login("otra").status_code == 401  # otro username sigue pasando
+
+
+def test_login_limitado_por_ip(db, rates):
+    rates(auth="2/min", auth_user="100/min", auth_token="100/min")
+    assert _login("a").status_code == 401
+    assert _login("b").status_code == 401
+    assert _login("c").status_code == 429
+    # refresh/verify tienen su propio scope
+    resp = APIClient().post("/api/token/verify/", {"token": "x"}, format="json")
+    assert resp.status_code == 401
+
+
+def test_ventana_deslizante(rates):
+    rates(auth_user="10/min")
+
+    class Throttle(SlidingWindowThrottle):
+        scope = "auth_user"
+        now = 600.0  # inicio de una ventana de 60 s
+
+        def timer(self):
+            return Throttle.now
+
+        def get_ident_key(self, request, view):
+            return "k"
+
+    throttle = Throttle()
+    assert all(throttle.allow_request(None, None) for _ in range(10))
+    assert not throttle.allow_request(None, None)
+
+    # 30 s dentro de la siguiente ventana la anterior pesa la mitad: 5 lugares
+    Throttle.now = 690.0
+    assert sum(throttle.allow_request(None, None) for _ in range(10)) == 5
+    assert throttle.wait() > 0
+
+
+def test_semaforo_de_contraseñas(db, monkeypatch):
+    gate = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(throttling, "_gate", gate)
+    User.objects.create_user("ana", "ana@example.com", "secret123")
+
+    gate.acquire()  # otro login ocupando el único lugar
+    resp = _login("ana")
+    assert resp.status_code == 503 and resp["Retry-After"] == "1"
+    gate.release()
+    assert _login("ana").status_code == 200
+    assert gate.acquire(blocking=False)  # se liberó al terminar
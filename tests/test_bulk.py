@@ -0,0 +1,105 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from empleados.models import Empleado
+
+URL = "/api/v1/empleados/bulk/"
+
+
+def _row(n, **kwargs):
+    data = {
+        "num_empleado": f"B{n:04d}",
+        "nombres": "Carga",
+        "apellido_paterno": "Masiva",
+        "curp": f"BULK{n:06d}HDFLRN09",
+        "rfc": f"BLK{n:06d}XYZ",
+        "nss": f"{90000000000 + n:011d}",
+        "email": f"b{n}@example.com",
+    }
+    data.update(kwargs)
+    return data
+
+
+def test_bulk_create_consultas_constantes(api_admin, catalogo):
+    dep, pst = catalogo
+    rows = [_row(n, departamento=dep.pk, puesto=pst.pk) for n in range(200)]
+    with CaptureQueriesContext(connection) as ctx:
+        resp = api_admin.post(URL, rows, format="json")
+    assert resp.status_code == 201, resp.data
+    assert resp.data["created"] == 200 and len(resp.data["ids"]) == 200
+    assert len(ctx.captured_queries) < 20
+
+    emp = Empleado.objects.get(num_empleado="B0007")
+    assert emp.history.count() == 1
+    assert "sistemas" in emp.search_text
+
+
+def test_bulk_create_errores_por_fila(api_admin, make_empleado):
+    existing = make_empleado()
+    rows = [
+        _row(1),
+        _row(2, curp=existing.curp),  # ya existe
+        _row(3, email="b1@example.com"),  # repetido en el lote
+        _row(4, departamento=999),  # FK inexistente
+        _row(5, nss="123"),  # formato
+        "no es objeto",
+    ]
+    resp = api_admin.post(URL, rows, format="json")
+    assert resp.status_code == 400
+    errors = {e["index"]: e["errors"] for e in resp.data["errors"]}
+    assert set(errors) == {1, 2, 3, 4, 5}
+    assert "curp" in errors[1] and "email" in errors[2]
+    assert "departamento" in errors[3] and "nss" in errors[4]
+    assert not Empleado.objects.filter(num_empleado="B0001").exists()
+
+    resp = api_admin.post(f"{URL}?partial=1", rows, format="json")
+    assert resp.status_code == 201 and resp.data["created"] == 1
+
+
+def test_bulk_update(api_admin, catalogo, make_empleado):
+    dep, _ = catalogo
+    a, b = make_empleado(), make_empleado()
+    resp = api_admin.patch(
+        URL,
+        [
+            {"id": a.pk, "nombres": "Cambiado", "email": "otro@example.com"},
+            # b toma el email que a libera en el mismo lote: se rechaza
+            {"id": b.pk, "email": a.email},
+            {"id": a.pk + 1000, "nombres": "X"},
+        ],
+        format="json",
+    )
+    assert resp.status_code == 400
+    assert [e["index"] for e in resp.data["errors"]] == [1, 2]
+    assert "mismo lote" in str(resp.data["errors"][0]["errors"]["email"])
+
+    resp = api_admin.patch(
+        URL,
+        [
+            {
+                "id": a.pk,
+                "nombres": "Cambiado",
+                "departamento": dep.pk,
+                "email": "nuevo@example.com",
+            }
+        ],
+        format="json",
+    )
+    assert resp.status_code == 200 and resp.data["updated"] == 1
+    a.refresh_from_db()
+    assert a.nombres == "Cambiado" and a.departamento_id == dep.pk
+    assert "sistemas" in a.search_text
+    assert a.history.first().history_type == "~"
+
+
+def test_bulk_intercambio_de_unicos_se_rechaza_por_fila(api_admin, make_empleado):
+    a, b = make_empleado(), make_empleado()
+    resp = api_admin.patch(
+        URL,
+        [{"id": a.pk, "curp": b.curp}, {"id": b.pk, "curp": a.curp}],
+        format="json",
+    )
+    assert resp.status_code == 400
+    assert [sorted(e["errors"]) for e in resp.data["errors"]] == [["curp"], ["curp"]]
+    a.refresh_from_db()
+    assert a.curp != b.curp and Empleado.objects.get(pk=b.pk).curp == b.curp
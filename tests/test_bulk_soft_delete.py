@@ -0,0 +1,66 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from empleados.models import Empleado
+
+
+def test_bulk_soft_delete_y_restore(api_admin, superuser, make_empleado):
+    emps = [make_empleado() for _ in range(5)]
+    ids = [e.pk for e in emps[:4]]
+    emps[3].delete()  # ya borrado: no se vuelve a tocar
+    before = {e.pk: e.history.count() for e in emps}
+
+    with CaptureQueriesContext(connection) as ctx:
+        resp = api_admin.post(
+            "/api/v1/empleados/bulk-soft-delete/", {"ids": ids}, format="json"
+        )
+    assert resp.status_code == 200 and resp.data["affected"] == 3
+    updates = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+    assert len(updates) == 1
+    assert Empleado.objects.filter(pk__in=ids).count() == 0
+
+    record = emps[0].history.first()
+    assert record.history_type == "~" and record.deleted_at is not None
+    assert record.history_user == superuser
+    assert emps[0].history.count() == before[emps[0].pk] + 1
+    assert emps[3].history.count() == before[emps[3].pk]
+
+    resp = api_admin.post(
+        "/api/v1/empleados/bulk-restore/", {"ids": ids}, format="json"
+    )
+    assert resp.data["affected"] == 4
+    assert Empleado.objects.filter(pk__in=ids).count() == 4
+    assert emps[0].history.first().deleted_at is None
+
+
+def test_queryset_delete_escribe_historial(make_empleado):
+    emp = make_empleado()
+    Empleado.objects.filter(pk=emp.pk).delete()
+    assert emp.history.first().deleted_at is not None
+    assert Empleado.all_objects.get(pk=emp.pk).deleted_at is not None
+
+
+def test_soft_delete_traslapado_cambia_cada_fila_una_vez(make_empleado):
+    from django.utils import timezone
+
+    from core.models import soft_delete_batch
+
+    first, second = make_empleado(), make_empleado()
+    before = second.history.count()
+    sent = []
+
+    def other_worker(sender, pks, **kwargs):
+        sent.append(pks)
+        if len(sent) == 1:  # otra llamada borra la segunda fila entre lotes
+            Empleado.all_objects.filter(pk=second.pk).update(deleted_at=timezone.now())
+
+    soft_delete_batch.connect(other_worker, sender=Empleado)
+    try:
+        rows = Empleado.objects.filter(pk__in=[first.pk, second.pk]).soft_delete(
+            batch_size=1
+        )
+    finally:
+        soft_delete_batch.disconnect(other_worker, sender=Empleado)
+
+    assert rows == 1 and sent == [[first.pk]]
+    assert second.history.count() == before
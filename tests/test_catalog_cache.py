@@ -0,0 +1,104 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from catalogos import cache as catalog_cache
+from catalogos.models import Departamento
+
+
+def test_lista_de_catalogos_desde_memoria(api_admin, catalogo):
+    first = api_admin.get("/api/v1/departamentos/")
+    assert first.status_code == 200
+    with CaptureQueriesContext(connection) as ctx:
+        again = api_admin.get("/api/v1/departamentos/")
+        puestos = api_admin.get("/api/v1/puestos/")
+    # Sólo los savepoints de ATOMIC_REQUESTS
+    assert [q for q in ctx.captured_queries if "SAVEPOINT" not in q["sql"]] == []
+    assert again.json() == first.json()
+    assert puestos.json()["results"][0]["departamento_nombre"] == "Sistemas"
+    assert (
+        api_admin.get(
+            "/api/v1/departamentos/", HTTP_IF_NONE_MATCH=again["ETag"]
+        ).status_code
+        == 304
+    )
+    # Con filtros se consulta la BD como siempre
+    assert (
+        api_admin.get("/api/v1/departamentos/", {"search": "sis"}).json()["count"] == 1
+    )
+
+
+def test_version_compartida_invalida_el_snapshot(
+    api_admin, catalogo, make_empleado, django_capture_on_commit_callbacks
+):
+    dep, pst = catalogo
+    make_empleado(departamento=dep, puesto=pst)
+    assert catalog_cache.catalog_name(Departamento, dep.pk) == "Sistemas"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        dep.nombre = "Tecnología"
+        dep.save()
+        Departamento.objects.create(nombre="Ventas", clave="VEN")
+    names = [
+        d["nombre"] for d in api_admin.get("/api/v1/departamentos/").json()["results"]
+    ]
+    assert names == ["Tecnología", "Ventas"]
+    emp = api_admin.get("/api/v1/empleados/").json()["results"][0]
+    assert (
+        emp["departamento_nombre"] == "Tecnología"
+        and emp["puesto_nombre"] == "Desarrollador"
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Departamento.objects.filter(nombre="Ventas").soft_delete()
+    names = [
+        d["nombre"] for d in api_admin.get("/api/v1/departamentos/").json()["results"]
+    ]
+    assert names == ["Tecnología"]
+
+
+def test_snapshot_compacto_con_etag_fuerte(
+    api_admin, catalogo, django_capture_on_commit_callbacks
+):
+    dep, pst = catalogo
+    resp = api_admin.get("/api/v1/catalogos/snapshot/")
+    assert resp.status_code == 200
+    assert resp.json() == {
+        "departamentos": [{"id": dep.pk, "nombre": "Sistemas", "clave": "SIS"}],
+        "puestos": [
+            {
+                "id": pst.pk,
+                "nombre": "Desarrollador",
+                "clave": "DEV",
+                "departamento_id": dep.pk,
+            }
+        ],
+    }
+    etag = resp["ETag"]
+    assert not etag.startswith("W/")
+    assert (
+        api_admin.get(
+            "/api/v1/catalogos/snapshot/", HTTP_IF_NONE_MATCH=etag
+        ).status_code
+        == 304
+    )
+
+    with django_capture_on_commit_callbacks(execute=True):
+        pst.delete()
+    resp = api_admin.get("/api/v1/catalogos/snapshot/", HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == 200 and resp.json()["puestos"] == []
+
+
+def test_snapshot_recarga_cambios_de_otro_worker(
+    catalogo, settings, advance_cache_clock
+):
+    settings.CACHE_LOCAL_VERSION_TTL = 5
+    dep, _ = catalogo
+    assert catalog_cache.catalog_name(Departamento, dep.pk) == "Sistemas"
+
+    # Sin callbacks on_commit: la versión local no cambia (como un cambio en otro worker)
+    dep.nombre = "TI"
+    dep.save()
+    assert catalog_cache.catalog_name(Departamento, dep.pk) == "Sistemas"
+
+    advance_cache_clock(6)
+    assert catalog_cache.catalog_name(Departamento, dep.pk) == "TI"
@@ -0,0 +1,88 @@
+import time
+
+from catalogos.models import Departamento
+
+
+def test_detalle_etag_y_last_modified(api_admin, make_empleado):
+    emp = make_empleado(nombres="Ana")
+    url = f"/api/v1/empleados/{emp.pk}/"
+
+    first = api_admin.get(url)
+    assert first.status_code == 200
+    etag, last_modified = first["ETag"], first["Last-Modified"]
+    assert "Authorization" in first["Vary"]
+
+    cached = api_admin.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert cached.status_code == 304 and not cached.content
+    assert api_admin.get(url, HTTP_IF_MODIFIED_SINCE=last_modified).status_code == 304
+    # Otra selección de campos → otro cuerpo → otro ETag
+    assert (
+        api_admin.get(url, {"fields": "id"}, HTTP_IF_NONE_MATCH=etag).status_code == 200
+    )
+
+    emp.nombres = "Ana María"
+    emp.save()
+    changed = api_admin.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200 and changed.data["nombres"] == "Ana María"
+
+
+def test_detalle_cambia_con_catalogo_y_soft_delete(api_admin, catalogo, make_empleado):
+    dep, _ = catalogo
+    emp = make_empleado(departamento=dep)
+    url = f"/api/v1/empleados/{emp.pk}/"
+    etag = api_admin.get(url)["ETag"]
+
+    Departamento.objects.filter(pk=dep.pk).update(
+        nombre="TI", updated_at=dep.updated_at.replace(year=2099)
+    )
+    assert api_admin.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    before = emp.updated_at
+    time.sleep(0.01)
+    emp.delete()
+    emp.refresh_from_db()
+    assert emp.updated_at > before
+    assert api_admin.get(url).status_code == 404
+
+
+def test_lista_etag(api_admin, make_empleado, django_capture_on_commit_callbacks):
+    make_empleado()
+    url = "/api/v1/departamentos/"
+    first = api_admin.get(url)
+    etag = first["ETag"]
+    assert "Last-Modified" not in first
+    assert api_admin.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Departamento.objects.create(nombre="Ventas", clave="VEN")
+    assert api_admin.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    emp_url = "/api/v1/empleados/"
+    etag = api_admin.get(emp_url, {"activo": "true"})["ETag"]
+    assert (
+        api_admin.get(emp_url, {"activo": "true"}, HTTP_IF_NONE_MATCH=etag).status_code
+        == 304
+    )
+    with django_capture_on_commit_callbacks(execute=True):
+        make_empleado()
+    assert (
+        api_admin.get(emp_url, {"activo": "true"}, HTTP_IF_NONE_MATCH=etag).status_code
+        == 200
+    )
+
+
+def test_lista_304_de_otro_worker_vence_con_la_version(
+    api_admin, make_empleado, settings, advance_cache_clock
+):
+    settings.CACHE_LOCAL_VERSION_TTL = 5
+    make_empleado(nombres="Ana")
+    url = "/api/v1/empleados/"
+    etag = api_admin.get(url)["ETag"]
+
+    # Alta sin callbacks on_commit: la versión local no se entera (otro worker)
+    make_empleado(nombres="Beto")
+    assert api_admin.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    advance_cache_clock(6)
+    resp = api_admin.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == 200 and resp.json()["count"] == 2
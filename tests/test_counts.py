@@ -0,0 +1,92 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def _count_queries(ctx):
+    return [q["sql"] for q in ctx.captured_queries if "COUNT(" in q["sql"].upper()]
+
+
+def test_count_cacheado_e_invalidado_en_escritura(
+    api_admin, make_empleado, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        for _ in range(3):
+            make_empleado(nombres="Ana")
+
+    body = api_admin.get("/api/v1/empleados/", {"q": "ana"}).json()
+    assert body["count"] == 3
+    assert body["count_type"] == "exact"
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert api_admin.get("/api/v1/empleados/", {"q": "ana"}).json()["count"] == 3
+    assert _count_queries(ctx) == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        emp = make_empleado(nombres="Ana")
+    assert api_admin.get("/api/v1/empleados/", {"q": "ana"}).json()["count"] == 4
+
+    with django_capture_on_commit_callbacks(execute=True):
+        emp.delete()  # soft delete
+    assert api_admin.get("/api/v1/empleados/", {"q": "ana"}).json()["count"] == 3
+
+
+def test_count_estimated_solo_sin_filtros(api_admin, make_empleado):
+    make_empleado()
+    # En motores sin estadísticas (SQLite) cae a conteo exacto
+    body = api_admin.get("/api/v1/empleados/", {"count": "estimated"}).json()
+    assert body["count_type"] in ("exact", "estimated")
+    body = api_admin.get(
+        "/api/v1/empleados/", {"count": "estimated", "activo": "true"}
+    ).json()
+    assert body["count_type"] == "exact"
+    assert body["count"] == 1
+
+
+def test_count_de_otro_worker_vence_con_la_version(
+    api_admin, make_empleado, settings, advance_cache_clock
+):
+    # Escritura sin callbacks on_commit: como si la hiciera otro worker con su propio LocMem
+    settings.CACHE_LOCAL_VERSION_TTL = 5
+    make_empleado(nombres="Ana")
+    assert api_admin.get("/api/v1/empleados/", {"q": "ana"}).json()["count"] == 1
+    make_empleado(nombres="Ana")
+    assert api_admin.get("/api/v1/empleados/", {"q": "ana"}).json()["count"] == 1
+
+    advance_cache_clock(6)
+    assert api_admin.get("/api/v1/empleados/", {"q": "ana"}).json()["count"] == 2
+
+
+def test_check_avisa_cache_por_proceso(settings):
+    from core.checks import local_cache_check
+
+    settings.DEBUG = False
+    assert [w.id for w in local_cache_check(None)] == ["core.W001"]
+    settings.DEBUG = True
+    assert local_cache_check(None) == []
+
+
+def test_count_estimated_respeta_alcance_y_borrados(
+    api_admin, make_empleado, catalogo, monkeypatch
+):
+    from django.contrib.auth.models import Group, User
+    from rest_framework.test import APIClient
+
+    from core import pagination
+    from core.permissions import GROUP_GERENTE
+
+    monkeypatch.setattr(pagination, "estimated_table_count", lambda model, using: 10)
+    sis, _ = catalogo
+    jefe = make_empleado(departamento=sis)
+    make_empleado().delete()
+
+    body = api_admin.get("/api/v1/empleados/", {"count": "estimated"}).json()
+    assert body["count_type"] == "estimated" and body["count"] == 9  # 10 - 1 borrado
+
+    gerente = User.objects.create_user("gerente", "g@example.com", "secret123")
+    gerente.groups.add(Group.objects.get_or_create(name=GROUP_GERENTE)[0])
+    jefe.usuario = gerente
+    jefe.save()
+    client = APIClient()
+    client.force_authenticate(user=gerente)
+    body = client.get("/api/v1/empleados/", {"count": "estimated"}).json()
+    assert body["count_type"] == "exact" and body["count"] == 1
@@ -0,0 +1,63 @@
+from io import BytesIO, StringIO
+
+from django.core.management import call_command
+from openpyxl import load_workbook
+from rest_framework.test import APIClient
+
+from empleados.models import ExportJob
+
+
+def test_job_de_exportacion_completo(api_admin, make_empleado, settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    make_empleado(nombres="Ana")
+    make_empleado(nombres="Pedro", activo=False)
+
+    resp = api_admin.post("/api/v1/empleados/export/?activo=false", format="json")
+    assert resp.status_code == 202
+    job = resp.json()
+    assert job["status"] == "pending" and job["download_url"] is None
+
+    # Mismos filtros (en el body) → mismo job
+    again = api_admin.post(
+        "/api/v1/empleados/export/", {"activo": "false"}, format="json"
+    )
+    assert again.status_code == 200
+    assert again.json()["id"] == job["id"]
+
+    call_command("run_export_jobs", "--once", stdout=StringIO())
+
+    status = api_admin.get(job["status_url"]).json()
+    assert status["status"] == "done"
+    assert status["filas"] == 1
+
+    download = api_admin.get(status["download_url"])
+    assert download.status_code == 200
+    ws = load_workbook(BytesIO(b"".join(download.streaming_content)))["Empleados"]
+    assert [r[2] for r in ws.iter_rows(min_row=2, values_only=True)] == ["Pedro"]
+
+
+def test_job_ajeno_no_visible(api_admin, make_empleado, django_user_model):
+    job = ExportJob.objects.create(params={}, params_hash="x")
+    other = APIClient()
+    other.force_authenticate(
+        django_user_model.objects.create_user("otro", password="x")
+    )
+    assert other.get(f"/api/v1/empleados/export/{job.id}/").status_code == 404
+    assert api_admin.get(f"/api/v1/empleados/export/{job.id}/").status_code == 200
+
+
+def test_job_sin_solicitante_falla_sin_exportar(
+    api_admin, make_empleado, django_user_model, settings, tmp_path
+):
+    settings.MEDIA_ROOT = tmp_path
+    make_empleado()
+    user = django_user_model.objects.create_user("temporal", password="secret123")
+    job = ExportJob.objects.create(params={}, params_hash="x", requested_by=user)
+    user.delete()  # SET_NULL: el job queda sin solicitante
+
+    call_command("run_export_jobs", "--once", stdout=StringIO())
+
+    job.refresh_from_db()
+    assert job.status == ExportJob.STATUS_FAILED and not job.archivo
+    assert "ya no existe" in job.error
+    assert not list(tmp_path.rglob("*.xlsx"))
@@ -0,0 +1,116 @@
+import csv
+import datetime
+import io
+import json
+from io import BytesIO
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+
+def _xlsx(resp):
+    content = b"".join(resp.streaming_content) if resp.streaming else resp.content
+    return load_workbook(BytesIO(content))["Empleados"]
+
+
+def test_export_excel_streaming(api_admin, catalogo, make_empleado):
+    dep, pst = catalogo
+    make_empleado(
+        nombres="Ana",
+        departamento=dep,
+        puesto=pst,
+        fecha_ingreso=datetime.date(2024, 3, 1),
+    )
+    make_empleado(
+        nombres="Luis", apellido_materno="De la Fuente Villarreal Santos", activo=False
+    )
+
+    resp = api_admin.get("/api/v1/empleados/export/excel")
+    assert resp.status_code == 200
+    assert resp.streaming
+    ws = _xlsx(resp)
+    rows = list(ws.iter_rows(values_only=True))
+    assert rows[0][:3] == ("ID", "Num. empleado", "Nombres")
+    assert rows[1][2] == "Ana" and rows[1][5] == "Sistemas" and rows[1][10] == "Sí"
+    assert rows[2][5] is None and rows[2][10] == "No"
+    assert ws.freeze_panes == "A2"
+    # apellido materno: 30 caracteres + 2
+    assert ws.column_dimensions["E"].width == 32
+    assert ws.column_dimensions["A"].width == 12
+
+
+def test_export_excel_respeta_filtros(api_admin, make_empleado):
+    make_empleado(nombres="Ana")
+    make_empleado(nombres="Pedro", activo=False)
+    ws = _xlsx(api_admin.get("/api/v1/empleados/export/excel", {"activo": "false"}))
+    assert [r[2] for r in ws.iter_rows(min_row=2, values_only=True)] == ["Pedro"]
+
+
+def test_export_csv_y_ndjson(api_admin, catalogo, make_empleado):
+    dep, _ = catalogo
+    make_empleado(
+        nombres="Ana", departamento=dep, fecha_ingreso=datetime.date(2024, 3, 1)
+    )
+    make_empleado(nombres='José, "Pepe"', activo=False)
+
+    resp = api_admin.get("/api/v1/empleados/export/csv")
+    assert resp.status_code == 200 and resp.streaming
+    lines = list(csv.reader(io.StringIO(b"".join(resp.streaming_content).decode())))
+    assert lines[0][:3] == ["id", "num_empleado", "nombres"]
+    assert lines[1][5:8] == ["Sistemas", "", "2024-03-01"]
+    assert lines[2][2] == 'José, "Pepe"' and lines[2][-1] == "false"
+
+    resp = api_admin.get("/api/v1/empleados/export/ndjson", {"activo": "true"})
+    rows = [
+        json.loads(line)
+        for line in b"".join(resp.streaming_content).decode().splitlines()
+    ]
+    assert len(rows) == 1
+    assert rows[0]["departamento_nombre"] == "Sistemas" and rows[0]["activo"] is True
+
+
+def test_export_excel_cache_etag_e_invalidacion(api_admin, make_empleado):
+    emp = make_empleado(nombres="Ana")
+    url = "/api/v1/empleados/export/excel"
+
+    first = api_admin.get(url, {"activo": "true"})
+    etag = first["ETag"]
+    assert first.status_code == 200 and etag
+    assert _xlsx(first).cell(2, 3).value == "Ana"
+
+    # Mismos filtros (en otro orden de parámetros) → misma llave
+    again = api_admin.get(url, {"activo": "true", "page": "3"}, HTTP_IF_NONE_MATCH=etag)
+    assert again.status_code == 304 and again["ETag"] == etag
+    assert api_admin.get(url, {"activo": "false"})["ETag"] != etag
+
+    emp.nombres = "Ana María"
+    emp.save()
+    changed = api_admin.get(url, {"activo": "true"}, HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200 and changed["ETag"] != etag
+    assert _xlsx(changed).cell(2, 3).value == "Ana María"
+
+
+def test_export_cache_lru(settings, make_empleado):
+    import os
+    import time
+
+    from empleados import export_cache
+
+    make_empleado()
+    settings.EXPORT_CACHE_MAX_BYTES = 10
+    directory = export_cache.cache_dir()
+    directory.mkdir(parents=True)
+    old, recent = directory / "a.xlsx", directory / "b.xlsx"
+    old.write_bytes(b"x" * 6)
+    recent.write_bytes(b"y" * 6)
+    past = time.time() - 60
+    os.utime(old, (past, past))
+    os.utime(recent, (past, past))
+    with export_cache.open_cached("b", "xlsx") as fh:  # lo marca como usado
+        assert fh.read() == b"y" * 6
+    assert export_cache.open_cached("zz", "xlsx") is None
+
+    with export_cache.store("c", "xlsx", lambda fh: fh.write(b"z" * 4)) as fh:
+        new = Path(fh.name)
+        assert fh.read() == b"z" * 4
+    assert not old.exists() and recent.exists() and new.exists()
@@ -0,0 +1,92 @@
+import datetime
+
+import pytest
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from core.fast_serializers import ValuesPlan
+from empleados.models import Empleado
+from empleados.serializers import EmpleadoSerializer
+
+
+def _render_both(params=None):
+    request = Request(
+        APIRequestFactory().get(
+            "/api/v1/empleados/", params or {}, HTTP_HOST="localhost"
+        )
+    )
+    ctx = {"request": request}
+    qs = Empleado.all_objects.select_related("departamento", "puesto").order_by("id")
+    drf = JSONRenderer().render(EmpleadoSerializer(qs, many=True, context=ctx).data)
+    plan = ValuesPlan.for_serializer(EmpleadoSerializer(context=ctx))
+    assert plan is not None
+    fast = JSONRenderer().render(plan.represent(qs.values(*plan.columns), request))
+    return drf, fast
+
+
+@pytest.fixture
+def variedad(catalogo, make_empleado):
+    dep, pst = catalogo
+    make_empleado(
+        departamento=dep,
+        puesto=pst,
+        genero="F",
+        estado_civil="U",
+        fecha_nacimiento=datetime.date(1990, 2, 28),
+        fecha_ingreso=datetime.date(2020, 1, 1),
+    )
+    make_empleado(departamento=dep, telefono="555", foto="empleados/fotos/a b.png")
+    make_empleado(puesto=pst, apellido_materno="Ñúñez", activo=False)
+    emp = make_empleado()
+    emp.delete()
+
+
+def test_paridad_byte_a_byte(variedad):
+    drf, fast = _render_both()
+    assert fast == drf
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"fields": "id,departamento_nombre,puesto_nombre"},
+        {"fields": "genero_display,estado_civil_display,foto_url"},
+        {"exclude": "foto,created_at"},
+    ],
+)
+def test_paridad_con_fieldsets(variedad, params):
+    drf, fast = _render_both(params)
+    assert fast == drf
+
+
+def test_paridad_en_utc(variedad):
+    with timezone.override(datetime.UTC):
+        drf, fast = _render_both()
+    assert fast == drf
+
+
+def test_list_rapido_igual_a_drf(api_admin, variedad, settings):
+    params = {"include_deleted": 1, "ordering": "-fecha_ingreso"}
+    fast = api_admin.get("/api/v1/empleados/", params)
+    settings.EMPLEADOS_FAST_LIST = False
+    slow = api_admin.get("/api/v1/empleados/", params)
+    assert fast.status_code == slow.status_code == 200
+    assert fast.content == slow.content
+
+
+def test_opcion_fuera_de_choices_como_django(variedad):
+    Empleado.all_objects.filter(pk=Empleado.all_objects.first().pk).update(genero="X")
+    drf, fast = _render_both({"fields": "id,genero_display"})
+    assert fast == drf
+
+
+def test_planes_acotados(variedad, monkeypatch):
+    from core import fast_serializers
+
+    monkeypatch.setattr(fast_serializers, "_PLANS", fast_serializers.OrderedDict())
+    monkeypatch.setattr(fast_serializers, "PLAN_CACHE_SIZE", 2)
+    for fields in ("id", "id,nombres", "id,email", "id,curp"):
+        _render_both({"fields": fields})
+    assert len(fast_serializers._PLANS) == 2
@@ -0,0 +1,80 @@
+import datetime
+
+from django.utils import timezone
+
+from catalogos.models import Departamento
+from empleados.models import Empleado
+
+
+def _backdate(model, obj, days_ago):
+    # Distribuye el historial en el tiempo (history_date es auto_now_add)
+    history = model.history.model
+    records = history.objects.filter(id=obj.pk).order_by("history_id")
+    base = timezone.now() - datetime.timedelta(days=days_ago)
+    for i, record in enumerate(records):
+        history.objects.filter(pk=record.pk).update(
+            history_date=base + datetime.timedelta(days=i)
+        )
+
+
+def test_historial_paginado_con_diffs(api_admin, make_empleado):
+    emp = make_empleado(nombres="Ana", telefono="")
+    for i, nombre in enumerate(["Ana María", "Ana Sofía", "Ana Lucía"]):
+        emp.nombres = nombre
+        emp.telefono = f"55{i}"
+        emp.save()
+    _backdate(Empleado, emp, 10)
+
+    url = f"/api/v1/empleados/{emp.pk}/history/"
+    page = api_admin.get(url, {"page_size": 2}).json()
+    assert [r["changes"]["nombres"] for r in page["results"]] == [
+        {"old": "Ana Sofía", "new": "Ana Lucía"},
+        {"old": "Ana María", "new": "Ana Sofía"},
+    ]
+    assert set(page["results"][0]["changes"]) == {"nombres", "telefono"}
+
+    rest = api_admin.get(page["next"]).json()
+    assert rest["next"] is None
+    assert [r["history_type"] for r in rest["results"]] == ["~", "+"]
+    created = rest["results"][1]["changes"]
+    assert created["nombres"] == {"old": None, "new": "Ana"}
+    assert "telefono" not in created and "updated_at" not in created
+
+
+def test_historial_since_until(api_admin, make_empleado):
+    emp = make_empleado(nombres="A")
+    for nombre in ("B", "C", "D"):
+        emp.nombres = nombre
+        emp.save()
+    _backdate(Empleado, emp, 10)
+    day = timezone.localdate(timezone.now() - datetime.timedelta(days=9))
+
+    resp = api_admin.get(
+        f"/api/v1/empleados/{emp.pk}/history/",
+        {
+            "since": day.isoformat(),
+            "until": (day + datetime.timedelta(days=1)).isoformat(),
+        },
+    )
+    results = resp.json()["results"]
+    # Días 9 y 8 atrás: B y C, con la base del diff fuera del rango
+    assert [r["changes"]["nombres"]["new"] for r in results] == ["C", "B"]
+    assert results[-1]["changes"]["nombres"]["old"] == "A"
+    assert (
+        api_admin.get(
+            f"/api/v1/empleados/{emp.pk}/history/", {"since": "ayer"}
+        ).status_code
+        == 400
+    )
+
+
+def test_historial_catalogos(api_admin, catalogo):
+    dep, pst = catalogo
+    dep.nombre = "TI"
+    dep.save()
+    results = api_admin.get(f"/api/v1/departamentos/{dep.pk}/history/").json()[
+        "results"
+    ]
+    assert results[0]["changes"] == {"nombre": {"old": "Sistemas", "new": "TI"}}
+    assert api_admin.get(f"/api/v1/puestos/{pst.pk}/history/").status_code == 200
+    assert Departamento.history.count() == 2
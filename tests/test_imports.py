@@ -0,0 +1,164 @@
+import datetime
+import io
+import json
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from openpyxl import Workbook
+
+from empleados.models import Empleado
+
+URL = "/api/v1/empleados/import/"
+HEADERS = [
+    "Num. empleado",
+    "Nombres",
+    "Apellido paterno",
+    "CURP",
+    "RFC",
+    "NSS",
+    "Email",
+    "Fecha ingreso",
+    "Activo",
+    "Extra",
+]
+
+
+def _xlsx(rows):
+    wb = Workbook()
+    ws = wb.active
+    ws.append(HEADERS)
+    for row in rows:
+        ws.append(row)
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def _row(n, **kw):
+    row = {
+        "num": f"I{n:04d}",
+        "nombres": "Importado",
+        "ap": "Nomina",
+        "curp": f"IMPO{n:06d}HDFLRN09",
+        "rfc": f"IMP{n:06d}XYZ",
+        "nss": 10000000000 + n,
+        "email": f"i{n}@example.com",
+        "ingreso": datetime.datetime(2024, 1, 15),
+        "activo": "Sí",
+        "extra": "x",
+    }
+    row.update(kw)
+    return list(row.values())
+
+
+def test_import_xlsx_dry_run_y_escritura(api_admin, make_empleado):
+    existing = make_empleado()
+    content = _xlsx(
+        [
+            _row(1),
+            _row(2, curp=existing.curp),
+            _row(3, rfc="MAL"),
+            _row(4, email="i1@example.com"),
+            [None] * len(HEADERS),
+            _row(5, nss=123, activo="No"),
+        ]
+    )
+
+    resp = api_admin.post(
+        URL,
+        {"archivo": SimpleUploadedFile("nomina.xlsx", content), "dry_run": "1"},
+        format="multipart",
+    )
+    assert resp.status_code == 200
+    report = resp.data
+    assert report["dry_run"] and report["rows"] == 5 and report["created"] == 0
+    assert report["valid"] == 2
+    assert {e["row"]: sorted(e["errors"]) for e in report["errors"]} == {
+        3: ["curp"],
+        4: ["rfc"],
+        5: ["email"],
+    }
+    assert report["ignored_columns"] == ["Extra"]
+    assert not Empleado.objects.filter(num_empleado__startswith="I").exists()
+
+    resp = api_admin.post(
+        URL, {"archivo": SimpleUploadedFile("nomina.xlsx", content)}, format="multipart"
+    )
+    assert resp.data["created"] == 2
+    emp = Empleado.objects.get(num_empleado="I0005")
+    assert emp.nss == "00000000123" and emp.activo is False
+    assert emp.fecha_ingreso == datetime.date(2024, 1, 15)
+    assert emp.history.count() == 1
+
+
+def test_import_csv_por_comando_con_bloques(tmp_path, superuser):
+    lines = ["num_empleado,nombres,apellido_paterno,curp,rfc,nss,email"]
+    for n in range(1, 8):
+        lines.append(
+            f"C{n:04d},Ana,Lopez,CSVX{n:06d}MDFLRN09,CSV{n:06d}AB1,{n:011d},c{n}@example.com"
+        )
+    lines.append(
+        "C0001,Dup,Lopez,CSVX000099MDFLRN09,CSV000099AB1,00000000099,dup@example.com"
+    )
+    path = tmp_path / "extracto.csv"
+    path.write_text("\n".join(lines), encoding="utf-8")
+    report_path = tmp_path / "reporte.json"
+
+    out = io.StringIO()
+    call_command(
+        "import_empleados",
+        str(path),
+        "--chunk-size",
+        "3",
+        "--user",
+        "root",
+        "--report",
+        str(report_path),
+        stdout=out,
+    )
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert report["created"] == 7 and report["error_count"] == 1
+    assert (
+        report["errors"][0]["row"] == 9
+        and "num_empleado" in report["errors"][0]["errors"]
+    )
+    assert (
+        Empleado.objects.get(num_empleado="C0003").history.first().history_user
+        == superuser
+    )
+    assert "8 filas" in out.getvalue()
+
+
+def test_import_csv_mal_formado_es_400_con_la_fila(api_admin):
+    content = 'num_empleado,nombres\nM0001,Ana\nM0002,"' + "x" * 200_000 + '"\n'
+    resp = api_admin.post(
+        URL,
+        {"archivo": SimpleUploadedFile("nomina.csv", content.encode()), "dry_run": "1"},
+        format="multipart",
+    )
+    assert resp.status_code == 400
+    assert resp.data["unreadable"] and resp.data["error_count"] == 1
+    assert (
+        resp.data["errors"][0]["row"] == 3
+        and "archivo" in resp.data["errors"][0]["errors"]
+    )
+
+
+def test_import_conflicto_de_unicos_al_escribir_es_400(api_admin, monkeypatch):
+    from django.db import IntegrityError
+
+    from empleados import bulk
+
+    def carrera(*args, **kwargs):
+        raise IntegrityError("UNIQUE constraint failed: empleados.curp")
+
+    monkeypatch.setattr(bulk, "create_empleados", carrera)
+    content = _xlsx([_row(1), _row(2)])
+    resp = api_admin.post(
+        URL, {"archivo": SimpleUploadedFile("nomina.xlsx", content)}, format="multipart"
+    )
+    assert resp.status_code == 400
+    assert resp.data["conflict_fields"] == ["curp"]
+    assert resp.data["created"] == 0 and resp.data["valid"] == 0
+    assert [e["row"] for e in resp.data["errors"]] == [2, 3]
+    assert "curp" in resp.data["errors"][0]["errors"]
@@ -0,0 +1,87 @@
+from django.contrib.auth.models import Group, User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.permissions import GROUP_ADMIN
+
+
+def _login(username="ana", password="secret123"):
+    resp = APIClient().post(
+        "/api/token/", {"username": username, "password": password}, format="json"
+    )
+    assert resp.status_code == 200, resp.data
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {resp.data['access']}")
+    return client
+
+
+def _auth_queries(ctx):
+    return [
+        q["sql"]
+        for q in ctx.captured_queries
+        if "auth_" in q["sql"] or "role_version" in q["sql"]
+    ]
+
+
+def test_lecturas_desde_claims(db, django_capture_on_commit_callbacks):
+    user = User.objects.create_user("ana", "ana@example.com", "secret123")
+    user.groups.add(Group.objects.create(name=GROUP_ADMIN))
+    client = _login()
+
+    client.get("/api/me/")  # calienta el cache de versión
+    with CaptureQueriesContext(connection) as ctx:
+        me = client.get("/api/me/")
+        listing = client.get("/api/v1/empleados/")
+    assert me.status_code == 200 and listing.status_code == 200
+    assert me.data["groups"] == [GROUP_ADMIN] and me.data["email"] == "ana@example.com"
+    assert _auth_queries(ctx) == []
+
+    # Escritura: carga el User real y conserva los permisos del token
+    resp = client.post(
+        "/api/v1/departamentos/", {"nombre": "Ventas", "clave": "VEN"}, format="json"
+    )
+    assert resp.status_code == 201
+
+
+def test_cambio_de_roles_invalida_el_token(db, django_capture_on_commit_callbacks):
+    user = User.objects.create_user("ana", "ana@example.com", "secret123")
+    client = _login()
+    assert client.get("/api/me/").status_code == 200
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.groups.add(Group.objects.create(name=GROUP_ADMIN))
+    resp = client.get("/api/me/")
+    assert resp.status_code == 401
+    assert _login().get("/api/me/").data["groups"] == [GROUP_ADMIN]
+
+    fresh = _login()
+    with django_capture_on_commit_callbacks(execute=True):
+        user.is_active = False
+        user.save()
+    assert fresh.get("/api/me/").status_code == 401
+
+
+def test_usuario_borrado_pierde_el_acceso(db, django_capture_on_commit_callbacks):
+    user = User.objects.create_user("ana", "ana@example.com", "secret123")
+    client = _login()
+    assert client.get("/api/me/").status_code == 200  # versión cacheada
+
+    with django_capture_on_commit_callbacks(execute=True):
+        user.delete()
+    assert client.get("/api/me/").status_code == 401
+
+
+def test_baja_en_otro_worker_vence_con_la_version(db, settings, advance_cache_clock):
+    settings.CACHE_LOCAL_VERSION_TTL = 5
+    user = User.objects.create_user("ana", "ana@example.com", "secret123")
+    client = _login()
+    assert client.get("/api/me/").status_code == 200
+
+    # Sin callbacks on_commit: este worker no borra su llave (la baja fue en otro)
+    user.is_active = False
+    user.save()
+    assert client.get("/api/me/").status_code == 200
+
+    advance_cache_clock(6)
+    assert client.get("/api/me/").status_code == 401
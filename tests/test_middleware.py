@@ -0,0 +1,37 @@
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from catalogos.models import Departamento
+
+
+def test_api_sin_middleware_de_sesion(client, db):
+    api = client.get("/api/ping/")
+    assert api.status_code == 200
+    assert "X-Frame-Options" not in api and not api.cookies
+
+    admin = client.get("/admin/login/")
+    assert admin.status_code == 200
+    assert admin["X-Frame-Options"] == "DENY" and "csrftoken" in admin.cookies
+
+
+def test_historial_conserva_al_usuario_jwt(db):
+    User.objects.create_superuser("root", "root@example.com", "secret123")
+    login = APIClient().post(
+        "/api/token/", {"username": "root", "password": "secret123"}, format="json"
+    )
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {login.data['access']}")
+
+    resp = client.post(
+        "/api/v1/departamentos/", {"nombre": "Ventas", "clave": "VEN"}, format="json"
+    )
+    assert resp.status_code == 201
+    record = Departamento.history.get(id=resp.data["id"])
+    assert record.history_user.username == "root"
+
+
+def test_bench_middleware(db, capsys):
+    call_command("bench_middleware", "-n", "5")
+    out = capsys.readouterr().out
+    assert "completa" in out and "recortada" in out and "Ahorro" in out
@@ -0,0 +1,70 @@
+import datetime
+
+import pytest
+
+from empleados.models import Empleado
+
+
+def _walk(client, url, params):
+    """Recorre todas las páginas keyset y devuelve los ids en orden."""
+    ids = []
+    resp = client.get(url, {**params, "paginate": "cursor"})
+    while True:
+        assert resp.status_code == 200, resp.content
+        body = resp.json()
+        assert "count" not in body
+        ids += [r["id"] for r in body["results"]]
+        if not body["next"]:
+            return ids
+        resp = client.get(body["next"])
+
+
+@pytest.fixture
+def plantilla(make_empleado):
+    # Valores repetidos y NULLs para ejercitar el desempate por id
+    for i in range(25):
+        make_empleado(
+            apellido_paterno=["Diaz", "Cruz", "Diaz", "Avila"][i % 4],
+            fecha_ingreso=None if i % 3 == 0 else datetime.date(2024, 1, 1 + i % 2),
+        )
+
+
+@pytest.mark.parametrize(
+    "ordering",
+    [
+        "num_empleado",
+        "-num_empleado",
+        "fecha_ingreso",
+        "-fecha_ingreso",
+        "apellido_paterno",
+        "-apellido_paterno",
+        "created_at",
+        "-created_at",
+    ],
+)
+def test_keyset_recorre_todo_sin_duplicados(api_admin, plantilla, ordering):
+    ids = _walk(api_admin, "/api/v1/empleados/", {"ordering": ordering})
+    assert len(ids) == len(set(ids)) == Empleado.objects.count()
+
+
+def test_keyset_respeta_orden_asc_nulls_last(api_admin, plantilla):
+    ids = _walk(api_admin, "/api/v1/empleados/", {"ordering": "fecha_ingreso"})
+    fechas = [Empleado.objects.get(pk=i).fecha_ingreso for i in ids]
+    no_nulos = [f for f in fechas if f is not None]
+    assert no_nulos == sorted(no_nulos)
+    assert fechas[len(no_nulos) :] == [None] * (len(fechas) - len(no_nulos))
+
+
+def test_page_number_sigue_por_defecto(api_admin, plantilla):
+    body = api_admin.get("/api/v1/empleados/").json()
+    assert body["count"] == 25
+    assert len(body["results"]) == 10
+
+
+def test_cursor_invalido(api_admin, plantilla):
+    assert api_admin.get("/api/v1/empleados/", {"cursor": "basura"}).status_code == 404
+
+
+def test_keyset_en_catalogos(api_admin, catalogo):
+    ids = _walk(api_admin, "/api/v1/departamentos/", {"ordering": "-nombre"})
+    assert len(ids) == 1
@@ -0,0 +1,105 @@
+import datetime
+import gzip
+import io
+import json
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from empleados.models import Empleado
+
+
+def _age_history(emp, days):
+    history = Empleado.history.model
+    for i, record in enumerate(
+        history.objects.filter(id=emp.pk).order_by("history_id")
+    ):
+        history.objects.filter(pk=record.pk).update(
+            history_date=timezone.now() - datetime.timedelta(days=days - i)
+        )
+
+
+def test_prune_history_compacta_y_archiva(tmp_path, make_empleado):
+    emp = make_empleado(nombres="v0")
+    for i in range(1, 5):
+        emp.nombres = f"v{i}"
+        emp.save()
+    _age_history(emp, 100)  # 5 registros: hace 100, 99, 98, 97 y 96 días
+    emp.nombres = "actual"
+    emp.save()  # registro reciente
+
+    out = io.StringIO()
+    call_command(
+        "prune_history",
+        "--days",
+        "30",
+        "--model",
+        "empleados.HistoricalEmpleado",
+        "--archive-dir",
+        str(tmp_path),
+        "--dry-run",
+        stdout=out,
+    )
+    assert "4 registros por borrar" in out.getvalue()
+    assert emp.history.count() == 6
+
+    call_command(
+        "prune_history",
+        "--days",
+        "30",
+        "--model",
+        "empleados.HistoricalEmpleado",
+        "--archive-dir",
+        str(tmp_path),
+        "--batch-size",
+        "2",
+        stdout=io.StringIO(),
+    )
+    # Queda la base (v4, último previo al corte) y el registro reciente
+    assert list(
+        emp.history.order_by("history_id").values_list("nombres", flat=True)
+    ) == ["v4", "actual"]
+
+    files = sorted(tmp_path.glob("*.ndjson.gz"))
+    assert len(files) == 2
+    archived = []
+    for path in files:
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            archived.extend(json.loads(line) for line in fh)
+    assert [r["nombres"] for r in archived] == ["v0", "v1", "v2", "v3"]
+    assert archived[0]["id"] == emp.pk and archived[0]["history_type"] == "+"
+
+    # Reanudar/repetir no borra más (la base se conserva)
+    call_command(
+        "prune_history",
+        "--days",
+        "30",
+        "--model",
+        "empleados.HistoricalEmpleado",
+        "--archive-dir",
+        str(tmp_path),
+        stdout=io.StringIO(),
+    )
+    assert emp.history.count() == 2
+
+
+def test_prune_history_base_por_fecha_no_por_id(make_empleado):
+    from core.retention import expired_queryset
+
+    emp = make_empleado(nombres="v0")
+    emp.nombres = "v1"
+    emp.save()
+    history = Empleado.history.model
+    first, second = history.objects.filter(id=emp.pk).order_by("history_id")
+    # Registro cargado después (id mayor) pero con fecha anterior: la base es v0
+    history.objects.filter(pk=first.pk).update(
+        history_date=timezone.now() - datetime.timedelta(days=50)
+    )
+    history.objects.filter(pk=second.pk).update(
+        history_date=timezone.now() - datetime.timedelta(days=60)
+    )
+
+    cutoff = timezone.now() - datetime.timedelta(days=30)
+    assert list(
+        expired_queryset(history, cutoff).values_list("nombres", flat=True)
+    ) == ["v1"]
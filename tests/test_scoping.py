@@ -0,0 +1,93 @@
+from django.contrib.auth.models import Group, User
+from rest_framework.test import APIClient
+
+from catalogos.models import Departamento, Puesto
+from core.permissions import (
+    GROUP_GERENTE,
+    GROUP_RRHH,
+    GROUP_SUPERVISOR,
+    SCOPE_ALL,
+    read_scope,
+)
+
+
+def _client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def _user(username, *groups):
+    user = User.objects.create_user(username, f"{username}@example.com", "secret123")
+    for name in groups:
+        user.groups.add(Group.objects.get_or_create(name=name)[0])
+    return user
+
+
+def _nums(resp):
+    assert resp.status_code == 200, resp.content
+    return sorted(row["num_empleado"] for row in resp.json()["results"])
+
+
+def _plantilla(make_empleado, catalogo):
+    sis, dev = catalogo
+    ven = Departamento.objects.create(nombre="Ventas", clave="VEN")
+    qa = Puesto.objects.create(nombre="QA", clave="QA", departamento=sis)
+    jefe = make_empleado(num_empleado="E-JEFE", departamento=sis, puesto=dev)
+    make_empleado(num_empleado="E-DEV", departamento=sis, puesto=dev)
+    make_empleado(num_empleado="E-QA", departamento=sis, puesto=qa)
+    otro = make_empleado(num_empleado="E-VEN", departamento=ven)
+    return jefe, otro
+
+
+def test_gerente_ve_su_departamento(make_empleado, catalogo):
+    jefe, otro = _plantilla(make_empleado, catalogo)
+    gerente = _user("gerente", GROUP_GERENTE)
+    jefe.usuario = gerente
+    jefe.save()
+    client = _client(gerente)
+
+    assert _nums(client.get("/api/v1/empleados/")) == ["E-DEV", "E-JEFE", "E-QA"]
+    assert client.get(f"/api/v1/empleados/{otro.pk}/").status_code == 404
+    assert client.get(f"/api/v1/empleados/{otro.pk}/history/").status_code == 404
+    assert client.get(f"/api/v1/empleados/{jefe.pk}/history/").status_code == 200
+
+    csv = b"".join(
+        client.get("/api/v1/empleados/export/csv/").streaming_content
+    ).decode()
+    assert "E-QA" in csv and "E-VEN" not in csv
+    assert client.get("/api/v1/empleados/stats/").json()["total"] == 3
+
+
+def test_supervisor_ve_su_puesto_y_gana_el_rol_mas_amplio(make_empleado, catalogo):
+    jefe, _ = _plantilla(make_empleado, catalogo)
+    supervisor = _user("super", GROUP_SUPERVISOR)
+    jefe.usuario = supervisor
+    jefe.save()
+    assert _nums(_client(supervisor).get("/api/v1/empleados/")) == ["E-DEV", "E-JEFE"]
+
+    # Sin empleado vinculado: ninguna fila
+    assert (
+        _nums(_client(_user("suelto", GROUP_GERENTE)).get("/api/v1/empleados/")) == []
+    )
+
+    # Gerente + RRHH: alcance completo; sin roles de la tabla, también
+    amplio = _user("amplio", GROUP_GERENTE, GROUP_RRHH)
+    assert read_scope(amplio) == SCOPE_ALL
+    assert len(_nums(_client(amplio).get("/api/v1/empleados/"))) == 4
+    assert len(_nums(_client(_user("lector")).get("/api/v1/empleados/"))) == 4
+
+
+def test_export_excel_cacheado_por_alcance(
+    settings, make_empleado, catalogo, api_admin
+):
+    settings.EXPORT_CACHE_MAX_BYTES = 10 * 1024 * 1024
+    jefe, _ = _plantilla(make_empleado, catalogo)
+    gerente = _user("gerente", GROUP_GERENTE)
+    jefe.usuario = gerente
+    jefe.save()
+
+    full = api_admin.get("/api/v1/empleados/export/excel/")
+    scoped = _client(gerente).get("/api/v1/empleados/export/excel/")
+    assert full.status_code == scoped.status_code == 200
+    assert full["ETag"] != scoped["ETag"]
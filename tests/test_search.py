@@ -0,0 +1,67 @@
+from empleados.models import Empleado
+from empleados.search import legacy_search, search_empleados
+
+
+def test_search_text_se_mantiene_en_save(catalogo, make_empleado):
+    dep, pst = catalogo
+    emp = make_empleado(nombres="María", departamento=dep, puesto=pst)
+    assert "maría" in emp.search_text
+    assert "sistemas" in emp.search_text
+
+    emp.apellido_paterno = "Zamora"
+    emp.save(update_fields=["apellido_paterno"])
+    emp.refresh_from_db()
+    assert "zamora" in emp.search_text
+
+
+def test_search_text_sigue_renombre_de_catalogo(catalogo, make_empleado):
+    dep, pst = catalogo
+    emp = make_empleado(departamento=dep, puesto=pst)
+    dep.nombre = "Tecnologia"
+    dep.save()
+    emp.refresh_from_db()
+    assert "tecnologia" in emp.search_text
+    assert "sistemas" not in emp.search_text
+
+
+def test_search_equivale_a_modo_legacy(catalogo, make_empleado):
+    dep, pst = catalogo
+    make_empleado(nombres="Ana", departamento=dep)
+    make_empleado(nombres="Luis", puesto=pst)
+    make_empleado(nombres="Pedro")
+
+    for term in ("ana", "DESARROLL", "sistemas", "example.com", "zzz"):
+        got = set(
+            search_empleados(Empleado.objects.all(), term).values_list("id", flat=True)
+        )
+        expected = set(
+            legacy_search(Empleado.objects.all(), term).values_list("id", flat=True)
+        )
+        assert got == expected, term
+
+
+def test_list_q_param(api_admin, catalogo, make_empleado):
+    dep, _ = catalogo
+    make_empleado(nombres="Ana", departamento=dep)
+    make_empleado(nombres="Pedro")
+    resp = api_admin.get("/api/v1/empleados/", {"q": "sistemas"})
+    assert resp.status_code == 200
+    assert [r["nombres"] for r in resp.json()["results"]] == ["Ana"]
+
+
+def test_rebuild_search_text_tras_update_masivo(catalogo, make_empleado):
+    from io import StringIO
+
+    from django.core.management import call_command
+
+    from catalogos.models import Departamento
+
+    sis, _ = catalogo
+    emp = make_empleado(departamento=sis)
+    Departamento.objects.filter(pk=sis.pk).update(nombre="Tecnologias")  # sin señales
+    assert "tecnologias" not in Empleado.objects.get(pk=emp.pk).search_text
+
+    out = StringIO()
+    call_command("rebuild_search_text", stdout=out)
+    assert "tecnologias" in Empleado.objects.get(pk=emp.pk).search_text
+    assert "actualizados: 1" in out.getvalue()
@@ -0,0 +1,44 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def test_fields_reduce_payload_y_sql(api_admin, catalogo, make_empleado):
+    dep, pst = catalogo
+    make_empleado(departamento=dep, puesto=pst)
+
+    with CaptureQueriesContext(connection) as ctx:
+        resp = api_admin.get(
+            "/api/v1/empleados/", {"fields": "id,num_empleado,nombres"}
+        )
+    assert resp.status_code == 200
+    row = resp.json()["results"][0]
+    assert set(row) == {"id", "num_empleado", "nombres"}
+
+    select = [q["sql"] for q in ctx.captured_queries if 'FROM "empleados"' in q["sql"]][
+        -1
+    ]
+    assert "cat_departamentos" not in select
+    assert '"curp"' not in select
+
+
+def test_fields_con_nombres_de_catalogo(api_admin, catalogo, make_empleado):
+    dep, pst = catalogo
+    make_empleado(departamento=dep, puesto=pst)
+    resp = api_admin.get(
+        "/api/v1/empleados/", {"fields": "id,departamento_nombre,genero_display"}
+    )
+    row = resp.json()["results"][0]
+    assert row == {
+        "id": row["id"],
+        "departamento_nombre": "Sistemas",
+        "genero_display": "Otro/No especifica",
+    }
+
+
+def test_exclude_y_campo_desconocido(api_admin, make_empleado):
+    emp = make_empleado()
+    row = api_admin.get(
+        f"/api/v1/empleados/{emp.pk}/", {"exclude": "foto,foto_url"}
+    ).json()
+    assert "foto_url" not in row and "curp" in row
+    assert api_admin.get("/api/v1/empleados/", {"fields": "nope"}).status_code == 400
@@ -0,0 +1,69 @@
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from empleados import bulk
+from empleados.models import Empleado, HeadcountStat
+
+
+def _stats(client):
+    return client.get("/api/v1/empleados/stats/").json()
+
+
+def test_headcount_incremental(api_admin, make_empleado, catalogo):
+    dep, pst = catalogo
+    a = make_empleado(genero="F", departamento=dep, puesto=pst)
+    b = make_empleado(genero="M", departamento=dep)
+    make_empleado(genero="F", activo=False)
+
+    data = _stats(api_admin)
+    assert data["total"] == 3
+    assert data["activo"] == {"true": 2, "false": 1}
+    assert {g["genero"]: g["total"] for g in data["genero"]} == {"F": 2, "M": 1}
+    assert data["departamento"][0] == {"id": dep.pk, "nombre": "Sistemas", "total": 2}
+
+    b.genero = "F"
+    b.save()
+    a.delete()  # soft delete
+    data = _stats(api_admin)
+    assert data["total"] == 2
+    assert {g["genero"]: g["total"] for g in data["genero"]} == {"F": 2}
+
+    a.restore()
+    Empleado.all_objects.filter(pk__in=[a.pk, b.pk]).soft_delete()
+    assert _stats(api_admin)["total"] == 1
+    Empleado.all_objects.filter(pk=b.pk).restore()
+    assert _stats(api_admin)["total"] == 2
+    call_command("rebuild_headcount", "--check")
+
+
+def test_headcount_bulk_y_rebuild(api_admin, make_empleado, catalogo):
+    dep, _ = catalogo
+    rows = [
+        {
+            "num_empleado": f"B{i}",
+            "nombres": "Bulk",
+            "apellido_paterno": "Perez",
+            "curp": f"BULK{i:06d}HDFLRN09",
+            "rfc": f"BUL{i:06d}XYZ",
+            "nss": f"{90000 + i:011d}",
+            "email": f"b{i}@example.com",
+            "genero": "M",
+        }
+        for i in range(3)
+    ]
+    created = bulk.create_empleados(rows, {"departamento_id": {}, "puesto_id": {}})
+    bulk.update_empleados(
+        created[:1],
+        [{"departamento_id": dep.pk}],
+        {"departamento_id": {dep.pk: dep}, "puesto_id": {}},
+    )
+    data = _stats(api_admin)
+    assert data["total"] == 3
+    assert {d["id"]: d["total"] for d in data["departamento"]} == {None: 2, dep.pk: 1}
+
+    HeadcountStat.objects.update(total=0)
+    with pytest.raises(CommandError):
+        call_command("rebuild_headcount", "--check")
+    call_command("rebuild_headcount")
+    assert _stats(api_admin)["total"] == 3
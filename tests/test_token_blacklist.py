@@ -0,0 +1,133 @@
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.tokens import UntypedToken
+
+from core import blacklist
+
+
+def _tokens():
+    User.objects.create_user("ana", "ana@example.com", "secret123")
+    resp = APIClient().post(
+        "/api/token/", {"username": "ana", "password": "secret123"}, format="json"
+    )
+    assert resp.status_code == 200, resp.data
+    return resp.data
+
+
+def _jti(token):
+    return UntypedToken(token)["jti"]
+
+
+def _refresh(token):
+    return APIClient().post("/api/token/refresh/", {"refresh": token}, format="json")
+
+
+def _blacklist_queries(ctx):
+    return [q["sql"] for q in ctx.captured_queries if "token_blacklist" in q["sql"]]
+
+
+def test_refresh_rotado_no_se_puede_reusar(db, django_capture_on_commit_callbacks):
+    old = _tokens()["refresh"]
+    with django_capture_on_commit_callbacks(execute=True):
+        first = _refresh(old)
+    assert first.status_code == 200 and first.data["refresh"] != old
+
+    # Desde memoria (tras sincronizar) o por la inserción única: siempre 401
+    assert _refresh(old).status_code == 401
+    blacklist.clear()
+    assert _refresh(old).status_code == 401
+    assert _refresh(first.data["refresh"]).status_code == 200
+
+    resp = APIClient().post("/api/token/verify/", {"token": old}, format="json")
+    assert resp.status_code in (400, 401)
+
+
+def test_reuso_dentro_de_la_ventana_lo_detiene_la_bd(
+    db, settings, django_capture_on_commit_callbacks
+):
+    settings.JWT_BLACKLIST_SYNC_SECONDS = 3600
+    old = _tokens()["refresh"]
+    assert _refresh(old).status_code == 200
+    # Sin callbacks on_commit la versión no cambió: la memoria dice "no está",
+    # pero la rotación no puede volver a insertarlo.
+    assert not blacklist.is_blacklisted(_jti(old))
+    assert _refresh(old).status_code == 401
+
+
+def test_consulta_negativa_sin_tocar_la_bd(db, django_capture_on_commit_callbacks):
+    refresh = _tokens()["refresh"]
+    jti = _jti(refresh)
+    assert not blacklist.is_blacklisted(jti)  # primera sincronización
+    with CaptureQueriesContext(connection) as ctx:
+        for _ in range(5):
+            assert not blacklist.is_blacklisted(jti)
+        resp = APIClient().post("/api/token/verify/", {"token": refresh}, format="json")
+    assert resp.status_code == 200
+    assert _blacklist_queries(ctx) == []
+
+
+def test_prune_tokens_borra_vencidos(db, settings, django_capture_on_commit_callbacks):
+    settings.JWT_BLACKLIST_SYNC_SECONDS = 0
+    old = _tokens()["refresh"]
+    with django_capture_on_commit_callbacks(execute=True):
+        new = _refresh(old).data["refresh"]
+    assert blacklist.is_blacklisted(_jti(old))
+    OutstandingToken.objects.filter(jti=_jti(old)).update(
+        expires_at=timezone.now() - timedelta(days=1)
+    )
+
+    call_command("prune_tokens", "--dry-run")
+    assert OutstandingToken.objects.count() == 2
+
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("prune_tokens", "--batch-size", "1")
+    assert list(OutstandingToken.objects.values_list("jti", flat=True)) == [_jti(new)]
+    assert not BlacklistedToken.objects.exists()
+    # La nueva generación obliga a recargar: el jti purgado sale de memoria
+    assert blacklist._seen is not None
+    assert not blacklist.is_blacklisted("inexistente")
+    assert blacklist._jtis == set()
+
+
+def test_logout_repetido_es_idempotente(db, settings):
+    settings.JWT_BLACKLIST_SYNC_SECONDS = 3600
+    refresh = _tokens()["refresh"]
+    url = "/api/token/blacklist/"
+    assert APIClient().post(url, {"refresh": refresh}, format="json").status_code == 200
+    # Memoria aún sin la alta (ventana de sincronización): ya estaba, no es error
+    assert APIClient().post(url, {"refresh": refresh}, format="json").status_code == 200
+    assert BlacklistedToken.objects.count() == 1
+
+
+def test_logout_en_otro_worker_llega_al_vencer_la_version(
+    db, settings, advance_cache_clock
+):
+    settings.CACHE_LOCAL_VERSION_TTL = 5
+    refresh = _tokens()["refresh"]
+    # Sin callbacks on_commit: la versión local no sube (el logout fue en otro worker)
+    assert (
+        APIClient()
+        .post("/api/token/blacklist/", {"refresh": refresh}, format="json")
+        .status_code
+        == 200
+    )
+    verify = "/api/token/verify/"
+    assert (
+        APIClient().post(verify, {"token": refresh}, format="json").status_code == 200
+    )
+
+    advance_cache_clock(6)
+    assert APIClient().post(verify, {"token": refresh}, format="json").status_code in (
+        400,
+        401,
+    )
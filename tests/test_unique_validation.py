@@ -0,0 +1,65 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from empleados import serializers as emp_serializers
+
+URL = "/api/v1/empleados/"
+
+
+def _payload(**kwargs):
+    data = {
+        "num_empleado": "U0001",
+        "nombres": "Unica",
+        "apellido_paterno": "Prueba",
+        "curp": "UNIQ000001HDFLRN09",
+        "rfc": "UNQ000001XYZ",
+        "nss": "55500000001",
+        "email": "unica@example.com",
+    }
+    data.update(kwargs)
+    return data
+
+
+def _unique_queries(ctx):
+    return [
+        q["sql"]
+        for q in ctx.captured_queries
+        if 'FROM "empleados"' in q["sql"] and "SELECT" in q["sql"]
+    ]
+
+
+def test_una_consulta_reporta_todos_los_conflictos(api_admin, make_empleado):
+    other = make_empleado()
+    with CaptureQueriesContext(connection) as ctx:
+        resp = api_admin.post(
+            URL, _payload(curp=other.curp, email=other.email), format="json"
+        )
+    assert resp.status_code == 400
+    assert set(resp.data) == {"curp", "email"}
+    assert len(_unique_queries(ctx)) == 1
+
+    with CaptureQueriesContext(connection) as ctx:
+        resp = api_admin.post(URL, _payload(), format="json")
+    assert resp.status_code == 201, resp.data
+    assert len(_unique_queries(ctx)) == 1
+
+
+def test_patch_sin_cambiar_unicos_no_consulta(api_admin, make_empleado):
+    emp = make_empleado()
+    with CaptureQueriesContext(connection) as ctx:
+        resp = api_admin.patch(
+            f"{URL}{emp.pk}/", {"nombres": "Otro", "curp": emp.curp}, format="json"
+        )
+    assert resp.status_code == 200
+    assert not [q for q in _unique_queries(ctx) if "curp" in q and " IN " in q]
+
+
+def test_integrity_error_por_carrera_es_400(api_admin, make_empleado, monkeypatch):
+    other = make_empleado()
+    # Simula que otra transacción insertó entre validate() y el INSERT
+    monkeypatch.setattr(
+        emp_serializers, "unique_conflicts", lambda rows: [{} for _ in rows]
+    )
+    resp = api_admin.post(URL, _payload(rfc=other.rfc), format="json")
+    assert resp.status_code == 400
+    assert list(resp.data) == ["rfc"]